@@ -1,15 +1,168 @@
-"""Toolkit for working with the Bible."""
-
-from ._get_verses import (
-    get_all_verse_ids,
-    get_highest_weighted_verse,
-    get_random_verse_id,
-    get_random_verse_ids,
-    load_verse_counts,
-)
-from ._parse_references import parse_references
-from ._utils import check_valid_verse_ids, read_file_as_string
-from ._verse_text_map import (
-    convert_reference_to_verse_text,
-    parse_xml_to_verse_text_map,
-)
+"""Toolkit for working with the Bible.
+
+Public names are imported from their submodules on first access, so that
+importing the package does not import dependencies that are not used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._async_utils import (
+        download_file_async,
+        iter_file_chunks_async,
+        read_file_as_string_async,
+        read_files_as_strings_async,
+    )
+    from ._corpus import iter_parse_references
+    from ._get_verses import (
+        get_all_verse_ids,
+        get_highest_weighted_verse,
+        get_highest_weighted_verses,
+        get_random_verse_id,
+        get_random_verse_ids,
+        get_top_verses,
+        load_verse_counts,
+    )
+    from ._parse_references import CachedReferenceParser, parse_references
+    from ._translation_corpus import TranslationCorpus
+    from ._utils import (
+        check_valid_verse_ids,
+        find_invalid_verse_ids,
+        open_file_as_binary,
+        read_file_as_string,
+    )
+    from ._verse_counter import VerseCounter, count_verses
+    from ._verse_counts import (
+        VerseCountStore,
+        get_verse_count_store,
+        write_verse_counts_binary,
+    )
+    from ._verse_index import (
+        get_book_offsets,
+        get_canonical_verse_ids,
+        get_chapter_offsets,
+        get_reference_ordinals,
+        get_verse_id_array,
+        get_verse_ordinals,
+    )
+    from ._verse_sampler import RandomVerseGenerator, VerseSampler
+    from ._verse_search import VerseSearchIndex, tokenize
+    from ._verse_text_map import (
+        convert_reference_to_verse_text,
+        convert_references_to_verse_texts,
+        iter_references_verse_texts,
+        iter_xml_verse_texts,
+        parse_xml_to_verse_text_map,
+    )
+    from ._verse_text_store import (
+        VerseTextStore,
+        load_verse_text_store,
+        write_verse_text_store,
+    )
+    from ._verse_weights import VerseWeights
+
+_SUBMODULES_BY_NAME = {
+    "download_file_async": "_async_utils",
+    "iter_file_chunks_async": "_async_utils",
+    "read_file_as_string_async": "_async_utils",
+    "read_files_as_strings_async": "_async_utils",
+    "iter_parse_references": "_corpus",
+    "get_all_verse_ids": "_get_verses",
+    "get_highest_weighted_verse": "_get_verses",
+    "get_highest_weighted_verses": "_get_verses",
+    "get_random_verse_id": "_get_verses",
+    "get_random_verse_ids": "_get_verses",
+    "get_top_verses": "_get_verses",
+    "load_verse_counts": "_get_verses",
+    "CachedReferenceParser": "_parse_references",
+    "parse_references": "_parse_references",
+    "TranslationCorpus": "_translation_corpus",
+    "check_valid_verse_ids": "_utils",
+    "find_invalid_verse_ids": "_utils",
+    "open_file_as_binary": "_utils",
+    "read_file_as_string": "_utils",
+    "VerseCounter": "_verse_counter",
+    "count_verses": "_verse_counter",
+    "VerseCountStore": "_verse_counts",
+    "get_verse_count_store": "_verse_counts",
+    "write_verse_counts_binary": "_verse_counts",
+    "get_book_offsets": "_verse_index",
+    "get_canonical_verse_ids": "_verse_index",
+    "get_chapter_offsets": "_verse_index",
+    "get_reference_ordinals": "_verse_index",
+    "get_verse_id_array": "_verse_index",
+    "get_verse_ordinals": "_verse_index",
+    "RandomVerseGenerator": "_verse_sampler",
+    "VerseSampler": "_verse_sampler",
+    "VerseSearchIndex": "_verse_search",
+    "tokenize": "_verse_search",
+    "convert_reference_to_verse_text": "_verse_text_map",
+    "convert_references_to_verse_texts": "_verse_text_map",
+    "iter_references_verse_texts": "_verse_text_map",
+    "iter_xml_verse_texts": "_verse_text_map",
+    "parse_xml_to_verse_text_map": "_verse_text_map",
+    "VerseTextStore": "_verse_text_store",
+    "load_verse_text_store": "_verse_text_store",
+    "write_verse_text_store": "_verse_text_store",
+    "VerseWeights": "_verse_weights",
+}
+
+__all__ = [
+    "CachedReferenceParser",
+    "RandomVerseGenerator",
+    "TranslationCorpus",
+    "VerseCountStore",
+    "VerseCounter",
+    "VerseSampler",
+    "VerseSearchIndex",
+    "VerseTextStore",
+    "VerseWeights",
+    "check_valid_verse_ids",
+    "convert_reference_to_verse_text",
+    "convert_references_to_verse_texts",
+    "count_verses",
+    "download_file_async",
+    "find_invalid_verse_ids",
+    "get_all_verse_ids",
+    "get_book_offsets",
+    "get_canonical_verse_ids",
+    "get_chapter_offsets",
+    "get_highest_weighted_verse",
+    "get_highest_weighted_verses",
+    "get_random_verse_id",
+    "get_random_verse_ids",
+    "get_reference_ordinals",
+    "get_top_verses",
+    "get_verse_count_store",
+    "get_verse_id_array",
+    "get_verse_ordinals",
+    "iter_file_chunks_async",
+    "iter_parse_references",
+    "iter_references_verse_texts",
+    "iter_xml_verse_texts",
+    "load_verse_counts",
+    "load_verse_text_store",
+    "open_file_as_binary",
+    "parse_references",
+    "parse_xml_to_verse_text_map",
+    "read_file_as_string",
+    "read_file_as_string_async",
+    "read_files_as_strings_async",
+    "tokenize",
+    "write_verse_counts_binary",
+    "write_verse_text_store",
+]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES_BY_NAME.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Cache for subsequent access
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
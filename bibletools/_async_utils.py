@@ -0,0 +1,215 @@
+"""Asynchronous reading of files, URLs and package resources."""
+
+import asyncio
+import os
+import pathlib
+import tempfile
+from collections.abc import AsyncIterator, Iterable
+from typing import IO
+
+from ._utils import open_file_as_binary
+
+# Number of bytes read at a time, so that reads can be interleaved
+_CHUNK_SIZE = 1 << 16
+
+
+def _close_opened_file(task: "asyncio.Future[IO[bytes]]") -> None:
+    """Close the file opened by a task, if it opened one."""
+    if not task.cancelled() and task.exception() is None:
+        task.result().close()
+
+
+async def _open_file_as_binary_async(
+    file_location: str, timeout: float | None
+) -> IO[bytes]:
+    """Open a file in a worker thread, waiting at most `timeout` seconds.
+
+    The worker thread cannot be interrupted, so if the wait times out or is
+    cancelled, the file is closed once the thread has opened it.
+    """
+    task = asyncio.ensure_future(
+        asyncio.to_thread(open_file_as_binary, file_location, timeout)
+    )
+    try:
+        async with asyncio.timeout(timeout):
+            # Shield the task, so that its result is not lost on timeout
+            return await asyncio.shield(task)
+    except BaseException:
+        task.add_done_callback(_close_opened_file)
+        raise
+
+
+async def iter_file_chunks_async(
+    file_location: str,
+    timeout: float | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Stream the content of a file without blocking the event loop.
+
+    The file is opened and read in chunks in worker threads, so that other
+    tasks keep running while waiting for a URL or a slow file system. The
+    chunks can be written to disk or fed to a parser incrementally, such as
+    :class:`xml.etree.ElementTree.XMLPullParser`.
+
+    Parameters
+    ----------
+    file_location
+        The location of the file to read, resolved in the same order as
+        :func:`bibletools.read_file_as_string`.
+    timeout
+        Maximum time in seconds to wait for opening the file and for each
+        chunk. If ``None``, there is no limit.
+    chunk_size
+        Maximum number of bytes in each chunk.
+
+    Yields
+    ------
+    bytes
+        Consecutive chunks of the file content.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file location cannot be resolved.
+    TimeoutError
+        If opening the file or reading a chunk takes longer than `timeout`.
+    """
+    f = await _open_file_as_binary_async(file_location, timeout)
+    try:
+        while True:
+            async with asyncio.timeout(timeout):
+                chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        f.close()
+
+
+async def read_file_as_string_async(
+    file_location: str, timeout: float | None = None
+) -> str:
+    """Read the content of a file as a string without blocking.
+
+    Parameters
+    ----------
+    file_location
+        The location of the file to read, resolved in the same order as
+        :func:`bibletools.read_file_as_string`.
+    timeout
+        Maximum time in seconds to read the whole file. If ``None``, there is
+        no limit.
+
+    Returns
+    -------
+    str
+        The content of the file as a string.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file location cannot be resolved.
+    TimeoutError
+        If reading the file takes longer than `timeout`.
+    """
+    async with asyncio.timeout(timeout):
+        chunks = [
+            chunk
+            async for chunk in iter_file_chunks_async(file_location, timeout)
+        ]
+    return b"".join(chunks).decode("utf-8")
+
+
+async def read_files_as_strings_async(
+    file_locations: Iterable[str], timeout: float | None = None
+) -> list[str]:
+    """Read the contents of files concurrently.
+
+    Parameters
+    ----------
+    file_locations
+        The locations of the files to read, each resolved as in
+        :func:`bibletools.read_file_as_string`.
+    timeout
+        Maximum time in seconds to read each file. If ``None``, there is no
+        limit.
+
+    Returns
+    -------
+    list[str]
+        The content of each file as a string, in the same order.
+
+    Raises
+    ------
+    FileNotFoundError
+        If any file location cannot be resolved.
+    TimeoutError
+        If reading any file takes longer than `timeout`.
+    """
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(
+                read_file_as_string_async(file_location, timeout)
+            )
+            for file_location in file_locations
+        ]
+    return [task.result() for task in tasks]
+
+
+async def download_file_async(
+    file_location: str,
+    file_path: str | os.PathLike[str],
+    timeout: float | None = None,
+) -> pathlib.Path:
+    """Stream the content of a file to disk without blocking.
+
+    The content is first written to a uniquely named temporary file next to
+    `file_path`, which replaces `file_path` once the download is complete,
+    so concurrent downloads to the same path do not corrupt it. Files are
+    only opened, written and closed in worker threads.
+
+    Parameters
+    ----------
+    file_location
+        The location of the file to read, resolved in the same order as
+        :func:`bibletools.read_file_as_string`.
+    file_path
+        Path of the file to write.
+    timeout
+        Maximum time in seconds to download the whole file. If ``None``,
+        there is no limit.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the written file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file location cannot be resolved.
+    TimeoutError
+        If downloading the file takes longer than `timeout`.
+    """
+    file_path = pathlib.Path(file_path)
+    fd, temp_name = await asyncio.to_thread(
+        tempfile.mkstemp,
+        prefix=f"{file_path.name}.",
+        suffix=".part",
+        dir=file_path.parent,
+    )
+    temp_path = pathlib.Path(temp_name)
+    try:
+        f = await asyncio.to_thread(os.fdopen, fd, "wb")
+        try:
+            async with asyncio.timeout(timeout):
+                async for chunk in iter_file_chunks_async(
+                    file_location, timeout
+                ):
+                    await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(temp_path.replace, file_path)
+    finally:
+        await asyncio.to_thread(temp_path.unlink, missing_ok=True)
+    return file_path
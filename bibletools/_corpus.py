@@ -0,0 +1,134 @@
+"""Bulk extraction of Bible references from corpora of documents."""
+
+import collections
+import concurrent.futures
+import itertools
+import os
+import pathlib
+from collections.abc import Hashable, Iterable, Iterator
+
+import pythonbible as pb
+
+from ._parse_references import parse_references
+
+DocumentT = str | os.PathLike[str]
+_ChunkT = list[tuple[Hashable, DocumentT]]
+_ResultT = list[tuple[Hashable, list[pb.NormalizedReference]]]
+
+
+def _read_document(document: DocumentT) -> str:
+    """Return the text of a document, reading it if it is a file path."""
+    if isinstance(document, str):
+        return document
+    return pathlib.Path(document).read_text(encoding="utf-8")
+
+
+def _parse_chunk(chunk: _ChunkT) -> _ResultT:
+    """Parse references from a chunk of documents in a worker process."""
+    return [
+        (doc_id, parse_references(_read_document(document)))
+        for doc_id, document in chunk
+    ]
+
+
+def _with_doc_id(
+    i: int, document: DocumentT | tuple[Hashable, DocumentT]
+) -> tuple[Hashable, DocumentT]:
+    """Pair a document with its ID, unless it is already paired."""
+    if isinstance(document, tuple):
+        return document
+    if isinstance(document, str):
+        return i, document
+    return pathlib.Path(document), document
+
+
+def _iter_chunks(
+    documents: Iterable[DocumentT | tuple[Hashable, DocumentT]],
+    chunksize: int,
+) -> Iterator[_ChunkT]:
+    """Lazily group documents with their IDs into chunks."""
+    items = itertools.starmap(_with_doc_id, enumerate(documents))
+    while chunk := list(itertools.islice(items, chunksize)):
+        yield chunk
+
+
+def iter_parse_references(
+    documents: Iterable[DocumentT | tuple[Hashable, DocumentT]],
+    n_workers: int | None = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+) -> Iterator[tuple[Hashable, list[pb.NormalizedReference]]]:
+    """Parse references from many documents in parallel.
+
+    Documents are consumed lazily in chunks, and only a bounded number of
+    chunks are submitted to the worker processes at a time, so that the
+    corpus is never held in memory at once.
+
+    Parameters
+    ----------
+    documents
+        Documents to parse, each either a text as a string or a file path as
+        a :class:`pathlib.Path`, or a ``(doc_id, document)`` pair. Files are
+        read as UTF-8 in the worker processes.
+    n_workers
+        Number of worker processes. If ``None``, the number of CPUs is used.
+        If 1, documents are parsed in the current process.
+    chunksize
+        Number of documents sent to a worker process at a time.
+    ordered
+        Whether to yield results in the order of the documents, or as soon
+        as they are parsed.
+
+    Yields
+    ------
+    tuple[Hashable, list[pythonbible.NormalizedReference]]
+        ID of each document and the references parsed from it, as with
+        :func:`bibletools.parse_references`. The ID is the given one for
+        pairs, the :class:`pathlib.Path` for file paths, and the position in
+        `documents` otherwise.
+
+    Raises
+    ------
+    ValueError
+        If `n_workers` or `chunksize` is not positive.
+    """
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("Number of workers must be positive.")
+    if chunksize < 1:
+        raise ValueError("Chunk size must be positive.")
+
+    chunks = _iter_chunks(documents, chunksize)
+    if n_workers == 1:
+        for chunk in chunks:
+            yield from _parse_chunk(chunk)
+        return
+
+    n_workers = n_workers or os.cpu_count() or 1
+    executor = concurrent.futures.ProcessPoolExecutor(n_workers)
+    try:
+        pending: collections.deque[concurrent.futures.Future[_ResultT]] = (
+            collections.deque(
+                executor.submit(_parse_chunk, chunk)
+                for chunk in itertools.islice(chunks, 2 * n_workers)
+            )
+        )
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done_set, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                done = [future for future in pending if future in done_set]
+                for future in done:
+                    pending.remove(future)
+
+            # Keep the workers busy while results are consumed
+            pending.extend(
+                executor.submit(_parse_chunk, chunk)
+                for chunk in itertools.islice(chunks, len(done))
+            )
+            for future in done:
+                yield from future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
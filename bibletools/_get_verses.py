@@ -1,69 +1,66 @@
 """Get verses from the Bible with various methods."""
 
-import importlib.resources
-import json
 import random
-from typing import Mapping
+from typing import Mapping, Sequence
 
-from pythonbible import (
-    Book,
-    NormalizedReference,
-    convert_reference_to_verse_ids,
-)
+import numpy as np
+from pythonbible import NormalizedReference
 
 from ._utils import check_valid_verse_ids
-
-VERSE_COUNTS_FILE = "verse-counts-by-author-and-id.json"
+from ._verse_counts import get_verse_count_store
+from ._verse_index import (
+    get_canonical_verse_ids,
+    get_verse_id_array,
+)
+from ._verse_sampler import (
+    VerseSampler,
+    _get_cached_sampler,
+    _get_reference_ranges,
+)
+from ._verse_weights import VerseWeights
 
 
 def get_all_verse_ids() -> list[int]:
-    """Return all verse IDs in the Bible."""
-    return list(
-        convert_reference_to_verse_ids(
-            NormalizedReference(
-                book=Book.GENESIS,
-                start_chapter=1,
-                start_verse=1,
-                end_chapter=22,
-                end_verse=21,
-                end_book=Book.REVELATION,
-            )
-        )
-    )
+    """Return all verse IDs in the Bible.
+
+    The canonical verse IDs are computed once per process; see
+    :func:`bibletools.get_canonical_verse_ids` for a shared immutable
+    sequence that avoids copying them into a new list.
+    """
+    return list(get_canonical_verse_ids())
 
 
 def load_verse_counts(
     author: str = "total",
-) -> dict[str, int]:
-    """Load verse counts from a JSON file.
+) -> Mapping[str, int]:
+    """Load verse counts for an author.
+
+    Verse counts for all authors are loaded once per process and shared; see
+    :func:`bibletools.get_verse_count_store` to invalidate or reload them.
 
     Parameters
     ----------
     author
-        Author name to retrieve counts for. If ``None``, load total counts.
+        Author name to retrieve counts for. Defaults to total counts.
 
     Returns
     -------
-    dict[str, int]
-        Dictionary mapping verse IDs to their counts. Note that the keys are
+    Mapping[str, int]
+        Read-only mapping of verse IDs to their counts. Note that the keys are
         strings rather than integers corresponding to verse IDs because JSON
         keys must be strings, and the data structure includes a "total" key.
     """
-    with (
-        importlib.resources.files("bibletools.data")
-        .joinpath(VERSE_COUNTS_FILE)
-        .open("r", encoding="utf-8") as f
-    ):
-        verse_counts_by_author = json.load(f)
+    return get_verse_count_store()[author]
 
-    return verse_counts_by_author[author]
 
-
-def get_random_verse_ids(
+def get_random_verse_ids(  # noqa: PLR0913 pylint: disable=too-many-arguments
     n_verses: int = 1,
-    verse_ids: list[int] | None = None,
-    verse_weights: Mapping[str, int | float] | None = None,
+    verse_ids: Sequence[int] | None = None,
+    verse_weights: Mapping[str, int | float] | VerseWeights | None = None,
     pad_weight: int | float = 1,
+    references: Sequence[NormalizedReference] | None = None,
+    *,
+    replace: bool = True,
 ) -> list[int]:
     """Return random verse IDs.
 
@@ -72,20 +69,63 @@ def get_random_verse_ids(
     verse_ids
         List of verse IDs to choose from.
     verse_weights
-        Dictionary mapping verse IDs to their weights.
+        Dictionary mapping verse IDs to their weights, or
+        :class:`bibletools.VerseWeights`.
     pad_weight
         Padding weight added to the weight of each verse. If a verse ID is not
         in `verse_weights`, it is given a weight of 0 plus the `pad_weight`.
     n_verses
         Number of verses to return.
+    references
+        References, for example from :func:`bibletools.parse_references`, to
+        choose from instead of `verse_ids`, such as a book or a range of
+        chapters.
+    replace
+        Whether a verse ID can be returned more than once. Without
+        replacement, verse IDs are drawn in a single vectorized pass, such as
+        for a deck of distinct verses, and the weights of duplicate verse IDs
+        are added.
 
     Returns
     -------
     list[int]
         List of random verse IDs.
+
+    Raises
+    ------
+    ValueError
+        If both `verse_ids` and `references` are given, if a verse ID or a
+        reference is invalid, or if there are fewer than `n_verses` verse IDs
+        with positive weights to draw without replacement.
+
+    Notes
+    -----
+    When choosing from all verse IDs or from references with
+    :class:`bibletools.VerseWeights` or without weights, a
+    :class:`bibletools.VerseSampler` is built once and reused by later calls
+    with the same weights, and references are sampled from its cumulative
+    weights without listing their verse IDs. For other repeated draws, build
+    a :class:`bibletools.VerseSampler` directly.
     """
+    if references is not None and verse_ids is not None:
+        raise ValueError("Only one of verse_ids and references can be given.")
+
+    if verse_ids is None and (
+        verse_weights is None or isinstance(verse_weights, VerseWeights)
+    ):
+        return _get_cached_sampler(verse_weights, pad_weight).sample(
+            n_verses, references=references, replace=replace
+        )
+
+    if references is not None or not replace:
+        return VerseSampler(
+            verse_ids=verse_ids,
+            verse_weights=verse_weights,
+            pad_weight=pad_weight,
+        ).sample(n_verses, references=references, replace=replace)
+
     if verse_ids is None:
-        verse_ids = get_all_verse_ids()
+        verse_ids = get_canonical_verse_ids()
 
     if verse_weights is None:
         verse_weights = {}
@@ -93,13 +133,23 @@ def get_random_verse_ids(
     if len(verse_ids) <= n_verses:
         check_valid_verse_ids(verse_ids)
 
-    random_verse_ids = random.choices(
-        verse_ids,
-        weights=[
-            verse_weights.get(str(vid), 0) + pad_weight for vid in verse_ids
-        ],
-        k=n_verses,
-    )
+    if isinstance(verse_weights, VerseWeights):
+        random_verse_ids = random.choices(
+            verse_ids,
+            cum_weights=np.cumsum(
+                verse_weights.take(verse_ids) + pad_weight
+            ).tolist(),
+            k=n_verses,
+        )
+    else:
+        random_verse_ids = random.choices(
+            verse_ids,
+            weights=[
+                verse_weights.get(str(vid), 0) + pad_weight
+                for vid in verse_ids
+            ],
+            k=n_verses,
+        )
 
     if n_verses < len(verse_ids):
         check_valid_verse_ids(random_verse_ids)
@@ -108,9 +158,10 @@ def get_random_verse_ids(
 
 
 def get_random_verse_id(
-    verse_ids: list[int] | None = None,
-    verse_weights: Mapping[str, int | float] | None = None,
+    verse_ids: Sequence[int] | None = None,
+    verse_weights: Mapping[str, int | float] | VerseWeights | None = None,
     pad_weight: int | float = 1,
+    references: Sequence[NormalizedReference] | None = None,
 ) -> int:
     """Return a single random verse ID.
 
@@ -119,10 +170,13 @@ def get_random_verse_id(
     verse_ids
         List of verse IDs to choose from.
     verse_weights
-        Dictionary mapping verse IDs to their weights.
+        Dictionary mapping verse IDs to their weights, or
+        :class:`bibletools.VerseWeights`.
     pad_weight
         Padding weight added to the weight of each verse. If a verse ID is not
         in `verse_weights`, it is given a weight of 0 plus the `pad_weight`.
+    references
+        References to choose from instead of `verse_ids`.
 
     Returns
     -------
@@ -134,21 +188,138 @@ def get_random_verse_id(
         verse_ids=verse_ids,
         verse_weights=verse_weights,
         pad_weight=pad_weight,
+        references=references,
     )[0]
 
 
-def get_highest_weighted_verse(
-    verse_ids: list[int] | None = None,
-    verse_weights: Mapping[str, int | float] | None = None,
-) -> int:
-    """Return the highest weighted verse ID."""
+def get_top_verses(
+    n_verses: int = 10,
+    author: str = "total",
+    references: Sequence[NormalizedReference] | None = None,
+) -> list[tuple[int, int]]:
+    """Return the most cited verses of an author with their counts.
+
+    Verse counts are ranked once per author, so that the top verses are read
+    from the head of the ranking rather than rescanning all verses.
+
+    Parameters
+    ----------
+    n_verses
+        Maximum number of verses to return.
+    author
+        Author name to rank verses for. Defaults to total counts.
+    references
+        References, for example from :func:`bibletools.parse_references`, to
+        restrict the verses to, such as a book or a range of chapters.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        List of verse IDs and their counts, sorted by count descending and
+        then by verse ID. Verses that are not cited are not included.
+    """
+    store = get_verse_count_store()
+    ranked = store.ranked_verses(author)
+
+    if references is not None:
+        # Find the ranks of the cited verses of each reference by a binary
+        # search of the verse IDs, then keep the best ranks
+        verse_id_array = get_verse_id_array()
+        verse_ids, ranks = store.rank_index(author)
+        starts, stops = _get_reference_ranges(references)
+        firsts = np.searchsorted(verse_ids, verse_id_array[starts])
+        lasts = np.searchsorted(
+            verse_ids, verse_id_array[stops - 1], side="right"
+        )
+        candidates = np.concatenate(
+            [np.zeros(0, dtype=np.int64)]
+            + [
+                ranks[first:last]
+                for first, last in zip(
+                    firsts.tolist(), lasts.tolist(), strict=True
+                )
+            ]
+        )
+        if 0 < n_verses < len(candidates):
+            candidates = np.partition(candidates, n_verses - 1)[:n_verses]
+        ranked = ranked[np.sort(candidates)]
+
+    return [(int(vid), int(count)) for vid, count in ranked[:n_verses]]
+
+
+def get_highest_weighted_verses(
+    n_verses: int = 10,
+    verse_ids: Sequence[int] | None = None,
+    verse_weights: Mapping[str, int | float] | VerseWeights | None = None,
+) -> list[int]:
+    """Return the highest weighted verse IDs.
+
+    Parameters
+    ----------
+    n_verses
+        Number of verse IDs to return.
+    verse_ids
+        List of verse IDs to choose from.
+    verse_weights
+        Dictionary mapping verse IDs to their weights, or
+        :class:`bibletools.VerseWeights`. If ``None``, total verse counts are
+        used.
+
+    Returns
+    -------
+    list[int]
+        List of verse IDs sorted by weight descending. Ties are broken by the
+        order of `verse_ids`.
+    """
+    if verse_ids is None and verse_weights is None:
+        top_verse_ids = [vid for vid, _ in get_top_verses(n_verses)]
+        if len(top_verse_ids) == n_verses:
+            return check_valid_verse_ids(top_verse_ids)
+
     if verse_ids is None:
-        verse_ids = get_all_verse_ids()
+        verse_ids = get_canonical_verse_ids()
 
     if verse_weights is None:
         verse_weights = load_verse_counts()
 
-    highest_weighted_verse = max(
-        verse_ids, key=lambda vid: verse_weights.get(str(vid), 0)
+    if isinstance(verse_weights, VerseWeights):
+        weights = verse_weights.take(verse_ids)
+    else:
+        weights = np.array(
+            [verse_weights.get(str(vid), 0) for vid in verse_ids],
+            dtype=np.float64,
+        )
+
+    n_verses = min(n_verses, len(weights))
+    if n_verses < 1:
+        return []
+
+    # Partition to find the weight of the n-th verse, then stable sort the
+    # candidates at or above it so that ties keep the order of verse_ids
+    threshold = np.partition(weights, len(weights) - n_verses)[
+        len(weights) - n_verses
+    ]
+    candidates = np.flatnonzero(weights >= threshold)
+    top = candidates[np.argsort(-weights[candidates], kind="stable")]
+    return check_valid_verse_ids(
+        [verse_ids[i] for i in top[:n_verses].tolist()]
+    )
+
+
+def get_highest_weighted_verse(
+    verse_ids: Sequence[int] | None = None,
+    verse_weights: Mapping[str, int | float] | VerseWeights | None = None,
+) -> int:
+    """Return the highest weighted verse ID.
+
+    Raises
+    ------
+    ValueError
+        If there are no verse IDs to choose from.
+    """
+    top_verse_ids = get_highest_weighted_verses(
+        n_verses=1, verse_ids=verse_ids, verse_weights=verse_weights
     )
-    return check_valid_verse_ids([highest_weighted_verse])[0]
+    if not top_verse_ids:
+        raise ValueError("No verse IDs to choose from.")
+    return top_verse_ids[0]
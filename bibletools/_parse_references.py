@@ -1,57 +1,61 @@
 """Parse Bible references."""
 
+import dataclasses
+import functools
 import re
 
 import pythonbible as pb
 
+_DASH_VARIANTS = (
+    "\u2013",  # en dash
+    "\u2014",  # em dash
+    "\u2012",  # figure dash
+    "\u2015",  # horizontal bar
+    "\u2212",  # minus sign
+    "\uFE58",  # small em dash
+    "\uFE63",  # small hyphen-minus
+    "\uFF0D",  # fullwidth hyphen-minus
+)
 
-def _normalize_noncontiguous_separators(text: str) -> str:
-    """Replace all non-contiguous verse separators with a standard comma.
+# Single-character replacements applied before parsing, which can be
+# extended with further normalizations. All of them are non-ASCII, so they
+# are skipped for ASCII texts after a single check.
+_CHARACTER_REPLACEMENTS = {
+    **dict.fromkeys(_DASH_VARIANTS, "-"),
+    "\u00A0": " ",  # no-break space
+    "\u202F": " ",  # narrow no-break space
+    "\u2007": " ",  # figure space
+    "\uFF0C": ",",  # fullwidth comma
+    "\uFF1A": ":",  # fullwidth colon
+    "\uFF1B": ";",  # fullwidth semicolon
+}
 
-    The correct format is, for example: Book 1:2-3, 5, 7-8, 2:1-2
+# Semicolons followed by whitespace + digit continue the same book
+_NONCONTIGUOUS_SEPARATOR_PATTERN = re.compile(r";(?=\s*\d)")
 
-    Semicolons should be replaced with commas within individual books, but
-    semicolons separating different books should be preserved.
-
-    Parameters
-    ----------
-    text
-        The input string possibly containing non-contiguous verse separators.
-
-    Returns
-    -------
-    str
-        The string with all non-contiguous verse separators replaced by ','.
-    """
-    # Replace semicolons followed by whitespace + digit (continue same book)
-    return re.sub(r";(?=\s*\d)", ",", text)
 
+def _normalize_reference_text(text: str) -> str:
+    """Normalize a text for parsing references.
 
-def _normalize_dashes(text: str) -> str:
-    """Replace all single-character dash variantswith a standard dash.
+    Dash variants, no-break spaces and fullwidth punctuation are only
+    replaced if the text is not ASCII, and non-contiguous verse separators
+    are only replaced with a precompiled pattern if the text has semicolons.
 
     Parameters
     ----------
     text
-        The input string possibly containing dash variants.
+        The input string possibly containing Bible references.
 
     Returns
     -------
     str
-        The string with all dash variants replaced by '-'.
+        The normalized string.
     """
-    dash_variants = [
-        "\u2013",  # en dash
-        "\u2014",  # em dash
-        "\u2012",  # figure dash
-        "\u2015",  # horizontal bar
-        "\u2212",  # minus sign
-        "\uFE58",  # small em dash
-        "\uFE63",  # small hyphen-minus
-        "\uFF0D",  # fullwidth hyphen-minus
-    ]
-    for variant in dash_variants:
-        text = text.replace(variant, "-")
+    if not text.isascii():
+        for old, new in _CHARACTER_REPLACEMENTS.items():
+            text = text.replace(old, new)
+    if ";" in text:
+        text = _NONCONTIGUOUS_SEPARATOR_PATTERN.sub(",", text)
     return text
 
 
@@ -63,6 +67,62 @@ def parse_references(text: str) -> list[pb.NormalizedReference]:
     text
         A sentence containing a compound Bible reference.
     """
-    text = _normalize_dashes(text=text)
-    text = _normalize_noncontiguous_separators(text=text)
-    return pb.get_references(text=text)
+    return pb.get_references(text=_normalize_reference_text(text))
+
+
+class CachedReferenceParser:
+    """Parser of Bible references that memoizes results by input text.
+
+    Repeated texts, such as common citations, are only normalized and parsed
+    once. Up to `maxsize` distinct texts are cached, discarding the least
+    recently used ones. References are mutable, so each call returns new
+    copies of the cached references that are safe to modify or share.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of texts to cache. If ``None``, the cache is
+        unbounded.
+    """
+
+    def __init__(self, maxsize: int | None = 1024) -> None:
+        self._parse = functools.lru_cache(maxsize=maxsize)(
+            self._parse_uncached
+        )
+
+    @staticmethod
+    def _parse_uncached(text: str) -> tuple[pb.NormalizedReference, ...]:
+        """Parse references to be cached, never returned to callers."""
+        return tuple(parse_references(text))
+
+    def __call__(self, text: str) -> tuple[pb.NormalizedReference, ...]:
+        """Parse all compound Bible references from a text.
+
+        Parameters
+        ----------
+        text
+            A sentence containing a compound Bible reference.
+
+        Returns
+        -------
+        tuple[pythonbible.NormalizedReference, ...]
+            Copies of the references, the same as
+            :func:`bibletools.parse_references`.
+        """
+        return tuple(
+            dataclasses.replace(reference) for reference in self._parse(text)
+        )
+
+    def cache_info(self) -> functools._CacheInfo:
+        """Return hits, misses, maximum size and current size of the cache.
+
+        Returns
+        -------
+        functools._CacheInfo
+            Cache statistics, as for :func:`functools.lru_cache`.
+        """
+        return self._parse.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._parse.cache_clear()
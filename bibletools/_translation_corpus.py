@@ -0,0 +1,253 @@
+"""Parallel texts of multiple translations of the Bible."""
+
+import concurrent.futures
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+import numpy as np
+from pythonbible import NormalizedReference
+
+from ._verse_index import (
+    _find_ordinals,
+    get_reference_ordinals,
+    get_verse_id_array,
+    get_verse_ordinals,
+)
+from ._verse_text_map import iter_xml_verse_texts
+
+
+def _align_verse_texts(verse_texts: Iterable[tuple[int, str]]) -> np.ndarray:
+    """Return verse texts in canonical order, with None for missing verses.
+
+    Verse IDs that are not in the canonical order are ignored.
+    """
+    items = list(verse_texts)
+    column = np.full(len(get_verse_id_array()), None, dtype=object)
+    if items:
+        ordinals, found = _find_ordinals([vid for vid, _ in items])
+        texts = np.empty(len(items), dtype=object)
+        texts[:] = [text for _, text in items]
+        column[ordinals[found]] = texts[found]
+    return column
+
+
+def _load_translation(
+    file_location: str, xml_spec: Mapping[str, Any]
+) -> np.ndarray:
+    """Parse a translation XML file into aligned verse texts."""
+    return _align_verse_texts(iter_xml_verse_texts(file_location, **xml_spec))
+
+
+class _TranslationView(Mapping[int, str]):
+    """Read-only verse text map of one translation in a corpus."""
+
+    def __init__(self, column: np.ndarray, present: np.ndarray) -> None:
+        self._column = column
+        self._present = present
+
+    def __getitem__(self, verse_id: int) -> str:
+        ordinal = get_verse_ordinals().get(verse_id)
+        if ordinal is None or not self._present[ordinal]:
+            raise KeyError(verse_id)
+        return self._column[ordinal]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(get_verse_id_array()[self._present].tolist())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._present))
+
+
+class TranslationCorpus:
+    """Texts of multiple translations aligned to the canonical verse order.
+
+    The texts are held column-wise in a single array with a row for each
+    verse ID in the canonical order, shared by all translations, so that
+    the texts of a reference in all translations are one slice of rows.
+
+    Parameters
+    ----------
+    texts
+        Array of shape ``(n_verses, n_translations)`` of verse texts in the
+        order of :func:`bibletools.get_all_verse_ids`, with ``None`` for
+        verses missing from a translation.
+    translations
+        Name of each translation, in the order of the columns.
+
+    Raises
+    ------
+    ValueError
+        If the shape of `texts` does not match the verses and translations,
+        or if the names of the translations are not unique.
+    """
+
+    def __init__(self, texts: np.ndarray, translations: Iterable[str]) -> None:
+        self._translations = tuple(translations)
+        if len(set(self._translations)) != len(self._translations):
+            raise ValueError("Translation names must be unique.")
+        expected_shape = (len(get_verse_id_array()), len(self._translations))
+        if texts.shape != expected_shape:
+            raise ValueError(
+                f"Expected texts of shape {expected_shape}, got array of "
+                f"shape {texts.shape}."
+            )
+        self._texts = np.array(texts, dtype=object)
+        self._texts.flags.writeable = False
+        present = np.fromiter(
+            (text is not None for text in self._texts.ravel().tolist()),
+            dtype=bool,
+            count=self._texts.size,
+        ).reshape(self._texts.shape)
+        self._views = {
+            translation: _TranslationView(self._texts[:, i], present[:, i])
+            for i, translation in enumerate(self._translations)
+        }
+
+    @classmethod
+    def from_verse_text_maps(
+        cls, verse_text_maps: Mapping[str, Mapping[int, str]]
+    ) -> "TranslationCorpus":
+        """Create a corpus from verse text maps of translations.
+
+        Parameters
+        ----------
+        verse_text_maps
+            Mapping of translation names to their verse text maps, such as
+            the output of :func:`bibletools.parse_xml_to_verse_text_map`.
+
+        Returns
+        -------
+        TranslationCorpus
+            Corpus of the translations.
+        """
+        columns = [
+            _align_verse_texts(verse_text_map.items())
+            for verse_text_map in verse_text_maps.values()
+        ]
+        return cls(_stack_columns(columns), verse_text_maps)
+
+    @classmethod
+    def from_files(
+        cls,
+        file_locations: Mapping[str, str],
+        xml_specs: Mapping[str, Mapping[str, Any]] | None = None,
+        n_workers: int | None = None,
+    ) -> "TranslationCorpus":
+        """Load translations from XML files in parallel.
+
+        Each translation is parsed in a worker process with
+        :func:`bibletools.iter_xml_verse_texts`.
+
+        Parameters
+        ----------
+        file_locations
+            Mapping of translation names to locations of their XML files,
+            each resolved as in :func:`bibletools.read_file_as_string`.
+        xml_specs
+            Mapping of translation names to keyword arguments of
+            :func:`bibletools.iter_xml_verse_texts` describing the structure
+            of their XML files. Translations not in the mapping use the
+            default structure.
+        n_workers
+            Number of worker processes. If ``None``, the number of CPUs is
+            used. If 1, translations are parsed in the current process.
+
+        Returns
+        -------
+        TranslationCorpus
+            Corpus of the translations.
+        """
+        xml_specs = xml_specs or {}
+        args = (
+            list(file_locations.values()),
+            [xml_specs.get(translation, {}) for translation in file_locations],
+        )
+        if n_workers == 1:
+            columns = list(map(_load_translation, *args))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(n_workers) as executor:
+                columns = list(executor.map(_load_translation, *args))
+        return cls(_stack_columns(columns), file_locations)
+
+    @property
+    def translations(self) -> tuple[str, ...]:
+        """Names of the translations, in the order of the columns."""
+        return self._translations
+
+    @property
+    def texts(self) -> np.ndarray:
+        """Read-only array of verse texts by verse and translation."""
+        return self._texts
+
+    def __len__(self) -> int:
+        return len(self._translations)
+
+    def __getitem__(self, translation: str) -> Mapping[int, str]:
+        """Return the verse text map of a translation.
+
+        The map is a read-only view of the corpus that can be used wherever
+        a verse text map is accepted.
+        """
+        return self._views[translation]
+
+    def get_verse_texts(self, verse_id: int) -> dict[str, str | None]:
+        """Return the texts of a verse in all translations.
+
+        Parameters
+        ----------
+        verse_id
+            Verse ID to retrieve texts for.
+
+        Returns
+        -------
+        dict[str, str | None]
+            Mapping of translation names to the text of the verse, or
+            ``None`` if the verse is missing from a translation.
+
+        Raises
+        ------
+        KeyError
+            If the verse ID is invalid.
+        """
+        row = self._texts[get_verse_ordinals()[verse_id]]
+        return dict(zip(self._translations, row.tolist(), strict=True))
+
+    def get_reference_texts(
+        self, reference: NormalizedReference, verse_separator: str = " "
+    ) -> dict[str, str]:
+        """Return the texts of a reference in all translations.
+
+        Parameters
+        ----------
+        reference
+            Reference to retrieve texts for.
+        verse_separator
+            Separator to use between verse texts.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping of translation names to the concatenated texts of the
+            verses, skipping verses missing from a translation.
+
+        Raises
+        ------
+        ValueError
+            If the reference includes verses that do not exist.
+        """
+        start, stop = get_reference_ordinals(reference)
+        rows = self._texts[start:stop]
+        return {
+            translation: verse_separator.join(
+                text for text in rows[:, i].tolist() if text is not None
+            )
+            for i, translation in enumerate(self._translations)
+        }
+
+
+def _stack_columns(columns: list[np.ndarray]) -> np.ndarray:
+    """Stack aligned verse texts of translations into columns."""
+    texts = np.empty((len(get_verse_id_array()), len(columns)), dtype=object)
+    for i, column in enumerate(columns):
+        texts[:, i] = column
+    return texts
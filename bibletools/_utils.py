@@ -1,31 +1,86 @@
 """Module with utility functions."""
 
+import functools
 import importlib.resources as pkg_resources
 import io
 import os
 import urllib.parse
 import urllib.request
+from typing import IO, Sequence, TypeVar
 
+import numpy as np
 from pythonbible import is_valid_verse_id
+from pythonbible.verses import VERSE_IDS
 
+VerseIdsT = TypeVar("VerseIdsT", bound=Sequence[int] | np.ndarray)
 
-def check_valid_verse_ids(verse_ids: list[int]) -> list[int]:
+
+@functools.cache
+def _get_valid_verse_id_array() -> np.ndarray:
+    """Return a sorted, read-only array of all valid verse IDs."""
+    valid_verse_ids = np.unique(np.asarray(VERSE_IDS, dtype=np.int64))
+    valid_verse_ids.flags.writeable = False
+    return valid_verse_ids
+
+
+def find_invalid_verse_ids(
+    verse_ids: Sequence[int] | np.ndarray,
+) -> np.ndarray:
+    """Find the positions of invalid verse IDs.
+
+    The verse IDs are checked as one batch against a sorted array of all
+    valid verse IDs, rather than one at a time.
+
+    Parameters
+    ----------
+    verse_ids
+        List or array of verse IDs to check.
+
+    Returns
+    -------
+    numpy.ndarray
+        Positions of the invalid verse IDs in `verse_ids`, in order.
+    """
+    array = np.asarray(verse_ids)
+    if array.dtype.kind not in "iu":
+        # Fall back to checking each value if they are not all integers
+        return np.array(
+            [
+                i
+                for i, vid in enumerate(verse_ids)
+                if not is_valid_verse_id(vid)
+            ],
+            dtype=np.intp,
+        )
+
+    valid_verse_ids = _get_valid_verse_id_array()
+    array = array.astype(np.int64, copy=False).ravel()
+    positions = np.searchsorted(valid_verse_ids, array)
+    positions = np.minimum(positions, len(valid_verse_ids) - 1)
+    return np.flatnonzero(valid_verse_ids[positions] != array)
+
+
+def check_valid_verse_ids(verse_ids: VerseIdsT) -> VerseIdsT:
     """Check that all verse IDs in the list are valid.
 
     Parameters
     ----------
     verse_ids
-        List of verse IDs to check.
+        List or array of verse IDs to check.
+
+    Returns
+    -------
+    list[int] | numpy.ndarray
+        The verse IDs, unchanged.
 
     Raises
     ------
     ValueError
         If any verse ID in the list is invalid.
     """
-    invalid_verse_ids = [
-        vid for vid in verse_ids if not is_valid_verse_id(vid)
-    ]
-    if invalid_verse_ids:
+    invalid_positions = find_invalid_verse_ids(verse_ids)
+    if invalid_positions.size:
+        invalid_verse_ids = [verse_ids[i] for i in invalid_positions.tolist()]
         raise ValueError(
             f"Invalid verse ID(s): {', '.join(map(str, invalid_verse_ids))}."
         )
@@ -70,3 +125,48 @@ def read_file_as_string(file_location: str) -> str:
             return f.read()
 
     raise FileNotFoundError(f"Unable to read file: {file_location}")
+
+
+def open_file_as_binary(
+    file_location: str, timeout: float | None = None
+) -> IO[bytes]:
+    """Open a file as a binary stream without reading it into memory.
+
+    Params
+    ------
+    file_location
+        The location of the file to open, resolved in the same order as
+        :func:`read_file_as_string`:
+
+        - A URL to a remote file (http or https).
+        - An absolute or relative file path on the local filesystem.
+        - A package resource located in `bibletools.data.translations`.
+    timeout
+        Timeout in seconds for connecting to and reading from a URL. If
+        ``None``, the global default timeout is used.
+
+    Returns
+    -------
+    IO[bytes]
+        Binary stream of the file content, to be closed by the caller.
+    """
+    if urllib.parse.urlparse(file_location).scheme in ("http", "https"):
+        if timeout is None:
+            return urllib.request.urlopen(file_location)
+        return urllib.request.urlopen(file_location, timeout=timeout)
+
+    if os.path.isfile(file_location):
+        return io.open(file_location, "rb")
+
+    if (
+        pkg_resources.files("bibletools.data")
+        .joinpath(file_location)
+        .is_file()
+    ):
+        return (
+            pkg_resources.files("bibletools.data")
+            .joinpath(file_location)
+            .open("rb")
+        )
+
+    raise FileNotFoundError(f"Unable to read file: {file_location}")
@@ -0,0 +1,292 @@
+"""Incremental counting of verse references by author."""
+
+import array
+import itertools
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+
+import numpy as np
+from pythonbible import NormalizedReference, convert_reference_to_verse_ids
+
+from ._corpus import iter_parse_references
+from ._verse_counts import write_verse_counts_binary
+from ._verse_index import (
+    _find_ordinals,
+    get_reference_ordinals,
+    get_verse_id_array,
+)
+
+# Number of buffered references of an author before they are compacted
+_MAX_BUFFERED_REFERENCES = 1 << 16
+
+
+class VerseCounter:
+    """Accumulator of verse counts by author.
+
+    References are buffered per author as ranges of ordinals and
+    periodically compacted into sorted arrays of the ordinals and counts of
+    the verses referenced, so that memory use is bounded by the number of
+    distinct verses of each author rather than the size of the corpus.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._buffers: dict[str, tuple[array.array, array.array]] = {}
+        self.n_records = 0
+
+    @property
+    def authors(self) -> list[str]:
+        """Authors with counted references, in order of first appearance."""
+        return list(
+            dict.fromkeys(itertools.chain(self._counts, self._buffers))
+        )
+
+    def add_references(
+        self, author: str, references: Iterable[NormalizedReference]
+    ) -> None:
+        """Count each verse of the references for an author.
+
+        Parameters
+        ----------
+        author
+            Author of the references.
+        references
+            References to count, such as the output of
+            :func:`bibletools.parse_references`.
+
+        Raises
+        ------
+        ValueError
+            If the author is ``"total"``, which is reserved for the total
+            counts of all authors.
+        """
+        if author == "total":
+            raise ValueError("Author 'total' is reserved for total counts.")
+        starts, stops = self._buffers.setdefault(
+            author, (array.array("H"), array.array("H"))
+        )
+        for reference in references:
+            try:
+                start, stop = get_reference_ordinals(reference)
+            except ValueError:
+                # Count the existing verses of an invalid reference
+                ordinals, found = _find_ordinals(
+                    convert_reference_to_verse_ids(reference)
+                )
+                starts.extend(ordinals[found].tolist())
+                stops.extend((ordinals[found] + 1).tolist())
+            else:
+                starts.append(start)
+                stops.append(stop)
+
+        if len(starts) >= _MAX_BUFFERED_REFERENCES:
+            self._compact(author)
+
+    def _compact(self, author: str) -> None:
+        """Merge the buffered references of an author into the counts."""
+        starts, stops = self._buffers.pop(author, ((), ()))
+        counts = np.zeros(len(get_verse_id_array()) + 1, dtype=np.int64)
+        np.add.at(counts, np.asarray(starts, dtype=np.intp), 1)
+        np.add.at(counts, np.asarray(stops, dtype=np.intp), -1)
+        counts = np.cumsum(counts[:-1])
+
+        if author in self._counts:
+            ordinals, previous_counts = self._counts[author]
+            counts[ordinals] += previous_counts
+        ordinals = np.flatnonzero(counts)
+        self._counts[author] = (ordinals.astype(np.uint16), counts[ordinals])
+
+    def get_counts(self, author: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return the verse IDs referenced by an author and their counts.
+
+        Parameters
+        ----------
+        author
+            Author name, or ``"total"`` for the total counts of all authors.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Verse IDs in canonical order and their counts.
+        """
+        if author == "total":
+            counts = np.zeros(len(get_verse_id_array()), dtype=np.int64)
+            for name in self.authors:
+                ordinals, author_counts = self.get_counts_by_ordinal(name)
+                counts[ordinals] += author_counts
+            ordinals = np.flatnonzero(counts)
+            return get_verse_id_array()[ordinals], counts[ordinals]
+
+        ordinals, counts = self.get_counts_by_ordinal(author)
+        return get_verse_id_array()[ordinals], counts
+
+    def get_counts_by_ordinal(
+        self, author: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ordinals of the verses of an author and their counts."""
+        if author in self._buffers:
+            self._compact(author)
+        return self._counts[author]
+
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        """Return the verse counts in the structure of the data files.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Verse counts with the same structure as
+            ``verse-counts-by-author-and-id.json``, with authors sorted by
+            total count descending and verse IDs by count descending.
+        """
+        verse_counts_by_author = {}
+        for author in ["total", *self.authors]:
+            verse_ids, counts = self.get_counts(author)
+            order = np.lexsort((verse_ids, -counts))
+            verse_counts_by_author[author] = {
+                "total": int(counts.sum()),
+                **{
+                    str(verse_id): count
+                    for verse_id, count in zip(
+                        verse_ids[order].tolist(),
+                        counts[order].tolist(),
+                        strict=True,
+                    )
+                },
+            }
+        return dict(
+            sorted(
+                verse_counts_by_author.items(),
+                key=lambda item: item[1]["total"],
+                reverse=True,
+            )
+        )
+
+    def write(self, file_path: str | os.PathLike[str]) -> None:
+        """Write the verse counts to a data file.
+
+        Parameters
+        ----------
+        file_path
+            Path of the file to write, in the binary format if it ends with
+            ``.bin`` and as JSON otherwise.
+        """
+        verse_counts_by_author = self.to_dict()
+        if os.fspath(file_path).endswith(".bin"):
+            write_verse_counts_binary(verse_counts_by_author, file_path)
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    verse_counts_by_author, f, ensure_ascii=False, indent=2
+                )
+
+    def save_checkpoint(self, file_path: str | os.PathLike[str]) -> None:
+        """Save the state of the counter, replacing the file atomically.
+
+        Parameters
+        ----------
+        file_path
+            Path of the checkpoint file to write, in NumPy ``.npz`` format.
+        """
+        authors = self.authors
+        arrays = [self.get_counts_by_ordinal(author) for author in authors]
+        directory = os.path.dirname(os.path.abspath(file_path))
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+            np.savez(
+                f,
+                authors=np.asarray(authors, dtype=str),
+                offsets=np.cumsum([0] + [len(o) for o, _ in arrays]),
+                ordinals=np.concatenate(
+                    [np.empty(0, dtype=np.uint16)] + [o for o, _ in arrays]
+                ),
+                counts=np.concatenate(
+                    [np.empty(0, dtype=np.int64)] + [c for _, c in arrays]
+                ),
+                n_records=self.n_records,
+            )
+        os.replace(f.name, file_path)
+
+    @classmethod
+    def load_checkpoint(
+        cls, file_path: str | os.PathLike[str]
+    ) -> "VerseCounter":
+        """Load a counter saved with :meth:`save_checkpoint`.
+
+        Parameters
+        ----------
+        file_path
+            Path of the checkpoint file.
+
+        Returns
+        -------
+        VerseCounter
+            Counter with the saved counts and number of records.
+        """
+        counter = cls()
+        with np.load(file_path) as data:
+            arrays: dict[str, np.ndarray] = dict(data)
+        for author, (start, stop) in zip(
+            arrays["authors"].tolist(),
+            itertools.pairwise(arrays["offsets"].tolist()),
+            strict=True,
+        ):
+            counter._counts[author] = (
+                arrays["ordinals"][start:stop],
+                arrays["counts"][start:stop],
+            )
+        counter.n_records = int(arrays["n_records"])
+        return counter
+
+
+def count_verses(
+    records: Iterable[tuple[str, str]],
+    n_workers: int | None = 1,
+    checkpoint_path: str | os.PathLike[str] | None = None,
+    checkpoint_every: int = 10_000,
+) -> VerseCounter:
+    """Count the verses referenced by authors in a corpus of texts.
+
+    Records are consumed lazily, so the corpus can be larger than memory.
+
+    Parameters
+    ----------
+    records
+        ``(author, text)`` pairs, where each text is a string or a file path
+        as a :class:`pathlib.Path`.
+    n_workers
+        Number of worker processes to parse references with, as in
+        :func:`bibletools.iter_parse_references`.
+    checkpoint_path
+        Path of a checkpoint file saved every `checkpoint_every` records and
+        at the end. If it exists, counting resumes from it, skipping the
+        records that were already counted.
+    checkpoint_every
+        Number of records between checkpoints.
+
+    Returns
+    -------
+    VerseCounter
+        Verse counts by author, which can be written with
+        :meth:`VerseCounter.write`.
+    """
+    if checkpoint_path is not None and os.path.isfile(checkpoint_path):
+        counter = VerseCounter.load_checkpoint(checkpoint_path)
+        records = itertools.islice(records, counter.n_records, None)
+    else:
+        counter = VerseCounter()
+
+    for author, references in iter_parse_references(
+        records, n_workers=n_workers
+    ):
+        counter.add_references(str(author), references)
+        counter.n_records += 1
+        if (
+            checkpoint_path is not None
+            and counter.n_records % checkpoint_every == 0
+        ):
+            counter.save_checkpoint(checkpoint_path)
+
+    if checkpoint_path is not None:
+        counter.save_checkpoint(checkpoint_path)
+    return counter
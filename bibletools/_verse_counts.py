@@ -0,0 +1,767 @@
+"""Cached, read-only access to verse counts by author."""
+
+import contextlib
+import importlib.resources
+import itertools
+import json
+import mmap
+import os
+import pathlib
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import IO
+
+import numpy as np
+
+from ._utils import check_valid_verse_ids
+
+if sys.platform == "win32":
+    import msvcrt  # pylint: disable=import-error
+else:
+    import fcntl
+
+VERSE_COUNTS_FILE = "verse-counts-by-author-and-id.json"
+VERSE_COUNTS_BINARY_FILE = "verse-counts-by-author-and-id.bin"
+
+# Binary layout, all little-endian:
+#   header: magic, version, n_authors, names_nbytes, n_entries,
+#       last_sequence (version 2 only), the sequence number of the last
+#       logged update included in the file
+#   entry_offsets: uint64[n_authors + 1], index of each author's first pair
+#   totals: uint64[n_authors], the "total" count of each author
+#   name_offsets: uint32[n_authors + 1], byte offset of each author's name
+#   pairs: uint32[n_entries, 2], (verse_id, count) sorted by count descending
+#   names: UTF-8 encoded author names
+_BINARY_MAGIC = b"BTVC"
+_BINARY_VERSION = 2
+_BINARY_HEADERS = {
+    1: struct.Struct("<4sIIIQ"),
+    2: struct.Struct("<4sIIIQQ"),
+}
+_BINARY_MAGIC_AND_VERSION = struct.Struct("<4sI")
+
+# Updates of a binary file are appended to a log next to it as JSON lines
+# of a sequence number and a delta, and are serialized across processes by
+# locking a file next to it
+_UPDATE_LOG_SUFFIX = ".log"
+_LOCK_SUFFIX = ".lock"
+
+VerseCountDeltaT = Mapping[str, Mapping[str | int, int]]
+
+
+def _open_data_file(file_location: str | os.PathLike[str]) -> IO[bytes]:
+    """Open a local file or a package resource in ``bibletools.data``."""
+    if os.path.isfile(file_location):
+        return open(file_location, "rb")
+    return (
+        importlib.resources.files("bibletools.data")
+        .joinpath(os.fspath(file_location))
+        .open("rb")
+    )
+
+
+def _is_data_file(file_location: str | os.PathLike[str]) -> bool:
+    """Return whether a local file or package resource exists."""
+    return (
+        os.path.isfile(file_location)
+        or importlib.resources.files("bibletools.data")
+        .joinpath(os.fspath(file_location))
+        .is_file()
+    )
+
+
+def _get_data_file_path(
+    file_location: str | os.PathLike[str],
+) -> pathlib.Path:
+    """Return the path of a local file or a package resource to write."""
+    if os.path.isfile(file_location):
+        return pathlib.Path(file_location)
+    resource = importlib.resources.files("bibletools.data").joinpath(
+        os.fspath(file_location)
+    )
+    if not isinstance(resource, pathlib.Path) or not resource.is_file():
+        raise FileNotFoundError(f"Unable to update file: {file_location}")
+    return resource
+
+
+def _unpack_binary_header(
+    buffer: bytes | mmap.mmap,
+) -> tuple[int, int, int, int, int]:
+    """Return the fields of the header of binary verse counts.
+
+    Returns
+    -------
+    tuple
+        Number of authors, size of the names, number of entries, sequence
+        number of the last included update, which is 0 for version 1, and
+        size of the header.
+
+    Raises
+    ------
+    ValueError
+        If the buffer does not start with a known header.
+    """
+    magic, version = _BINARY_MAGIC_AND_VERSION.unpack_from(buffer)
+    if magic != _BINARY_MAGIC or version not in _BINARY_HEADERS:
+        raise ValueError("Invalid binary verse counts file.")
+    header = _BINARY_HEADERS[version]
+    n_authors, names_nbytes, n_entries, *rest = header.unpack_from(buffer)[2:]
+    last_sequence = rest[0] if rest else 0
+    return n_authors, names_nbytes, n_entries, last_sequence, header.size
+
+
+@contextlib.contextmanager
+def _lock_data_file(file_path: pathlib.Path) -> Iterator[None]:
+    """Hold an exclusive lock on a data file, shared by all processes."""
+    lock_path = file_path.with_name(file_path.name + _LOCK_SUFFIX)
+    with open(lock_path, "ab") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_last_sequence(file_path: pathlib.Path) -> int:
+    """Return the sequence number of the last update of a binary file.
+
+    This is the number of the last update in its log, or else the last one
+    already included in the file.
+    """
+    log_path = file_path.with_name(file_path.name + _UPDATE_LOG_SUFFIX)
+    if log_path.is_file():
+        with log_path.open("rb") as f:
+            # Read the log backwards until its last complete line
+            position = f.seek(0, os.SEEK_END)
+            tail = b""
+            while position and b"\n" not in tail.rstrip(b"\n"):
+                size = min(position, 1 << 16)
+                position -= size
+                f.seek(position)
+                tail = f.read(size) + tail
+            lines = tail.rstrip(b"\n").rsplit(b"\n", 1)
+            if lines[-1]:
+                return int(json.loads(lines[-1])[0])
+
+    with file_path.open("rb") as f:
+        return _unpack_binary_header(f.read(_BINARY_HEADERS[2].size))[3]
+
+
+class _BinaryVerseCounts(Mapping[str, Mapping[str, int]]):
+    """Verse counts by author read lazily from the binary format.
+
+    Only the author index is decoded up front. The verse counts of an author
+    are read from the buffer on first access and then cached.
+
+    Parameters
+    ----------
+    buffer
+        Buffer containing the binary verse counts, typically memory-mapped.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        n_authors, names_nbytes, n_entries, self.last_sequence, offset = (
+            _unpack_binary_header(buffer)
+        )
+
+        self._buffer = buffer  # Keep the memory map open
+        self._entry_offsets = np.frombuffer(
+            buffer, dtype="<u8", count=n_authors + 1, offset=offset
+        )
+        offset += self._entry_offsets.nbytes
+        self._totals = np.frombuffer(
+            buffer, dtype="<u8", count=n_authors, offset=offset
+        )
+        offset += self._totals.nbytes
+        name_offsets = np.frombuffer(
+            buffer, dtype="<u4", count=n_authors + 1, offset=offset
+        )
+        offset += name_offsets.nbytes
+        self._pairs = np.frombuffer(
+            buffer, dtype="<u4", count=2 * n_entries, offset=offset
+        ).reshape(n_entries, 2)
+        offset += self._pairs.nbytes
+
+        names = bytes(buffer[offset:])
+        if len(names) != names_nbytes:
+            raise ValueError("Invalid binary verse counts file.")
+        self._author_index = {
+            names[start:end].decode("utf-8"): i
+            for i, (start, end) in enumerate(
+                itertools.pairwise(name_offsets.tolist())
+            )
+        }
+        self._views: dict[str, Mapping[str, int]] = {}
+
+    def pairs(self, author: str) -> np.ndarray:
+        """Return the (verse_id, count) pairs of an author.
+
+        Parameters
+        ----------
+        author
+            Author name.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only array of shape ``(n, 2)`` sorted by count descending.
+        """
+        i = self._author_index[author]
+        start, end = self._entry_offsets[i], self._entry_offsets[i + 1]
+        return self._pairs[start:end]
+
+    def get_total(self, author: str) -> int:
+        """Return the total count of an author without reading its pairs."""
+        return int(self._totals[self._author_index[author]])
+
+    def __getitem__(self, author: str) -> Mapping[str, int]:
+        view = self._views.get(author)
+        if view is None:
+            i = self._author_index[author]
+            counts = {"total": int(self._totals[i])}
+            counts.update(
+                (str(verse_id), count)
+                for verse_id, count in self.pairs(author).tolist()
+            )
+            view = self._views[author] = MappingProxyType(counts)
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._author_index)
+
+    def __len__(self) -> int:
+        return len(self._author_index)
+
+    def __contains__(self, author: object) -> bool:
+        return author in self._author_index
+
+
+def write_verse_counts_binary(
+    verse_counts_by_author: Mapping[str, Mapping[str, int]],
+    file_path: str | os.PathLike[str],
+    last_sequence: int = 0,
+) -> None:
+    """Write verse counts by author in the compact binary format.
+
+    Parameters
+    ----------
+    verse_counts_by_author
+        Verse counts with the same structure as
+        ``verse-counts-by-author-and-id.json``. Authors and verse IDs are
+        written in the given order, which should be by count descending.
+    file_path
+        Path of the binary file to write.
+    last_sequence
+        Sequence number of the last logged update included in the verse
+        counts, so that it is not applied again when the file is loaded.
+    """
+    names: list[bytes] = []
+    totals: list[int] = []
+    entry_offsets = [0]
+    pairs: list[tuple[int, int]] = []
+    for author, counts in verse_counts_by_author.items():
+        names.append(author.encode("utf-8"))
+        totals.append(counts["total"])
+        pairs.extend(
+            (int(verse_id), count)
+            for verse_id, count in counts.items()
+            if verse_id != "total"
+        )
+        entry_offsets.append(len(pairs))
+
+    name_offsets = np.cumsum([0] + [len(name) for name in names])
+    names_blob = b"".join(names)
+
+    with open(file_path, "wb") as f:
+        f.write(
+            _BINARY_HEADERS[_BINARY_VERSION].pack(
+                _BINARY_MAGIC,
+                _BINARY_VERSION,
+                len(names),
+                len(names_blob),
+                len(pairs),
+                last_sequence,
+            )
+        )
+        f.write(np.asarray(entry_offsets, dtype="<u8").tobytes())
+        f.write(np.asarray(totals, dtype="<u8").tobytes())
+        f.write(np.asarray(name_offsets, dtype="<u4").tobytes())
+        f.write(np.asarray(pairs, dtype="<u4").reshape(-1, 2).tobytes())
+        f.write(names_blob)
+
+
+def _apply_verse_count_delta(
+    counts: Mapping[str, int], verse_deltas: Mapping[str, int]
+) -> Mapping[str, int]:
+    """Return verse counts with changes added, sorted by count descending.
+
+    Counts that are no longer positive are removed, and the ``"total"`` is
+    changed by the sum of the changes that were applied.
+    """
+    new_counts = {
+        verse_id: count
+        for verse_id, count in counts.items()
+        if verse_id != "total"
+    }
+    total = counts.get("total", 0)
+    for verse_id, change in verse_deltas.items():
+        count = new_counts.pop(verse_id, 0)
+        new_count = max(count + change, 0)
+        if new_count:
+            new_counts[verse_id] = new_count
+        total += new_count - count
+
+    return MappingProxyType(
+        {
+            "total": total,
+            **dict(
+                sorted(
+                    new_counts.items(),
+                    key=lambda item: (-item[1], int(item[0])),
+                )
+            ),
+        }
+    )
+
+
+def _merge_verse_count_delta(
+    verse_counts_by_author: Mapping[str, Mapping[str, int]],
+    delta: VerseCountDeltaT,
+) -> dict[str, Mapping[str, int]]:
+    """Return the updated verse counts of the authors changed by a delta.
+
+    Only the changed authors and the ``"total"`` entry are recomputed.
+
+    Raises
+    ------
+    ValueError
+        If the delta changes ``"total"`` or has invalid verse IDs.
+    """
+    if "total" in delta:
+        raise ValueError("Total counts are updated from author counts.")
+
+    verse_deltas_by_author: dict[str, dict[str, int]] = {}
+    total_deltas: dict[str, int] = {}
+    for author, verse_deltas in delta.items():
+        check_valid_verse_ids([int(verse_id) for verse_id in verse_deltas])
+        author_deltas = verse_deltas_by_author.setdefault(author, {})
+        for verse_id, change in verse_deltas.items():
+            key = str(int(verse_id))
+            author_deltas[key] = author_deltas.get(key, 0) + change
+
+    updates = {}
+    for author, author_deltas in verse_deltas_by_author.items():
+        counts = verse_counts_by_author.get(author, {})
+        updated = _apply_verse_count_delta(counts, author_deltas)
+        updates[author] = updated
+        for verse_id in author_deltas:
+            change = updated.get(verse_id, 0) - counts.get(verse_id, 0)
+            total_deltas[verse_id] = total_deltas.get(verse_id, 0) + change
+
+    if updates:
+        updates["total"] = _apply_verse_count_delta(
+            verse_counts_by_author.get("total", {}), total_deltas
+        )
+    return updates
+
+
+class _UpdatedVerseCounts(Mapping[str, Mapping[str, int]]):
+    """Verse counts by author with updated authors overlaid on a base.
+
+    Authors are iterated by total count descending, as in the data files.
+    """
+
+    def __init__(
+        self,
+        base: Mapping[str, Mapping[str, int]],
+        updates: Mapping[str, Mapping[str, int]],
+    ) -> None:
+        if isinstance(base, _UpdatedVerseCounts):
+            updates = {**base.updates, **updates}
+            base = base.base
+        self.base: Mapping[str, Mapping[str, int]] = base
+        self.updates: Mapping[str, Mapping[str, int]] = updates
+        self._authors = sorted(
+            dict.fromkeys([*base, *updates]), key=self._get_total, reverse=True
+        )
+
+    def _get_total(self, author: str) -> int:
+        """Return the total count of an author."""
+        if author not in self.updates and isinstance(
+            self.base, _BinaryVerseCounts
+        ):
+            return self.base.get_total(author)
+        return self[author]["total"]
+
+    def get_source(self, author: str) -> Mapping[str, Mapping[str, int]]:
+        """Return the mapping that holds the verse counts of an author."""
+        return self.updates if author in self.updates else self.base
+
+    def __getitem__(self, author: str) -> Mapping[str, int]:
+        return self.get_source(author)[author]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._authors)
+
+    def __len__(self) -> int:
+        return len(self._authors)
+
+    def __contains__(self, author: object) -> bool:
+        return author in self.updates or author in self.base
+
+
+def _copy_file_mode(source: pathlib.Path, target: str) -> None:
+    """Copy the permission bits of a file, such as before replacing it.
+
+    Temporary files are only readable by their owner, so a file replaced by
+    one would otherwise no longer be readable by other users.
+    """
+    os.chmod(target, stat.S_IMODE(os.stat(source).st_mode))
+
+
+def _write_json_atomically(
+    verse_counts_by_author: Mapping[str, Mapping[str, int]],
+    file_path: pathlib.Path,
+) -> None:
+    """Write verse counts as JSON, replacing the file atomically."""
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=file_path.parent, delete=False
+    ) as f:
+        json.dump(
+            {
+                author: dict(verse_counts_by_author[author])
+                for author in verse_counts_by_author
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    _copy_file_mode(file_path, f.name)
+    os.replace(f.name, file_path)
+
+
+class VerseCountStore(Mapping[str, Mapping[str, int]]):
+    """Read-only store of verse counts for all authors.
+
+    The underlying data file is loaded at most once, on first access, and is
+    shared by every caller until :meth:`invalidate` or :meth:`reload` is
+    called. Verse counts for each author are exposed as immutable views, and
+    as arrays ranked by count with :meth:`ranked_verses`.
+
+    Parameters
+    ----------
+    file_location
+        Path to a verse counts file or name of one in ``bibletools.data``,
+        either JSON or binary (``.bin``). If ``None``, the binary companion of
+        ``verse-counts-by-author-and-id.json`` is used if it exists, and the
+        JSON file otherwise.
+    """
+
+    def __init__(
+        self, file_location: str | os.PathLike[str] | None = None
+    ) -> None:
+        self.file_location = file_location
+        self._lock = threading.Lock()
+        self._verse_counts_by_author: (
+            Mapping[str, Mapping[str, int]] | None
+        ) = None
+        self._ranked_verses: dict[str, np.ndarray] = {}
+        self._rank_indexes: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    def _load(self) -> Mapping[str, Mapping[str, int]]:
+        """Load verse counts for all authors from the data file."""
+        file_location = self._get_file_location()
+        with _open_data_file(file_location) as f:
+            if os.fspath(file_location).endswith(".bin"):
+                try:
+                    buffer: bytes | mmap.mmap = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                except (AttributeError, OSError):
+                    buffer = f.read()
+                return self._apply_update_log(
+                    _BinaryVerseCounts(buffer), file_location
+                )
+
+            verse_counts_by_author = json.load(f)
+
+        return {
+            author: MappingProxyType(counts)
+            for author, counts in verse_counts_by_author.items()
+        }
+
+    def _get_file_location(self) -> str | os.PathLike[str]:
+        """Return the location of the data file to load."""
+        if self.file_location is not None:
+            return self.file_location
+        return (
+            VERSE_COUNTS_BINARY_FILE
+            if _is_data_file(VERSE_COUNTS_BINARY_FILE)
+            else VERSE_COUNTS_FILE
+        )
+
+    @staticmethod
+    def _apply_update_log(
+        binary_verse_counts: _BinaryVerseCounts,
+        file_location: str | os.PathLike[str],
+    ) -> Mapping[str, Mapping[str, int]]:
+        """Apply the updates logged for a binary data file.
+
+        Updates already included in the file, such as when compacting it was
+        interrupted before the log was removed, are skipped, and so is a last
+        line that is still being written.
+        """
+        verse_counts_by_author: Mapping[str, Mapping[str, int]] = (
+            binary_verse_counts
+        )
+        log_location = os.fspath(file_location) + _UPDATE_LOG_SUFFIX
+        if not _is_data_file(log_location):
+            return verse_counts_by_author
+
+        with _open_data_file(log_location) as f:
+            for line in f:
+                if not line.endswith(b"\n") or not line.strip():
+                    continue
+                sequence, delta = json.loads(line)
+                if sequence <= binary_verse_counts.last_sequence:
+                    continue
+                verse_counts_by_author = _UpdatedVerseCounts(
+                    verse_counts_by_author,
+                    _merge_verse_count_delta(verse_counts_by_author, delta),
+                )
+        return verse_counts_by_author
+
+    @property
+    def _data(self) -> Mapping[str, Mapping[str, int]]:
+        """Return verse counts for all authors, loading them if needed."""
+        data = self._verse_counts_by_author
+        if data is None:
+            with self._lock:
+                data = self._verse_counts_by_author
+                if data is None:
+                    data = self._verse_counts_by_author = self._load()
+        return data
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the verse counts are currently loaded."""
+        return self._verse_counts_by_author is not None
+
+    def invalidate(self) -> None:
+        """Discard loaded verse counts so that they are reloaded lazily."""
+        with self._lock:
+            self._verse_counts_by_author = None
+            self._ranked_verses = {}
+            self._rank_indexes = {}
+
+    def reload(self) -> None:
+        """Reload verse counts from the data file immediately."""
+        data = self._load()
+        with self._lock:
+            self._verse_counts_by_author = data
+            self._ranked_verses = {}
+            self._rank_indexes = {}
+
+    def update(self, delta: VerseCountDeltaT) -> None:
+        """Merge changes of verse counts into the data file.
+
+        Only the verse counts of the changed authors and the ``"total"``
+        entry are recomputed. A binary data file is not rewritten; the delta
+        is appended to a log next to it, which is applied whenever the file
+        is loaded until :meth:`compact` is called. A JSON data file is
+        rewritten. Updates and compactions of a data file are serialized
+        across processes with a lock file next to it.
+
+        Parameters
+        ----------
+        delta
+            Mapping of authors to mappings of verse IDs to changes of their
+            counts, which may be negative. Verse counts that are no longer
+            positive are removed.
+
+        Raises
+        ------
+        ValueError
+            If the delta changes ``"total"`` or has invalid verse IDs.
+        """
+        delta = {
+            author: {
+                str(int(verse_id)): change
+                for verse_id, change in verse_deltas.items()
+            }
+            for author, verse_deltas in delta.items()
+        }
+        with self._lock:
+            data = self._verse_counts_by_author
+            if data is None:
+                data = self._load()
+            updates = _merge_verse_count_delta(data, delta)
+            if not updates:
+                return
+            updated = _UpdatedVerseCounts(data, updates)
+
+            file_path = _get_data_file_path(self._get_file_location())
+            with _lock_data_file(file_path):
+                if file_path.suffix == ".bin":
+                    sequence = _read_last_sequence(file_path) + 1
+                    log_path = file_path.with_name(
+                        file_path.name + _UPDATE_LOG_SUFFIX
+                    )
+                    with log_path.open("a", encoding="utf-8") as f:
+                        f.write(
+                            json.dumps([sequence, delta], ensure_ascii=False)
+                            + "\n"
+                        )
+                else:
+                    _write_json_atomically(updated, file_path)
+
+            self._verse_counts_by_author = updated
+            self._ranked_verses = {}
+            self._rank_indexes = {}
+
+    def compact(self) -> None:
+        """Rewrite a binary data file with its logged updates applied.
+
+        The log of updates is removed afterwards, and the verse counts are
+        reloaded. Nothing is done for a JSON data file or without updates.
+        The rewritten file records the last update it includes, so that the
+        log is not applied again if it cannot be removed, and no update can
+        be logged by another process while compacting.
+        """
+        with self._lock:
+            file_path = _get_data_file_path(self._get_file_location())
+            log_path = file_path.with_name(file_path.name + _UPDATE_LOG_SUFFIX)
+            if file_path.suffix != ".bin" or not log_path.is_file():
+                return
+
+            with _lock_data_file(file_path):
+                fd, temp_path = tempfile.mkstemp(dir=file_path.parent)
+                os.close(fd)
+                write_verse_counts_binary(
+                    self._load(),
+                    temp_path,
+                    last_sequence=_read_last_sequence(file_path),
+                )
+                _copy_file_mode(file_path, temp_path)
+                os.replace(temp_path, file_path)
+                log_path.unlink()
+
+            self._verse_counts_by_author = self._load()
+            self._ranked_verses = {}
+            self._rank_indexes = {}
+
+    def ranked_verses(self, author: str = "total") -> np.ndarray:
+        """Return the verse IDs and counts of an author ranked by count.
+
+        The ranking of each author is computed once and cached, so that top
+        verses can be read from its head without rescanning all verses.
+
+        Parameters
+        ----------
+        author
+            Author name to retrieve counts for. Defaults to total counts.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only array of shape ``(n, 2)`` with a verse ID and its count
+            in each row, sorted by count descending and then by verse ID.
+        """
+        data = self._data
+        ranked = self._ranked_verses.get(author)
+        if ranked is None:
+            source = data
+            if isinstance(source, _UpdatedVerseCounts):
+                source = source.get_source(author)
+            if isinstance(source, _BinaryVerseCounts):
+                pairs = source.pairs(author).astype(np.int64)
+            else:
+                pairs = np.array(
+                    [
+                        (int(verse_id), count)
+                        for verse_id, count in source[author].items()
+                        if verse_id != "total"
+                    ],
+                    dtype=np.int64,
+                ).reshape(-1, 2)
+            ranked = pairs[np.lexsort((pairs[:, 0], -pairs[:, 1]))]
+            ranked.flags.writeable = False
+            with self._lock:
+                if self._verse_counts_by_author is data:
+                    self._ranked_verses[author] = ranked
+        return ranked
+
+    def rank_index(
+        self, author: str = "total"
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the verse IDs of an author with their ranks by count.
+
+        The index is computed once per author and cached with the ranking, so
+        that the top verses in a range of verse IDs are found with a binary
+        search instead of scanning the ranking.
+
+        Parameters
+        ----------
+        author
+            Author name to retrieve counts for. Defaults to total counts.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Read-only arrays of the cited verse IDs in ascending order and of
+            their positions in :meth:`ranked_verses`.
+        """
+        data = self._data
+        index = self._rank_indexes.get(author)
+        if index is None:
+            ranked = self.ranked_verses(author)
+            ranks = np.argsort(ranked[:, 0], kind="stable")
+            verse_ids = ranked[ranks, 0]
+            for array in (verse_ids, ranks):
+                array.flags.writeable = False
+            index = (verse_ids, ranks)
+            with self._lock:
+                if self._verse_counts_by_author is data:
+                    self._rank_indexes[author] = index
+        return index
+
+    def __getitem__(self, author: str) -> Mapping[str, int]:
+        return self._data[author]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, author: object) -> bool:
+        return author in self._data
+
+
+_VERSE_COUNT_STORE = VerseCountStore()
+
+
+def get_verse_count_store() -> VerseCountStore:
+    """Return the process-wide verse count store.
+
+    Returns
+    -------
+    VerseCountStore
+        Store shared by :func:`bibletools.load_verse_counts` and the other
+        functions that default to verse counts as weights.
+    """
+    return _VERSE_COUNT_STORE
@@ -0,0 +1,190 @@
+"""Canonical order of verse IDs and indexes into it."""
+
+import functools
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+
+import numpy as np
+from pythonbible import (
+    Book,
+    NormalizedReference,
+    convert_reference_to_verse_ids,
+)
+
+
+@functools.cache
+def get_verse_id_array() -> np.ndarray:
+    """Return all verse IDs in the Bible in canonical order.
+
+    The array is computed once per process and shared, so it is read-only.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only array of verse IDs, which are strictly increasing.
+    """
+    verse_ids = np.fromiter(
+        convert_reference_to_verse_ids(
+            NormalizedReference(
+                book=Book.GENESIS,
+                start_chapter=1,
+                start_verse=1,
+                end_chapter=22,
+                end_verse=21,
+                end_book=Book.REVELATION,
+            )
+        ),
+        dtype=np.int64,
+    )
+    verse_ids.flags.writeable = False
+    return verse_ids
+
+
+@functools.cache
+def get_canonical_verse_ids() -> tuple[int, ...]:
+    """Return all verse IDs in the Bible in canonical order.
+
+    Returns
+    -------
+    tuple[int, ...]
+        Immutable sequence of verse IDs shared by all callers.
+    """
+    return tuple(get_verse_id_array().tolist())
+
+
+@functools.cache
+def get_verse_ordinals() -> Mapping[int, int]:
+    """Return the position of each verse ID in the canonical order.
+
+    Returns
+    -------
+    Mapping[int, int]
+        Read-only mapping of verse IDs to their ordinals, such that
+        ``get_canonical_verse_ids()[ordinal] == verse_id``.
+    """
+    return MappingProxyType(
+        {vid: ordinal for ordinal, vid in enumerate(get_canonical_verse_ids())}
+    )
+
+
+def _get_offsets(keys: np.ndarray) -> list[tuple[int, int, int]]:
+    """Return (key, start, stop) for each run of equal keys."""
+    starts = np.flatnonzero(np.diff(keys, prepend=-1)).tolist()
+    stops = [*starts[1:], len(keys)]
+    return list(zip(keys[starts].tolist(), starts, stops, strict=True))
+
+
+@functools.cache
+def get_book_offsets() -> Mapping[Book, tuple[int, int]]:
+    """Return the range of ordinals of each book.
+
+    Returns
+    -------
+    Mapping[pythonbible.Book, tuple[int, int]]
+        Read-only mapping of books to ``(start, stop)`` ordinals, so that the
+        verse IDs of a book are ``get_canonical_verse_ids()[start:stop]``.
+    """
+    return MappingProxyType(
+        {
+            Book(book): (start, stop)
+            for book, start, stop in _get_offsets(
+                get_verse_id_array() // 1_000_000
+            )
+        }
+    )
+
+
+@functools.cache
+def get_chapter_offsets() -> Mapping[tuple[Book, int], tuple[int, int]]:
+    """Return the range of ordinals of each chapter.
+
+    Returns
+    -------
+    Mapping[tuple[pythonbible.Book, int], tuple[int, int]]
+        Read-only mapping of ``(book, chapter)`` to ``(start, stop)``
+        ordinals, so that the verse IDs of a chapter are
+        ``get_canonical_verse_ids()[start:stop]``.
+    """
+    return MappingProxyType(
+        {
+            (Book(key // 1000), key % 1000): (start, stop)
+            for key, start, stop in _get_offsets(get_verse_id_array() // 1000)
+        }
+    )
+
+
+def get_reference_ordinals(reference: NormalizedReference) -> tuple[int, int]:
+    """Return the range of ordinals of the verses in a reference.
+
+    The verses of a reference are contiguous in the canonical order, so they
+    are resolved with the offset tables without listing their verse IDs.
+
+    Parameters
+    ----------
+    reference
+        Reference to resolve, possibly spanning chapters or books.
+
+    Returns
+    -------
+    tuple[int, int]
+        ``(start, stop)`` ordinals, so that the verse IDs of the reference are
+        ``get_canonical_verse_ids()[start:stop]``.
+
+    Raises
+    ------
+    ValueError
+        If the reference includes verses that do not exist.
+    """
+    end_book = reference.end_book or reference.book
+    try:
+        if reference.start_chapter is None:
+            start = get_book_offsets()[reference.book][0]
+        elif reference.start_verse is None:
+            start = get_chapter_offsets()[
+                (reference.book, reference.start_chapter)
+            ][0]
+        else:
+            start = get_verse_ordinals()[
+                reference.book.value * 1_000_000
+                + reference.start_chapter * 1000
+                + reference.start_verse
+            ]
+
+        if reference.end_chapter is None:
+            stop = get_book_offsets()[end_book][1]
+        elif reference.end_verse is None:
+            stop = get_chapter_offsets()[(end_book, reference.end_chapter)][1]
+        else:
+            stop = (
+                get_verse_ordinals()[
+                    end_book.value * 1_000_000
+                    + reference.end_chapter * 1000
+                    + reference.end_verse
+                ]
+                + 1
+            )
+    except KeyError as e:
+        raise ValueError(f"Invalid reference: {reference}.") from e
+
+    return start, stop
+
+
+def _find_ordinals(
+    verse_ids: Iterable[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the positions of verse IDs in the canonical order.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Positions of the verse IDs, clipped to valid positions, and a mask of
+        whether each verse ID was found.
+    """
+    canonical_verse_ids = get_verse_id_array()
+    verse_ids = np.asarray(
+        verse_ids if isinstance(verse_ids, np.ndarray) else list(verse_ids),
+        dtype=np.int64,
+    )
+    ordinals = np.searchsorted(canonical_verse_ids, verse_ids)
+    ordinals = np.minimum(ordinals, len(canonical_verse_ids) - 1)
+    return ordinals, canonical_verse_ids[ordinals] == verse_ids
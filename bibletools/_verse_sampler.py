@@ -0,0 +1,493 @@
+"""Reusable samplers for weighted random verse IDs."""
+
+import copy
+import functools
+import random
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+from pythonbible import NormalizedReference
+
+from ._utils import check_valid_verse_ids
+from ._verse_index import (
+    get_canonical_verse_ids,
+    get_reference_ordinals,
+    get_verse_id_array,
+)
+from ._verse_weights import VerseWeights
+
+
+def _get_reference_ranges(
+    references: Iterable[NormalizedReference],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the merged ranges of ordinals of references.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Sorted start and stop ordinals of disjoint ranges, so that verses in
+        overlapping references are only included once.
+    """
+    starts: list[int] = []
+    stops: list[int] = []
+    for start, stop in sorted(map(get_reference_ordinals, references)):
+        if starts and start <= stops[-1]:
+            stops[-1] = max(stops[-1], stop)
+        else:
+            starts.append(start)
+            stops.append(stop)
+    return np.array(starts, dtype=np.int64), np.array(stops, dtype=np.int64)
+
+
+def _get_weights(
+    verse_ids: Sequence[int] | None,
+    verse_weights: Mapping[str, int | float] | VerseWeights | None,
+    pad_weight: int | float,
+) -> tuple[list[int], np.ndarray]:
+    """Return the verse IDs to choose from and their padded weights.
+
+    Raises
+    ------
+    ValueError
+        If any verse ID is invalid or if the total weight is not positive.
+    """
+    if verse_ids is None:
+        if isinstance(verse_weights, VerseWeights):
+            weights = verse_weights.array + pad_weight
+        else:
+            weights = (
+                VerseWeights.from_mapping(verse_weights or {}).array
+                + pad_weight
+            )
+        choices = list(get_canonical_verse_ids())
+    else:
+        choices = check_valid_verse_ids(list(verse_ids))
+        if isinstance(verse_weights, VerseWeights):
+            weights = verse_weights.take(choices) + pad_weight
+        else:
+            verse_weights = verse_weights or {}
+            weights = np.array(
+                [
+                    verse_weights.get(str(vid), 0) + pad_weight
+                    for vid in choices
+                ],
+                dtype=np.float64,
+            )
+
+    if not weights.size or weights.sum() <= 0:
+        raise ValueError("Total of weights must be greater than zero.")
+    return choices, weights
+
+
+def _sample_ranges(
+    cum_weights: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    uniforms: np.ndarray,
+) -> np.ndarray:
+    """Draw positions in ranges with uniform random numbers in [0, 1).
+
+    A range is chosen by its total weight, then a position in the range by
+    a binary search of the cumulative weights before each position.
+
+    Raises
+    ------
+    ValueError
+        If the total weight of the ranges is not positive.
+    """
+    range_cum_weights = np.cumsum(cum_weights[stops] - cum_weights[starts])
+    if not range_cum_weights.size or range_cum_weights[-1] <= 0:
+        raise ValueError("Total of weights must be greater than zero.")
+
+    targets = uniforms * range_cum_weights[-1]
+    ranges = np.minimum(
+        np.searchsorted(range_cum_weights, targets, side="right"),
+        len(starts) - 1,
+    )
+    targets += (
+        cum_weights[starts[ranges]]
+        - np.concatenate(([0.0], range_cum_weights[:-1]))[ranges]
+    )
+    return np.clip(
+        np.searchsorted(cum_weights, targets, side="right") - 1,
+        starts[ranges],
+        stops[ranges] - 1,
+    )
+
+
+def _get_range_positions(
+    starts: np.ndarray, stops: np.ndarray, n_positions: int
+) -> np.ndarray:
+    """Return the sorted positions in disjoint ranges."""
+    is_in_ranges = np.zeros(n_positions, dtype=bool)
+    for start, stop in zip(starts.tolist(), stops.tolist(), strict=True):
+        is_in_ranges[start:stop] = True
+    return np.flatnonzero(is_in_ranges)
+
+
+def _sample_without_replacement(
+    weights: np.ndarray, k: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draw distinct positions in proportion to their weights.
+
+    Each position gets an exponential random key divided by its weight, and
+    the positions with the k smallest keys are a sample without replacement,
+    in the order of successive draws (Efraimidis and Spirakis, 2006).
+
+    Raises
+    ------
+    ValueError
+        If fewer than k positions have positive weights.
+    """
+    n_positive = int(np.count_nonzero(weights > 0))
+    if not 0 <= k <= n_positive:
+        raise ValueError(
+            f"Cannot draw {k} distinct verse IDs from {n_positive} verse IDs "
+            "with positive weights."
+        )
+    if not k:
+        return np.zeros(0, dtype=np.int64)
+    with np.errstate(divide="ignore"):
+        keys = rng.standard_exponential(len(weights)) / weights
+    keys[weights <= 0] = np.inf
+    top = np.argpartition(keys, k - 1)[:k]
+    return top[np.argsort(keys[top], kind="stable")]
+
+
+class VerseSampler:
+    """Sampler for drawing weighted random verse IDs repeatedly.
+
+    The cumulative weights are computed once on construction, so that each
+    draw is a binary search that takes O(log N) time for N verse IDs instead
+    of rebuilding the weights of all verse IDs. When sampling from all verse
+    IDs, draws can be restricted to references, such as a book or a range of
+    chapters, by searching only their ranges of the cumulative weights.
+
+    Parameters
+    ----------
+    verse_ids
+        List of verse IDs to choose from. If ``None``, all verse IDs in the
+        Bible are used.
+    verse_weights
+        Dictionary mapping verse IDs to their weights, or
+        :class:`bibletools.VerseWeights`.
+    pad_weight
+        Padding weight added to the weight of each verse. If a verse ID is not
+        in `verse_weights`, it is given a weight of 0 plus the `pad_weight`.
+
+    Raises
+    ------
+    ValueError
+        If any verse ID is invalid or if the total weight is not positive.
+    """
+
+    def __init__(
+        self,
+        verse_ids: Sequence[int] | None = None,
+        verse_weights: Mapping[str, int | float] | VerseWeights | None = None,
+        pad_weight: int | float = 1,
+    ) -> None:
+        choices, weights = _get_weights(verse_ids, verse_weights, pad_weight)
+        cum_weights = np.cumsum(weights)
+
+        self._verse_ids: list[int] = choices
+        self._weights = weights
+        self._cum_weights: list[float] = cum_weights.tolist()
+        # Cumulative weights before each verse ID, in canonical order
+        self._ordinal_cum_weights: np.ndarray | None = (
+            np.concatenate(([0.0], cum_weights)) if verse_ids is None else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._verse_ids)
+
+    @property
+    def total_weight(self) -> float:
+        """Sum of the weights of all verse IDs."""
+        return self._cum_weights[-1]
+
+    def sample(
+        self,
+        k: int = 1,
+        references: Iterable[NormalizedReference] | None = None,
+        replace: bool = True,
+    ) -> list[int]:
+        """Draw weighted random verse IDs.
+
+        Parameters
+        ----------
+        k
+            Number of verse IDs to draw.
+        references
+            References, for example from :func:`bibletools.parse_references`,
+            to restrict the verse IDs to. Verses in overlapping references
+            are only included once.
+        replace
+            Whether a verse ID can be drawn more than once. Without
+            replacement, the verse IDs are in the order of successive draws,
+            and the weights of duplicate verse IDs are added.
+
+        Returns
+        -------
+        list[int]
+            List of random verse IDs.
+
+        Raises
+        ------
+        ValueError
+            If the sampler does not sample from all verse IDs and references
+            are given, if a reference is invalid, if the total weight of the
+            references is not positive, or if there are fewer than `k` verse
+            IDs with positive weights to draw without replacement.
+        """
+        if not replace:
+            return self._sample_without_replacement(k, references)
+        if references is None:
+            return random.choices(
+                self._verse_ids, cum_weights=self._cum_weights, k=k
+            )
+        if self._ordinal_cum_weights is None:
+            raise ValueError(
+                "References can only restrict samplers of all verse IDs."
+            )
+
+        ordinals = _sample_ranges(
+            self._ordinal_cum_weights,
+            *_get_reference_ranges(references),
+            np.array([random.random() for _ in range(k)]),
+        )
+        return [self._verse_ids[i] for i in ordinals.tolist()]
+
+    def _sample_without_replacement(
+        self, k: int, references: Iterable[NormalizedReference] | None
+    ) -> list[int]:
+        """Draw distinct weighted random verse IDs in one vectorized pass."""
+        if references is not None:
+            if self._ordinal_cum_weights is None:
+                raise ValueError(
+                    "References can only restrict samplers of all verse IDs."
+                )
+            positions = _get_range_positions(
+                *_get_reference_ranges(references), len(self)
+            )
+            verse_ids = get_verse_id_array()[positions]
+            weights = self._weights[positions]
+        elif self._ordinal_cum_weights is None:
+            verse_ids, inverse = np.unique(
+                self._verse_ids, return_inverse=True
+            )
+            weights = np.bincount(inverse, weights=self._weights)
+        else:
+            verse_ids, weights = get_verse_id_array(), self._weights
+
+        # Seed from the random module, so that random.seed() applies
+        rng = np.random.default_rng(random.getrandbits(128))
+        return verse_ids[_sample_without_replacement(weights, k, rng)].tolist()
+
+    def sample_one(
+        self, references: Iterable[NormalizedReference] | None = None
+    ) -> int:
+        """Draw a single weighted random verse ID.
+
+        Parameters
+        ----------
+        references
+            References to restrict the verse IDs to, as in :meth:`sample`.
+
+        Returns
+        -------
+        int
+            A single random verse ID.
+        """
+        return self.sample(k=1, references=references)[0]
+
+
+class RandomVerseGenerator:
+    """Seedable generator of weighted random verse IDs.
+
+    Unlike :class:`VerseSampler`, which draws from the global state of the
+    :mod:`random` module, each generator draws from its own
+    :class:`numpy.random.Generator`. Sequences of draws are reproducible from
+    a seed, and generators in different threads do not contend for a shared
+    state. The weights are computed once on construction, and draws of many
+    verse IDs, with or without replacement, are vectorized.
+
+    A generator must not be used by several threads at once; use
+    :meth:`spawn` to create independent generators that share the weights,
+    such as one per thread.
+
+    Parameters
+    ----------
+    verse_ids
+        List of verse IDs to choose from. If ``None``, all verse IDs in the
+        Bible are used.
+    verse_weights
+        Dictionary mapping verse IDs to their weights, or
+        :class:`bibletools.VerseWeights`.
+    pad_weight
+        Padding weight added to the weight of each verse. If a verse ID is not
+        in `verse_weights`, it is given a weight of 0 plus the `pad_weight`.
+    seed
+        Seed of the random numbers, as accepted by
+        :func:`numpy.random.default_rng`, or a generator to draw from. If
+        ``None``, the seed is taken from the operating system.
+
+    Raises
+    ------
+    ValueError
+        If any verse ID is invalid or if the total weight is not positive.
+    """
+
+    def __init__(
+        self,
+        verse_ids: Sequence[int] | None = None,
+        verse_weights: Mapping[str, int | float] | VerseWeights | None = None,
+        pad_weight: int | float = 1,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+    ) -> None:
+        choices, weights = _get_weights(verse_ids, verse_weights, pad_weight)
+
+        self._verse_ids = (
+            get_verse_id_array()
+            if verse_ids is None
+            else np.array(choices, dtype=np.int64)
+        )
+        self._weights = weights
+        # Cumulative weights before each verse ID
+        self._cum_weights = np.concatenate(([0.0], np.cumsum(weights)))
+        for array in (self._verse_ids, self._weights, self._cum_weights):
+            array.flags.writeable = False
+        self._is_canonical = verse_ids is None
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return len(self._verse_ids)
+
+    @property
+    def total_weight(self) -> float:
+        """Sum of the weights of all verse IDs."""
+        return float(self._cum_weights[-1])
+
+    def spawn(self, n_generators: int) -> list["RandomVerseGenerator"]:
+        """Create independent generators with the same weights.
+
+        Parameters
+        ----------
+        n_generators
+            Number of generators to create.
+
+        Returns
+        -------
+        list[RandomVerseGenerator]
+            Generators whose random numbers are derived from the seed of this
+            generator, but are independent of it and of each other.
+        """
+        generators = []
+        for rng in self._rng.spawn(n_generators):
+            generator = copy.copy(self)
+            generator._rng = rng  # pylint: disable=protected-access
+            generators.append(generator)
+        return generators
+
+    def _get_positions(
+        self, references: Iterable[NormalizedReference] | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ranges of positions of the verse IDs to draw from."""
+        if references is None:
+            return np.array([0]), np.array([len(self._verse_ids)])
+        if not self._is_canonical:
+            raise ValueError(
+                "References can only restrict generators of all verse IDs."
+            )
+        return _get_reference_ranges(references)
+
+    def sample(
+        self,
+        k: int = 1,
+        replace: bool = True,
+        references: Iterable[NormalizedReference] | None = None,
+    ) -> np.ndarray:
+        """Draw weighted random verse IDs.
+
+        Parameters
+        ----------
+        k
+            Number of verse IDs to draw.
+        replace
+            Whether a verse ID can be drawn more than once. Without
+            replacement, the verse IDs are in the order of successive draws,
+            and the weights of duplicate verse IDs are added.
+        references
+            References, for example from :func:`bibletools.parse_references`,
+            to restrict the verse IDs to. Verses in overlapping references
+            are only included once.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of random verse IDs.
+
+        Raises
+        ------
+        ValueError
+            If the generator does not draw from all verse IDs and references
+            are given, if a reference is invalid, if the total weight of the
+            references is not positive, or if there are fewer than `k` verse
+            IDs with positive weights to draw without replacement.
+        """
+        starts, stops = self._get_positions(references)
+        if replace:
+            positions = _sample_ranges(
+                self._cum_weights, starts, stops, self._rng.random(k)
+            )
+        elif references is None and not self._is_canonical:
+            # Add the weights of duplicate verse IDs to draw them only once
+            verse_ids, inverse = np.unique(
+                self._verse_ids, return_inverse=True
+            )
+            return verse_ids[
+                _sample_without_replacement(
+                    np.bincount(inverse, weights=self._weights), k, self._rng
+                )
+            ]
+        elif references is None:
+            positions = _sample_without_replacement(
+                self._weights, k, self._rng
+            )
+        else:
+            candidates = _get_range_positions(starts, stops, len(self))
+            positions = candidates[
+                _sample_without_replacement(
+                    self._weights[candidates], k, self._rng
+                )
+            ]
+        return self._verse_ids[positions]
+
+    def sample_one(
+        self, references: Iterable[NormalizedReference] | None = None
+    ) -> int:
+        """Draw a single weighted random verse ID.
+
+        Parameters
+        ----------
+        references
+            References to restrict the verse IDs to, as in :meth:`sample`.
+
+        Returns
+        -------
+        int
+            A single random verse ID.
+        """
+        return int(self.sample(k=1, references=references)[0])
+
+
+@functools.lru_cache(maxsize=16)
+def _get_cached_sampler(
+    verse_weights: VerseWeights | None, pad_weight: int | float
+) -> VerseSampler:
+    """Return a sampler over all verse IDs, reused for the same weights.
+
+    Caching is only safe because :class:`VerseWeights` is immutable; mappings
+    of weights are never cached.
+    """
+    return VerseSampler(verse_weights=verse_weights, pad_weight=pad_weight)
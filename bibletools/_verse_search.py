@@ -0,0 +1,552 @@
+"""Full-text search of verse texts with an inverted index."""
+
+import os
+import re
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+from ._verse_index import get_verse_id_array, get_verse_ordinals
+
+_TOKEN_PATTERN = re.compile("\\w+(?:['\u2019]\\w+)*")
+_QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+_INDEX_VERSION = 2
+
+# Separator between the words of consecutive verses in the token stream
+_VERSE_SEPARATOR = -1
+
+# Default maximum number of words matched by a prefix, and minimum number of
+# occurrences of these words for the matches of a prefix to be precomputed
+_MAX_EXPANSIONS = 50
+_MIN_PRECOMPUTED_OCCURRENCES = 1 << 12
+
+# Fraction of all verses above which matches are found in other clauses with
+# a lookup table of verse ordinals instead of a binary search
+_MIN_LOOKUP_FRACTION = 1 / 16
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into lowercase word tokens.
+
+    Parameters
+    ----------
+    text
+        Text to tokenize.
+
+    Returns
+    -------
+    list[str]
+        Words of the text, including inner apostrophes, in lowercase.
+    """
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def _parse_query(
+    query: str, prefix_last: bool
+) -> list[tuple[list[str], bool]]:
+    """Return the words of each clause of a query and if it is a prefix."""
+    clauses = []
+    matches = _QUERY_PATTERN.findall(query)
+    for i, (phrase, word) in enumerate(matches):
+        words = tokenize(phrase or word)
+        if words:
+            is_prefix = word.endswith("*") or (
+                prefix_last and i == len(matches) - 1 and bool(word)
+            )
+            clauses.append((words, is_prefix))
+    return clauses
+
+
+def _rank_ordinals(
+    ordinals: np.ndarray, scores: np.ndarray, limit: int | None
+) -> np.ndarray:
+    """Return the ordinals with the top scores, by score then ordinal."""
+    if limit is not None and limit < 1:
+        return ordinals[:0]
+    if limit is not None and limit < len(ordinals):
+        # Only sort the top verses, which include the first ones in
+        # canonical order with the lowest top score
+        kth = len(scores) - limit
+        threshold = np.partition(scores, kth)[kth]
+        is_top = scores > threshold
+        n_ties = limit - np.count_nonzero(is_top)
+        is_top[np.flatnonzero(scores == threshold)[:n_ties]] = True
+        ordinals, scores = ordinals[is_top], scores[is_top]
+    return ordinals[np.argsort(-scores, kind="stable")]
+
+
+def _sum_by_ordinal(
+    ordinals: np.ndarray, weights: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the distinct ordinals in order and the sum of their weights."""
+    if not ordinals.size:
+        return ordinals, weights
+    order = np.argsort(ordinals, kind="stable")
+    ordinals, weights = ordinals[order], weights[order]
+    is_first = np.ones(len(ordinals), dtype=bool)
+    is_first[1:] = ordinals[1:] != ordinals[:-1]
+    (starts,) = np.nonzero(is_first)
+    return ordinals[starts], np.add.reduceat(weights, starts)
+
+
+def _index_ordinals(ordinals: np.ndarray, matches: np.ndarray) -> np.ndarray:
+    """Return the index of each match in sorted ordinals, or -1 if absent."""
+    n_verses = len(get_verse_id_array())
+    if len(matches) < n_verses * _MIN_LOOKUP_FRACTION:
+        indexes = np.searchsorted(ordinals, matches)
+        indexes[indexes == len(ordinals)] = 0
+        return np.where(ordinals[indexes] == matches, indexes, -1)
+    table = np.full(n_verses, -1, dtype=np.int32)
+    table[ordinals] = np.arange(len(ordinals), dtype=np.int32)
+    return table[matches]
+
+
+class _PrefixMatches:
+    """Precomputed matches of the prefixes of frequent words.
+
+    Parameters
+    ----------
+    prefixes
+        Array of the prefixes.
+    offsets
+        Start of the matches of each prefix, followed by their number.
+    ordinals
+        Ordinal of each matching verse, in order for each prefix.
+    scores
+        Score of each matching verse.
+    """
+
+    def __init__(
+        self,
+        prefixes: np.ndarray,
+        offsets: np.ndarray,
+        ordinals: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        self._prefixes = prefixes
+        self._offsets = offsets
+        self._ordinals = ordinals
+        self._scores = scores
+        self._prefix_ids = {
+            prefix: i for i, prefix in enumerate(prefixes.tolist())
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray]) -> "_PrefixMatches":
+        """Create the matches from arrays returned by :meth:`to_arrays`."""
+        return cls(
+            arrays["prefixes"],
+            arrays["prefix_offsets"],
+            arrays["prefix_ordinals"],
+            arrays["prefix_scores"],
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Return the arrays of the matches to save with an index."""
+        return {
+            "prefixes": self._prefixes,
+            "prefix_offsets": self._offsets,
+            "prefix_ordinals": self._ordinals,
+            "prefix_scores": self._scores,
+        }
+
+    def get(self, prefix: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return the matches of a prefix, or None if not precomputed."""
+        prefix_id = self._prefix_ids.get(prefix)
+        if prefix_id is None:
+            return None
+        matches = slice(self._offsets[prefix_id], self._offsets[prefix_id + 1])
+        return self._ordinals[matches], self._scores[matches]
+
+
+class VerseSearchIndex:  # pylint: disable=too-many-instance-attributes
+    """Inverted index of the words of verse texts.
+
+    The words of all verses are held as one stream of word IDs in canonical
+    order, and for each word, the index holds the sorted positions of its
+    occurrences in the stream and the ordinals of their verses. Words and
+    prefixes are matched by counting the verses of their occurrences, and
+    phrases by comparing the words that follow the occurrences of their
+    rarest word, instead of scanning verse texts. Matching verses are ranked
+    by the sum of the TF-IDF weights of the words matched. The matches of
+    prefixes of many occurrences, such as the first letters of a word typed
+    for autocompletion, are precomputed, and only the verses matching every
+    clause of a query are scored.
+
+    Use :meth:`from_verse_text_map` to build an index or :meth:`load` to read
+    a saved one.
+
+    Parameters
+    ----------
+    terms
+        Sorted array of the distinct words.
+    offsets
+        Start of the occurrences of each word, followed by their number.
+    positions
+        Positions in the stream of the occurrences of each word.
+    ordinals
+        Ordinal of the verse of each occurrence in the canonical order.
+    stream
+        ID of each word of the verses in canonical order, with a separator
+        after the words of each verse.
+    prefix_matches
+        Precomputed matches of prefixes, as saved by :meth:`save`. If
+        ``None``, they are computed from the occurrences.
+    """
+
+    def __init__(  # noqa: PLR0913 pylint: disable=too-many-arguments
+        self,
+        terms: np.ndarray,
+        offsets: np.ndarray,
+        positions: np.ndarray,
+        ordinals: np.ndarray,
+        stream: np.ndarray,
+        *,
+        prefix_matches: _PrefixMatches | None = None,
+    ) -> None:
+        if (
+            len(offsets) != len(terms) + 1
+            or offsets[-1] != len(positions)
+            or len(ordinals) != len(positions)
+        ):
+            raise ValueError("Invalid verse search index.")
+        self._terms = terms
+        self._offsets = offsets
+        self._positions = positions
+        self._ordinals = ordinals
+        self._stream = stream
+        self._term_ids = {term: i for i, term in enumerate(terms.tolist())}
+
+        # Find the distinct verses of each word and the number of its
+        # occurrences in each, as occurrences are sorted
+        term_ids = np.repeat(np.arange(len(terms)), np.diff(offsets))
+        is_new_verse = np.ones(len(ordinals), dtype=bool)
+        is_new_verse[1:] = (ordinals[1:] != ordinals[:-1]) | (
+            term_ids[1:] != term_ids[:-1]
+        )
+        (first_occurrences,) = np.nonzero(is_new_verse)
+        self._verse_ordinals = ordinals[first_occurrences]
+        self._verse_counts = np.diff(first_occurrences, append=len(ordinals))
+        self._document_frequencies = np.bincount(
+            term_ids[first_occurrences], minlength=len(terms)
+        )
+        self._verse_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(self._document_frequencies, out=self._verse_offsets[1:])
+        n_verses = np.count_nonzero(stream == _VERSE_SEPARATOR)
+        self._idf = np.log1p(
+            n_verses / np.maximum(self._document_frequencies, 1)
+        )
+        if prefix_matches is None:
+            prefix_matches = self._match_frequent_prefixes()
+        self._prefix_matches = prefix_matches
+
+    @classmethod
+    def from_verse_text_map(
+        cls, verse_text_map: Mapping[int, str]
+    ) -> "VerseSearchIndex":
+        """Build an index of verse texts.
+
+        Parameters
+        ----------
+        verse_text_map
+            Map of verse IDs to their texts, such as the output of
+            :func:`bibletools.parse_xml_to_verse_text_map`. Verse IDs that
+            are not in the canonical order are ignored.
+
+        Returns
+        -------
+        VerseSearchIndex
+            Index of the words of the verse texts.
+        """
+        verse_ordinals = get_verse_ordinals()
+        ordinals = sorted(
+            verse_ordinals[verse_id]
+            for verse_id in verse_text_map
+            if verse_id in verse_ordinals
+        )
+        verse_ids = get_verse_id_array()[ordinals].tolist()
+        words = [tokenize(verse_text_map[verse_id]) for verse_id in verse_ids]
+        n_words = np.array(
+            [len(verse_words) for verse_words in words], dtype=np.int64
+        )
+
+        terms, term_ids = np.unique(
+            np.array(
+                [word for verse_words in words for word in verse_words],
+                dtype=str,
+            ),
+            return_inverse=True,
+        )
+        # Skip a position for the separator after each verse
+        verse_indexes = np.repeat(np.arange(len(ordinals)), n_words)
+        positions = np.arange(len(term_ids)) + verse_indexes
+        stream = np.full(
+            len(term_ids) + len(ordinals), _VERSE_SEPARATOR, dtype=np.int32
+        )
+        stream[positions] = term_ids
+
+        order = np.argsort(term_ids, kind="stable")
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(terms)), out=offsets[1:])
+        return cls(
+            terms,
+            offsets,
+            positions[order].astype(np.int64),
+            np.asarray(ordinals, dtype=np.int64)[verse_indexes[order]],
+            stream,
+        )
+
+    def save(self, file_path: str | os.PathLike[str]) -> None:
+        """Save the index to a NumPy ``.npz`` file.
+
+        Parameters
+        ----------
+        file_path
+            Path of the file to write.
+        """
+        arrays: dict[str, Any] = {
+            "version": _INDEX_VERSION,
+            "n_verses": len(get_verse_id_array()),
+            "terms": self._terms,
+            "offsets": self._offsets,
+            "positions": self._positions,
+            "ordinals": self._ordinals,
+            "stream": self._stream,
+            **self._prefix_matches.to_arrays(),
+        }
+        with open(file_path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, file_path: str | os.PathLike[str]) -> "VerseSearchIndex":
+        """Load an index saved with :meth:`save`.
+
+        Parameters
+        ----------
+        file_path
+            Path of the file to read.
+
+        Returns
+        -------
+        VerseSearchIndex
+            The saved index.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a saved index.
+        """
+        with np.load(file_path) as data:
+            arrays: dict[str, np.ndarray] = dict(data)
+        if arrays.get("version") != _INDEX_VERSION or arrays.get(
+            "n_verses"
+        ) != len(get_verse_id_array()):
+            raise ValueError("Invalid verse search index.")
+        return cls(
+            arrays["terms"],
+            arrays["offsets"],
+            arrays["positions"],
+            arrays["ordinals"],
+            arrays["stream"],
+            prefix_matches=_PrefixMatches.from_arrays(arrays),
+        )
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _get_occurrences(self, term_id: int) -> slice:
+        """Return the slice of the occurrences of a word."""
+        return slice(self._offsets[term_id], self._offsets[term_id + 1])
+
+    def _expand_prefix(self, prefix: str, max_expansions: int) -> np.ndarray:
+        """Return the IDs of the words in the most verses with a prefix."""
+        start = int(np.searchsorted(self._terms, prefix, side="left"))
+        stop = int(np.searchsorted(self._terms, prefix + "\U0010ffff"))
+        term_ids = np.arange(start, stop)
+        if len(term_ids) > max_expansions:
+            # Only expand to the words in the most verses
+            frequencies = self._document_frequencies[start:stop]
+            top = np.argpartition(-frequencies, max_expansions - 1)
+            term_ids = np.sort(term_ids[top[:max_expansions]])
+        return term_ids
+
+    def _match_frequent_prefixes(self) -> _PrefixMatches:
+        """Precompute the matches of prefixes of many occurrences.
+
+        Prefixes are extended one character at a time, as the words with a
+        prefix have at least as many occurrences as those with a longer one.
+        """
+        terms = self._terms.tolist()
+        prefixes = []
+        matches = []
+        candidates = sorted({term[:1] for term in terms})
+        while candidates:
+            next_candidates: set[str] = set()
+            for prefix in candidates:
+                start = int(np.searchsorted(self._terms, prefix, side="left"))
+                stop = int(np.searchsorted(self._terms, prefix + "\U0010ffff"))
+                n_occurrences = self._offsets[stop] - self._offsets[start]
+                if n_occurrences < _MIN_PRECOMPUTED_OCCURRENCES:
+                    continue
+                length = len(prefix) + 1
+                next_candidates.update(
+                    term[:length] for term in terms[start:stop]
+                )
+                next_candidates.discard(prefix)
+
+                term_ids = self._expand_prefix(prefix, _MAX_EXPANSIONS)
+                n_occurrences = np.sum(
+                    self._offsets[term_ids + 1] - self._offsets[term_ids]
+                )
+                if n_occurrences >= _MIN_PRECOMPUTED_OCCURRENCES:
+                    prefixes.append(prefix)
+                    matches.append(self._score_terms(term_ids))
+            candidates = sorted(next_candidates)
+
+        offsets = np.zeros(len(matches) + 1, dtype=np.int64)
+        np.cumsum([len(ordinals) for ordinals, _ in matches], out=offsets[1:])
+        return _PrefixMatches(
+            np.array(prefixes, dtype=str),
+            offsets,
+            np.concatenate(
+                [ordinals for ordinals, _ in matches]
+                or [np.empty(0, dtype=np.int64)]
+            ),
+            np.concatenate([scores for _, scores in matches] or [np.empty(0)]),
+        )
+
+    def _score_terms(
+        self, term_ids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the verses with any of the words and their TF-IDF score."""
+        if len(term_ids) == 1:
+            (term_id,) = term_ids.tolist()
+            verses = slice(
+                self._verse_offsets[term_id], self._verse_offsets[term_id + 1]
+            )
+            return (
+                self._verse_ordinals[verses],
+                self._verse_counts[verses] * self._idf[term_id],
+            )
+
+        # Gather the verses of all words at once
+        starts = self._verse_offsets[term_ids]
+        counts = self._verse_offsets[term_ids + 1] - starts
+        verses = np.arange(counts.sum()) + np.repeat(
+            starts - np.cumsum(counts) + counts, counts
+        )
+        return _sum_by_ordinal(
+            self._verse_ordinals[verses],
+            self._verse_counts[verses]
+            * np.repeat(self._idf[term_ids], counts),
+        )
+
+    def _score_prefix(
+        self, prefix: str, max_expansions: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the verses with words with a prefix and their score."""
+        if max_expansions == _MAX_EXPANSIONS:
+            matches = self._prefix_matches.get(prefix)
+            if matches is not None:
+                return matches
+        return self._score_terms(self._expand_prefix(prefix, max_expansions))
+
+    def _score_phrase(
+        self, term_ids: list[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the verses with a phrase and their TF-IDF score."""
+        # Match the phrase from the occurrences of its rarest word
+        rarest = min(
+            range(len(term_ids)),
+            key=lambda i: self._document_frequencies[term_ids[i]],
+        )
+        occurrences = self._get_occurrences(term_ids[rarest])
+        starts = self._positions[occurrences] - rarest
+        ordinals = self._ordinals[occurrences]
+        is_valid = (starts >= 0) & (
+            starts + len(term_ids) <= len(self._stream)
+        )
+        starts, ordinals = starts[is_valid], ordinals[is_valid]
+
+        # Separators between verses never match, so phrases stay in verses
+        for i, term_id in enumerate(term_ids):
+            if i != rarest:
+                is_match = self._stream[starts + i] == term_id
+                starts, ordinals = starts[is_match], ordinals[is_match]
+
+        return _sum_by_ordinal(
+            ordinals,
+            np.full(len(ordinals), float(self._idf[term_ids].sum())),
+        )
+
+    def _score_clause(
+        self, words: list[str], is_prefix: bool, max_expansions: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the verses matching a clause of a query and their score."""
+        if is_prefix and len(words) == 1:
+            return self._score_prefix(words[0], max_expansions)
+
+        term_ids = [self._term_ids.get(word) for word in words]
+        if None in term_ids:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if len(term_ids) == 1:
+            return self._score_terms(np.asarray(term_ids))
+        return self._score_phrase([int(term_id or 0) for term_id in term_ids])
+
+    def search(
+        self,
+        query: str,
+        limit: int | None = 10,
+        prefix_last: bool = False,
+        max_expansions: int = _MAX_EXPANSIONS,
+    ) -> list[int]:
+        """Find the verses matching all words and phrases of a query.
+
+        Parameters
+        ----------
+        query
+            Words to match. Words in double quotes are matched as a phrase,
+            and words ending with ``*`` are matched as prefixes.
+        limit
+            Maximum number of verse IDs to return. If ``None``, all
+            matching verse IDs are returned.
+        prefix_last
+            Whether to match the last word as a prefix, as when completing a
+            query while it is typed.
+        max_expansions
+            Maximum number of words matched by a prefix, which are the words
+            in the most verses, so that short prefixes stay fast.
+
+        Returns
+        -------
+        list[int]
+            Matching verse IDs ranked by the sum of the TF-IDF weights of
+            their matches, then in canonical order.
+        """
+        clauses = [
+            self._score_clause(words, is_prefix, max_expansions)
+            for words, is_prefix in _parse_query(query, prefix_last)
+        ]
+        if not clauses:
+            return []
+
+        # Only score the verses matching the clause with the fewest matches,
+        # keeping their indexes in it
+        fewest = min(range(len(clauses)), key=lambda i: len(clauses[i][0]))
+        matches = clauses[fewest][0]
+        match_indexes = np.arange(len(matches))
+        total_scores = np.zeros(len(matches))
+        for i, (ordinals, scores) in enumerate(clauses):
+            if i == fewest:
+                total_scores += scores[match_indexes]
+                continue
+            indexes = _index_ordinals(ordinals, matches)
+            is_match = indexes >= 0
+            matches = matches[is_match]
+            match_indexes = match_indexes[is_match]
+            total_scores = total_scores[is_match] + scores[indexes[is_match]]
+
+        return get_verse_id_array()[
+            _rank_ordinals(matches, total_scores, limit)
+        ].tolist()
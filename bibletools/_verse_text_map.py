@@ -1,8 +1,14 @@
 """Load and convert Bible XML files."""
 
+import bisect
+import contextlib
+import functools
 import re
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO
 from xml.etree import ElementTree
 
+import numpy as np
 from pythonbible import (
     Book,
     NormalizedReference,
@@ -10,6 +16,64 @@ from pythonbible import (
     get_verse_id,
 )
 
+from ._utils import open_file_as_binary
+from ._verse_index import (
+    get_canonical_verse_ids,
+    get_reference_ordinals,
+    get_verse_id_array,
+)
+from ._verse_text_store import VerseTextStore
+
+
+@functools.cache
+def _get_book_lookup() -> dict[str, Book]:
+    """Return a lookup of lowercase book titles and abbreviations.
+
+    Entries are added in order of precedence, titles before abbreviations and
+    books in canonical order, so that the first match is kept.
+    """
+    lookup: dict[str, Book] = {}
+    for book in Book:
+        lookup.setdefault(book.title.lower(), book)
+    for book in Book:
+        for abbr in book.abbreviations:
+            lookup.setdefault(abbr.lower(), book)
+    return lookup
+
+
+@functools.cache
+def _get_book_patterns() -> list[tuple[Book, re.Pattern[str]]]:
+    """Return the compiled regular expression of each book."""
+    return [
+        (book, re.compile(book.regular_expression, flags=re.IGNORECASE))
+        for book in Book
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_book(normalized: str) -> Book | None:
+    """Resolve a stripped book name, or return ``None`` if it is unknown.
+
+    Results are cached per process, so that each distinct book name in any
+    number of parses is only resolved once.
+    """
+    # 1. Enum member name (GENESIS, SAMUEL_1, etc.)
+    book = Book.__members__.get(normalized.upper())
+    if book is not None:
+        return book
+
+    # 2. Exact title match (case-insensitive), then 3. abbreviation match
+    book = _get_book_lookup().get(normalized.lower())
+    if book is not None:
+        return book
+
+    # 4. Regex match (most flexible, last resort)
+    for book, pattern in _get_book_patterns():
+        if pattern.search(normalized):
+            return book
+
+    return None
+
 
 def _get_book_from_text(text: str) -> Book:
     """Return the Book enum corresponding to a book name or abbreviation.
@@ -28,30 +92,10 @@ def _get_book_from_text(text: str) -> Book:
     ValueError
         If no matching Book is found.
     """
-    normalized = text.strip()
-
-    # 1. Enum member name (GENESIS, SAMUEL_1, etc.)
-    try:
-        return Book[normalized.upper()]
-    except KeyError:
-        pass
-
-    # 2. Exact title match (case-insensitive)
-    for book in Book:
-        if normalized.lower() == book.title.lower():
-            return book
-
-    # 3. Abbreviation match
-    for book in Book:
-        if normalized.lower() in (abbr.lower() for abbr in book.abbreviations):
-            return book
-
-    # 4. Regex match (most flexible, last resort)
-    for book in Book:
-        if re.search(book.regular_expression, normalized, flags=re.IGNORECASE):
-            return book
-
-    raise ValueError(f"Unknown Bible book: {text!r}")
+    book = _resolve_book(text.strip())
+    if book is None:
+        raise ValueError(f"Unknown Bible book: {text!r}")
+    return book
 
 
 # pylint: disable=too-many-locals
@@ -111,9 +155,102 @@ def parse_xml_to_verse_text_map(
     return verse_text_map
 
 
+def _split_xml_path(path: str) -> tuple[str, ...]:
+    """Split a simple ElementTree path into its tags.
+
+    Raises
+    ------
+    ValueError
+        If the path uses syntax other than tags separated by slashes.
+    """
+    tags = tuple(tag for tag in path.split("/") if tag != ".")
+    if not tags or any(
+        not tag or tag == ".." or "*" in tag or "[" in tag for tag in tags
+    ):
+        raise ValueError(
+            f"Unsupported path for streaming XML parsing: {path!r}"
+        )
+    return tags
+
+
+def iter_xml_verse_texts(
+    source: str | IO[bytes],
+    testament_path: str | None = None,
+    book_spec: tuple[str, str] = ("b", "n"),
+    chapter_spec: tuple[str, str] = ("c", "n"),
+    verse_spec: tuple[str, str] = ("v", "n"),
+) -> Iterator[tuple[int, str]]:
+    """Stream verse IDs and texts from a Bible XML file.
+
+    Unlike :func:`parse_xml_to_verse_text_map`, the XML is parsed
+    incrementally and elements are cleared once their verses are yielded, so
+    that memory use stays flat regardless of the size of the file. Paths in
+    the specs must be tags separated by slashes.
+
+    Parameters
+    ----------
+    source
+        Location of the XML file, resolved as in
+        :func:`bibletools.read_file_as_string`, or a binary stream.
+    testament_path
+        Path of testament elements from the root, if any.
+    book_spec
+        Path of book elements from a testament and their name attribute.
+    chapter_spec
+        Path of chapter elements from a book and their number attribute.
+    verse_spec
+        Path of verse elements from a chapter and their number attribute.
+
+    Yields
+    ------
+    tuple[int, str]
+        Verse ID and its text, in document order.
+    """
+    testament_tags = (
+        () if testament_path is None else _split_xml_path(testament_path)
+    )
+    book_tags = testament_tags + _split_xml_path(book_spec[0])
+    chapter_tags = book_tags + _split_xml_path(chapter_spec[0])
+    verse_tags = chapter_tags + _split_xml_path(verse_spec[0])
+    cleared_tags = {testament_tags, book_tags, chapter_tags}
+
+    with contextlib.ExitStack() as stack:
+        if isinstance(source, str):
+            source = stack.enter_context(open_file_as_binary(source))
+
+        path: list[str] = []
+        book_instance = None
+        chapter_number = 0
+        for event, element in ElementTree.iterparse(
+            source, events=("start", "end")
+        ):
+            if event == "start":
+                path.append(element.tag)
+                tags = tuple(path[1:])  # Relative to the root
+                if tags == book_tags:
+                    book_instance = _get_book_from_text(
+                        element.attrib[book_spec[1]]
+                    )
+                elif tags == chapter_tags:
+                    chapter_number = int(element.attrib[chapter_spec[1]])
+                continue
+
+            tags = tuple(path[1:])
+            path.pop()
+            if tags == verse_tags and book_instance is not None:
+                yield get_verse_id(
+                    book=book_instance,
+                    chapter=chapter_number,
+                    verse=int(element.attrib[verse_spec[1]]),
+                ), (element.text or "").strip()
+                element.clear()
+            elif tags in cleared_tags:
+                element.clear()
+
+
 def convert_reference_to_verse_text(
     reference: NormalizedReference,
-    verse_text_map: dict[int, str],
+    verse_text_map: Mapping[int, str],
     verse_separator: str = " ",
 ) -> str:
     """Return verse texts for the given reference.
@@ -123,7 +260,8 @@ def convert_reference_to_verse_text(
     reference
         Reference with verses to retrieve.
     verse_text_map
-        Map for verse IDs to their corresponding text values.
+        Map for verse IDs to their corresponding text values, such as a
+        :class:`bibletools.VerseTextStore`.
     verse_separator
         Separator to use between verse texts.
 
@@ -131,7 +269,157 @@ def convert_reference_to_verse_text(
     -------
     str
         Concatenated verse texts corresponding to the given reference.
+
+    Notes
+    -----
+    With a :class:`bibletools.VerseTextStore` that has every verse of the
+    reference, the reference is resolved to a range of positions in the store
+    and its text is read in one slice, without listing its verse IDs.
     """
+    if isinstance(verse_text_map, VerseTextStore):
+        try:
+            start, stop = get_reference_ordinals(reference)
+        except ValueError:
+            pass  # Let pythonbible raise its error for invalid references
+        else:
+            verse_id_array = get_verse_id_array()
+            first, last = verse_text_map.locate(
+                int(verse_id_array[start]), int(verse_id_array[stop - 1])
+            )
+            if np.array_equal(
+                verse_text_map.verse_ids[first:last],
+                verse_id_array[start:stop],
+            ):
+                return verse_text_map.join(first, last, verse_separator)
+
     verse_ids = convert_reference_to_verse_ids(reference=reference)
     verse_texts = [verse_text_map[vid] for vid in verse_ids]
     return verse_separator.join(verse_texts)
+
+
+def _get_ordinal_range(
+    reference: NormalizedReference,
+) -> tuple[int, int] | None:
+    """Return the ordinal range of a reference, or ``None`` if invalid."""
+    try:
+        return get_reference_ordinals(reference)
+    except ValueError:
+        return None
+
+
+def convert_references_to_verse_texts(
+    references: Iterable[NormalizedReference],
+    verse_text_map: Mapping[int, str],
+    verse_separator: str = " ",
+) -> list[str]:
+    """Return verse texts for each of the given references.
+
+    The references are resolved in one pass: overlapping references are
+    merged so that the text of each verse is looked up once, and duplicate
+    references are joined once.
+
+    Parameters
+    ----------
+    references
+        References with verses to retrieve, such as the output of
+        :func:`bibletools.parse_references`.
+    verse_text_map
+        Map for verse IDs to their corresponding text values, such as a
+        :class:`bibletools.VerseTextStore`.
+    verse_separator
+        Separator to use between verse texts.
+
+    Returns
+    -------
+    list[str]
+        Concatenated verse texts of each reference, in the given order.
+    """
+    references = list(references)
+    ranges = [_get_ordinal_range(reference) for reference in references]
+
+    # Merge overlapping ranges and look up the verse texts of each once
+    blocks: list[tuple[int, list[str]]] = []
+    if not isinstance(verse_text_map, VerseTextStore):
+        verse_ids = get_canonical_verse_ids()
+        merged: list[list[int]] = []
+        for start, stop in sorted({r for r in ranges if r is not None}):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([start, stop])
+        blocks = [
+            (start, [verse_text_map[vid] for vid in verse_ids[start:stop]])
+            for start, stop in merged
+        ]
+    block_starts = [start for start, _ in blocks]
+
+    texts_by_range: dict[tuple[int, int], str] = {}
+    verse_texts = []
+    for reference, ordinal_range in zip(references, ranges, strict=True):
+        if ordinal_range is None:
+            verse_texts.append(
+                convert_reference_to_verse_text(
+                    reference, verse_text_map, verse_separator
+                )
+            )
+            continue
+
+        text = texts_by_range.get(ordinal_range)
+        if text is None:
+            if blocks:
+                start, stop = ordinal_range
+                block_start, block = blocks[
+                    bisect.bisect_right(block_starts, start) - 1
+                ]
+                first, last = start - block_start, stop - block_start
+                text = verse_separator.join(block[first:last])
+            else:
+                text = convert_reference_to_verse_text(
+                    reference, verse_text_map, verse_separator
+                )
+            texts_by_range[ordinal_range] = text
+        verse_texts.append(text)
+
+    return verse_texts
+
+
+def iter_references_verse_texts(
+    references: Iterable[NormalizedReference],
+    verse_text_map: Mapping[int, str],
+    verse_separator: str = " ",
+) -> Iterator[str]:
+    """Yield verse texts for each of the given references.
+
+    Unlike :func:`convert_references_to_verse_texts`, references are consumed
+    and resolved one at a time, so that memory use stays flat for long or
+    unbounded streams of references. Each reference is resolved to a range
+    of canonical verse IDs without listing them with pythonbible.
+
+    Parameters
+    ----------
+    references
+        References with verses to retrieve, such as the output of
+        :func:`bibletools.parse_references`.
+    verse_text_map
+        Map for verse IDs to their corresponding text values, such as a
+        :class:`bibletools.VerseTextStore`.
+    verse_separator
+        Separator to use between verse texts.
+
+    Yields
+    ------
+    str
+        Concatenated verse texts of each reference, in the given order.
+    """
+    verse_ids = get_canonical_verse_ids()
+    for reference in references:
+        ordinal_range = _get_ordinal_range(reference)
+        if ordinal_range is None or isinstance(verse_text_map, VerseTextStore):
+            yield convert_reference_to_verse_text(
+                reference, verse_text_map, verse_separator
+            )
+        else:
+            start, stop = ordinal_range
+            yield verse_separator.join(
+                verse_text_map[vid] for vid in verse_ids[start:stop]
+            )
@@ -0,0 +1,239 @@
+"""Compact binary storage of verse texts."""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Literal
+
+import numpy as np
+
+from ._utils import open_file_as_binary
+
+# Binary layout, all little-endian:
+#   header: magic, version, n_verses, blob_nbytes
+#   verse_ids: uint32[n_verses], sorted in canonical order
+#   offsets: uint64[n_verses + 1], byte offset of each verse text in the blob
+#   blob: UTF-8 encoded verse texts, each followed by STORE_SEPARATOR
+_STORE_MAGIC = b"BTVT"
+_STORE_VERSION = 1
+_STORE_HEADER = struct.Struct("<4sIQQ")
+_MAX_VERSE_ID = np.iinfo(np.uint32).max
+STORE_SEPARATOR = " "
+
+
+def _encode_verse_texts(
+    verse_texts: Mapping[int, str] | Iterable[tuple[int, str]],
+) -> list[bytes]:
+    """Encode verse texts in the binary format, in canonical order."""
+    items = sorted(
+        verse_texts.items()
+        if isinstance(verse_texts, Mapping)
+        else verse_texts
+    )
+    verse_ids = np.asarray([vid for vid, _ in items], dtype="<u4")
+    if len(np.unique(verse_ids)) != len(verse_ids):
+        raise ValueError("Verse IDs must be unique.")
+
+    separator = STORE_SEPARATOR.encode("utf-8")
+    texts = [text.encode("utf-8") + separator for _, text in items]
+    offsets = np.cumsum([0] + [len(text) for text in texts], dtype="<u8")
+    blob = b"".join(texts)
+    return [
+        _STORE_HEADER.pack(
+            _STORE_MAGIC, _STORE_VERSION, len(verse_ids), len(blob)
+        ),
+        verse_ids.tobytes(),
+        offsets.tobytes(),
+        blob,
+    ]
+
+
+class VerseTextStore(Mapping[int, str]):
+    """Read-only mapping of verse IDs to texts backed by a binary buffer.
+
+    Verse texts are stored in canonical verse order as one UTF-8 blob with an
+    offset table, and each text is only decoded when it is accessed. The
+    store can be used wherever a verse text map is accepted.
+
+    Parameters
+    ----------
+    buffer
+        Buffer in the binary verse text format, typically memory-mapped by
+        :func:`load_verse_text_store`.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        magic, version, n_verses, blob_nbytes = _STORE_HEADER.unpack_from(
+            buffer
+        )
+        if magic != _STORE_MAGIC or version != _STORE_VERSION:
+            raise ValueError("Invalid binary verse text file.")
+
+        self._buffer = buffer  # Keep the memory map open
+        offset = _STORE_HEADER.size
+        self._verse_ids = np.frombuffer(
+            buffer, dtype="<u4", count=n_verses, offset=offset
+        )
+        offset += self._verse_ids.nbytes
+        self._offsets = np.frombuffer(
+            buffer, dtype="<u8", count=n_verses + 1, offset=offset
+        )
+        offset += self._offsets.nbytes
+        self._blob = memoryview(buffer)[offset:]
+        if len(self._blob) != blob_nbytes:
+            raise ValueError("Invalid binary verse text file.")
+
+    @classmethod
+    def from_mapping(
+        cls, verse_texts: Mapping[int, str] | Iterable[tuple[int, str]]
+    ) -> "VerseTextStore":
+        """Create a store in memory from verse texts.
+
+        Parameters
+        ----------
+        verse_texts
+            Mapping of verse IDs to texts, or an iterable of pairs such as
+            the output of :func:`bibletools.iter_xml_verse_texts`.
+
+        Returns
+        -------
+        VerseTextStore
+            Store with the same verse texts.
+        """
+        return cls(b"".join(_encode_verse_texts(verse_texts)))
+
+    @property
+    def verse_ids(self) -> np.ndarray:
+        """Read-only array of the verse IDs in the store, in order."""
+        return self._verse_ids
+
+    def locate(
+        self, first_verse_id: int, last_verse_id: int
+    ) -> tuple[int, int]:
+        """Return the positions of the verses in a range of verse IDs.
+
+        Parameters
+        ----------
+        first_verse_id
+            First verse ID of the range.
+        last_verse_id
+            Last verse ID of the range, inclusive.
+
+        Returns
+        -------
+        tuple[int, int]
+            ``(start, stop)`` positions of the verses in the store whose IDs
+            are within the range.
+        """
+        return (
+            self._search(first_verse_id, side="left"),
+            self._search(last_verse_id, side="right"),
+        )
+
+    def _search(self, verse_id: int, side: Literal["left", "right"]) -> int:
+        """Return the insertion position of a verse ID in the store."""
+        if verse_id < 0:
+            return 0
+        if verse_id > _MAX_VERSE_ID:
+            return len(self._verse_ids)
+        # Search with the dtype of the array to avoid converting the array
+        return int(
+            np.searchsorted(self._verse_ids, np.uint32(verse_id), side=side)
+        )
+
+    def join(
+        self, start: int, stop: int, verse_separator: str = STORE_SEPARATOR
+    ) -> str:
+        """Return the joined texts of the verses at a range of positions.
+
+        With the default separator, the texts are decoded from a single slice
+        of the blob, since the verses are stored in order with that separator.
+
+        Parameters
+        ----------
+        start
+            Position of the first verse.
+        stop
+            Position after the last verse.
+        verse_separator
+            Separator to use between verse texts.
+
+        Returns
+        -------
+        str
+            Concatenated verse texts.
+        """
+        if start >= stop:
+            return ""
+        if verse_separator != STORE_SEPARATOR:
+            return verse_separator.join(
+                self.join(i, i + 1) for i in range(start, stop)
+            )
+        begin = int(self._offsets[start])
+        end = int(self._offsets[stop]) - len(STORE_SEPARATOR)
+        return str(self._blob[begin:end], "utf-8")
+
+    def __getitem__(self, verse_id: int) -> str:
+        start, stop = self.locate(verse_id, verse_id)
+        if start == stop:
+            raise KeyError(verse_id)
+        return self.join(start, stop)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._verse_ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self._verse_ids)
+
+    def __contains__(self, verse_id: object) -> bool:
+        if not isinstance(verse_id, int | np.integer):
+            return False
+        start, stop = self.locate(int(verse_id), int(verse_id))
+        return start < stop
+
+
+def write_verse_text_store(
+    verse_texts: Mapping[int, str] | Iterable[tuple[int, str]],
+    file_path: str | os.PathLike[str],
+) -> None:
+    """Write verse texts in the binary verse text format.
+
+    Parameters
+    ----------
+    verse_texts
+        Mapping of verse IDs to texts, such as the output of
+        :func:`bibletools.parse_xml_to_verse_text_map`, or an iterable of
+        pairs, such as the output of :func:`bibletools.iter_xml_verse_texts`.
+    file_path
+        Path of the binary file to write.
+    """
+    with open(file_path, "wb") as f:
+        f.writelines(_encode_verse_texts(verse_texts))
+
+
+def load_verse_text_store(file_location: str) -> VerseTextStore:
+    """Load verse texts written by :func:`write_verse_text_store`.
+
+    The file is memory-mapped when possible, so that loading does not read
+    or decode any verse texts.
+
+    Parameters
+    ----------
+    file_location
+        The location of the file, resolved as in
+        :func:`bibletools.read_file_as_string`.
+
+    Returns
+    -------
+    VerseTextStore
+        Read-only mapping of verse IDs to their texts.
+    """
+    with open_file_as_binary(file_location) as f:
+        try:
+            buffer: bytes | mmap.mmap = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except (AttributeError, OSError, ValueError):
+            buffer = f.read()
+    return VerseTextStore(buffer)
@@ -0,0 +1,119 @@
+"""Verse weights as arrays aligned to the canonical order of verse IDs."""
+
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ._verse_counts import get_verse_count_store
+from ._verse_index import _find_ordinals, get_verse_id_array
+
+
+class VerseWeights:
+    """Weights for all verses in the canonical order of verse IDs.
+
+    Unlike a mapping of stringified verse IDs to weights, the weights are held
+    in a single read-only NumPy array, so that looking up the weights of many
+    verses is one vectorized operation.
+
+    Parameters
+    ----------
+    weights
+        Weight of each verse, in the same order as
+        :func:`bibletools.get_all_verse_ids`.
+
+    Raises
+    ------
+    ValueError
+        If the number of weights does not match the number of verses.
+    """
+
+    __slots__ = ("_weights",)
+
+    def __init__(self, weights: ArrayLike) -> None:
+        self._weights = np.array(weights, dtype=np.float64)
+        if self._weights.shape != get_verse_id_array().shape:
+            raise ValueError(
+                f"Expected {len(get_verse_id_array())} weights, got "
+                f"array of shape {self._weights.shape}."
+            )
+        self._weights.flags.writeable = False
+
+    @classmethod
+    def from_mapping(
+        cls, verse_weights: Mapping[str, int | float] | Mapping[int, float]
+    ) -> "VerseWeights":
+        """Convert a mapping of verse IDs to weights.
+
+        Parameters
+        ----------
+        verse_weights
+            Mapping of verse IDs, as strings or integers, to their weights.
+            Keys that are not verse IDs, such as ``"total"``, are ignored.
+
+        Returns
+        -------
+        VerseWeights
+            Weights for all verses, with 0 for verses not in the mapping.
+        """
+        items = [
+            (int(vid), weight)
+            for vid, weight in verse_weights.items()
+            if isinstance(vid, int) or vid.isdigit()
+        ]
+        weights = np.zeros(len(get_verse_id_array()))
+        if items:
+            verse_ids, values = zip(*items, strict=True)
+            ordinals, found = _find_ordinals(verse_ids)
+            weights[ordinals[found]] = np.asarray(values)[found]
+        return cls(weights)
+
+    @classmethod
+    def from_verse_counts(cls, author: str = "total") -> "VerseWeights":
+        """Create weights from the verse counts of an author.
+
+        Parameters
+        ----------
+        author
+            Author name to retrieve counts for. Defaults to total counts.
+
+        Returns
+        -------
+        VerseWeights
+            Weights equal to the verse counts of the author.
+        """
+        return cls.from_mapping(get_verse_count_store()[author])
+
+    @property
+    def array(self) -> np.ndarray:
+        """Read-only array of weights in canonical verse ID order."""
+        return self._weights
+
+    @property
+    def verse_ids(self) -> np.ndarray:
+        """Read-only array of verse IDs in canonical order."""
+        return get_verse_id_array()
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def get(self, verse_id: int, default: float = 0) -> float:
+        """Return the weight of a verse ID, or a default if it is invalid."""
+        ordinals, found = _find_ordinals([verse_id])
+        return float(self._weights[ordinals[0]]) if found[0] else default
+
+    def take(self, verse_ids: Iterable[int]) -> np.ndarray:
+        """Return the weights of the given verse IDs.
+
+        Parameters
+        ----------
+        verse_ids
+            Verse IDs to retrieve weights for.
+
+        Returns
+        -------
+        numpy.ndarray
+            Weights of the verse IDs, with 0 for invalid verse IDs.
+        """
+        ordinals, found = _find_ordinals(verse_ids)
+        return np.where(found, self._weights[ordinals], 0.0)
@@ -0,0 +1,82 @@
+"""Benchmark the normalization of texts before parsing references."""
+
+import re
+import timeit
+from collections.abc import Callable
+
+import pythonbible as pb
+
+from bibletools._parse_references import (
+    _CHARACTER_REPLACEMENTS,
+    _DASH_VARIANTS,
+    _normalize_reference_text,
+)
+
+TEXTS = {
+    "ascii": (
+        "In the beginning was the Word, and the Word was with God; "
+        "see John 1:1-3; 14 and Romans 8:28. "
+    ),
+    "unicode": (
+        "As we read in John 1:2\u20133, 5\u20136; 7:8\u20139 and "
+        "Romans\u00A08:28, grace abounds (see Job 1:6 ; 2:6\u20147). "
+    ),
+}
+SIZE = 1_000_000
+
+_TRANSLATION_TABLE = str.maketrans(_CHARACTER_REPLACEMENTS)
+_SINGLE_PASS_PATTERN = re.compile(
+    "[;\uFF1B](?=\\s*\\d)|["
+    + re.escape("".join(_CHARACTER_REPLACEMENTS))
+    + "]"
+)
+
+
+def normalize_separately(text: str) -> str:
+    """Normalize a text as before the replacement table, as a baseline."""
+    for variant in _DASH_VARIANTS:
+        text = text.replace(variant, "-")
+    return re.sub(r";(?=\s*\d)", ",", text)
+
+
+def normalize_with_translate(text: str) -> str:
+    """Normalize a text with a translation table and a precompiled pattern."""
+    return re.sub(r";(?=\s*\d)", ",", text.translate(_TRANSLATION_TABLE))
+
+
+def normalize_in_single_pass(text: str) -> str:
+    """Normalize a text with one pattern and a replacement per match."""
+    return _SINGLE_PASS_PATTERN.sub(
+        lambda match: _CHARACTER_REPLACEMENTS.get(match.group(), ","), text
+    )
+
+
+def get_throughput(function: Callable[[str], object], text: str) -> float:
+    """Return the throughput of a function on a text in MB/s."""
+    number = 5
+    seconds = min(timeit.repeat(lambda: function(text), number=number))
+    return len(text) * number / seconds / 1e6
+
+
+def main() -> None:
+    """Print the throughput of each normalizer on large texts."""
+    functions = {
+        "separate": normalize_separately,
+        "translate": normalize_with_translate,
+        "single-pass": normalize_in_single_pass,
+        "table": _normalize_reference_text,
+    }
+    for name, sentence in TEXTS.items():
+        text = sentence * (SIZE // len(sentence))
+        print(f"{name} text of {len(text):,} characters")
+        for function_name, function in functions.items():
+            throughput = get_throughput(function, text)
+            print(f"  {function_name:<12} {throughput:8.1f} MB/s")
+
+        size = SIZE // 100
+        throughput = get_throughput(pb.get_references, text[:size])
+        print(f"  {'parse':<12} {throughput:8.1f} MB/s (for reference)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark the latency of searching verse texts."""
+
+import itertools
+import string
+import timeit
+
+import numpy as np
+
+from bibletools._verse_index import get_canonical_verse_ids
+from bibletools._verse_search import VerseSearchIndex
+
+# Queries by name, with whether the last word is matched as a prefix
+QUERIES = {
+    "word": ("grace", False),
+    "frequent word": ("the", False),
+    "words": ("lord god", False),
+    "phrase": ('"the lord"', False),
+    "prefix": ("gra*", False),
+    "typed prefix": ("gra", True),
+    "typed words": ("faith gr", True),
+}
+WORDS = ["the", "and", "of", "lord", "god", "shall", "faith", "grace"]
+N_WORDS = 13_000
+
+# Frequencies of the letters in English texts, from a to z
+LETTERS = np.array(
+    [
+        8.2,
+        1.5,
+        2.8,
+        4.3,
+        12.7,
+        2.2,
+        2.0,
+        6.1,
+        7.0,
+        0.15,
+        0.77,
+        4.0,
+        2.4,
+        6.7,
+        7.5,
+        1.9,
+        0.095,
+        6.0,
+        6.3,
+        9.1,
+        2.8,
+        0.98,
+        2.4,
+        0.15,
+        2.0,
+        0.074,
+    ]
+)
+
+
+def make_verse_text_map(seed: int = 0) -> dict[int, str]:
+    """Return random texts of all verses with the size of a whole Bible.
+
+    Words are made of letters drawn with their frequencies in English, and
+    drawn with frequencies following Zipf's law, shorter words first, so
+    that short prefixes expand to many frequent words as in English.
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.array(list(string.ascii_lowercase))
+    random_words = sorted(
+        {
+            "".join(
+                rng.choice(
+                    letters, rng.integers(2, 10), p=LETTERS / LETTERS.sum()
+                )
+            )
+            for _ in range(N_WORDS)
+        },
+        key=len,
+    )
+    vocabulary = np.array(WORDS + random_words)
+    frequencies = 1 / np.arange(1, len(vocabulary) + 1)
+    frequencies /= frequencies.sum()
+    return {
+        verse_id: " ".join(
+            rng.choice(vocabulary, rng.integers(10, 45), p=frequencies)
+        )
+        for verse_id in get_canonical_verse_ids()
+    }
+
+
+def get_latency(
+    index: VerseSearchIndex, query: str, prefix_last: bool = False
+) -> float:
+    """Return the latency of a query in milliseconds."""
+    number = 20
+    seconds = min(
+        timeit.repeat(
+            lambda: index.search(query, prefix_last=prefix_last),
+            number=number,
+        )
+    )
+    return seconds / number * 1e3
+
+
+def main() -> None:
+    """Print the latency of queries on an index of a whole Bible."""
+    index = VerseSearchIndex.from_verse_text_map(make_verse_text_map())
+    for name, (query, prefix_last) in QUERIES.items():
+        latency = get_latency(index, query, prefix_last)
+        print(f"{name:<14} {query!r:<12} {latency:6.3f} ms")
+
+    # Complete every one and two letter prefix, as when typing a word
+    for length in (1, 2):
+        latencies = [
+            get_latency(index, "faith " + "".join(prefix), prefix_last=True)
+            for prefix in itertools.product(
+                string.ascii_lowercase, repeat=length
+            )
+        ]
+        print(
+            f"{length}-letter prefixes after a word: "
+            f"median {np.median(latencies):.3f} ms, "
+            f"max {max(latencies):.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,32 @@
 import importlib.resources
 import json
 import pathlib
+import time
 
-from pythonbible import convert_references_to_verse_ids, get_references
+from pythonbible import Book, get_references
 
+from bibletools import get_verse_ordinals, write_verse_counts_binary
 
-def make_verse_counts_by_author_and_id():
+DATA_DIR = pathlib.Path(__file__).parent.parent / "bibletools" / "data"
+
+
+def get_book(book_name: str) -> Book | None:
+    """Resolve a book name as it would be parsed in a reference."""
+    references = get_references(f"{book_name} 1:1")
+    return references[0].book if references else None
+
+
+def make_verse_counts_by_author_and_id():  # pylint: disable=too-many-locals
     """Make verse counts by author and verse ID.
 
     Function to convert verse counts by verse and author to verse counts by
-    author and verse ID.
+    author and verse ID. Each book name is resolved once, and verse IDs are
+    computed arithmetically from the book, chapter and verse numbers.
+
+    Returns
+    -------
+    dict
+        Verse counts by author and verse ID, as written to the JSON file.
     """
     # Input structure:
     # {
@@ -31,21 +48,20 @@ def make_verse_counts_by_author_and_id():
         verse_counts = json.load(f)
 
     verse_counts_by_author = {}
+    valid_verse_ids = get_verse_ordinals()
 
-    for book in verse_counts.keys():
-        for chapter in verse_counts[book].keys():
-            for verse in verse_counts[book][chapter].keys():
-                verse_ids = convert_references_to_verse_ids(
-                    get_references(f"{book} {chapter}:{verse}")
-                )
-                if len(verse_ids) < 1:
+    for book_name, chapters in verse_counts.items():
+        book = get_book(book_name)
+        if book is None:
+            continue  # Skip book that does not exist
+        for chapter, verses in chapters.items():
+            for verse, counts_by_author in verses.items():
+                verse_id = book.value * 1_000_000 + int(chapter) * 1000
+                verse_id += int(verse)
+                if verse_id not in valid_verse_ids:
                     continue  # Skip verse that does not exist
-                if len(verse_ids) > 1:
-                    print("here")
-                verse_id = verse_ids[0]
 
-                for author in verse_counts[book][chapter][verse].keys():
-                    count = verse_counts[book][chapter][verse][author]
+                for author, count in counts_by_author.items():
                     author_ = "total" if author == "count" else author
 
                     if author_ not in verse_counts_by_author:
@@ -85,15 +101,43 @@ def make_verse_counts_by_author_and_id():
     #   },
     #   ...
     # }
-    output_path = (
-        pathlib.Path(__file__).parent.parent
-        / "bibletools"
-        / "data"
-        / "verse-counts-by-author-and-id.json"
-    )
+    output_path = DATA_DIR / "verse-counts-by-author-and-id.json"
     with output_path.open("w", encoding="utf-8") as out_f:
         json.dump(verse_counts_by_author, out_f, ensure_ascii=False, indent=2)
 
+    return verse_counts_by_author
+
+
+def make_verse_counts_binary(verse_counts_by_author=None):
+    """Make the binary companion of verse counts by author and verse ID.
+
+    The binary file holds the same data as the JSON file, with an author
+    offset index followed by packed (verse_id, count) pairs so that the counts
+    of a single author can be read without parsing those of the others.
+
+    Parameters
+    ----------
+    verse_counts_by_author
+        Verse counts returned by :func:`make_verse_counts_by_author_and_id`.
+        If ``None``, they are read from the JSON file.
+    """
+    if verse_counts_by_author is None:
+        with (DATA_DIR / "verse-counts-by-author-and-id.json").open(
+            "r", encoding="utf-8"
+        ) as f:
+            verse_counts_by_author = json.load(f)
+
+    write_verse_counts_binary(
+        verse_counts_by_author,
+        DATA_DIR / "verse-counts-by-author-and-id.bin",
+    )
+
 
 if __name__ == "__main__":
-    make_verse_counts_by_author_and_id()
+    start_time = time.perf_counter()
+    verse_counts_by_author_and_id = make_verse_counts_by_author_and_id()
+    print(f"Made JSON in {time.perf_counter() - start_time:.2f} s")
+
+    start_time = time.perf_counter()
+    make_verse_counts_binary(verse_counts_by_author_and_id)
+    print(f"Made binary in {time.perf_counter() - start_time:.2f} s")
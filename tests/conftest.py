@@ -3,6 +3,7 @@
 import pytest
 
 from bibletools._utils import read_file_as_string
+from bibletools._verse_index import get_canonical_verse_ids
 from bibletools._verse_text_map import parse_xml_to_verse_text_map
 
 VERSE_TEXTS = {
@@ -21,9 +22,58 @@ VERSE_TEXTS = {
     ),
 }
 
+XML = """<?xml version="1.0" encoding="utf-8"?>
+<bible>
+  <b n="Genesis">
+    <c n="1">
+      <v n="1">In the beginning God created the heaven and the earth.</v>
+      <v n="2"> And the earth was without form, and void; </v>
+    </c>
+  </b>
+  <b n="Jude">
+    <c n="1">
+      <v n="3">Beloved,</v>
+      <v n="4"/>
+    </c>
+  </b>
+</bible>
+"""
+
+TESTAMENT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<bible translation="Test">
+  <testament name="Old">
+    <book number="Genesis">
+      <chapter number="1">
+        <verse number="1">In the beginning God created the heaven.</verse>
+      </chapter>
+    </book>
+  </testament>
+  <testament name="New">
+    <book number="Jude">
+      <chapter number="1">
+        <verse number="3">Beloved,</verse>
+      </chapter>
+    </book>
+  </testament>
+</bible>
+"""
+
+TESTAMENT_SPECS = {
+    "testament_path": "testament",
+    "book_spec": ("book", "number"),
+    "chapter_spec": ("chapter", "number"),
+    "verse_spec": ("./verse", "number"),
+}
+
 
 @pytest.fixture(scope="session", name="verse_text_map")
 def fixture_verse_text_map():
     """Return the KJV Bible XML as a nested dictionary."""
     xml = read_file_as_string(file_location="KJV.xml")
     return parse_xml_to_verse_text_map(xml=xml)
+
+
+@pytest.fixture(scope="session", name="placeholder_verse_text_map")
+def fixture_placeholder_verse_text_map():
+    """Return a verse text map with a placeholder text for every verse."""
+    return {vid: f"<{vid}>" for vid in get_canonical_verse_ids()}
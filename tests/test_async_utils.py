@@ -0,0 +1,162 @@
+"""Test asynchronous utilities module."""
+
+import asyncio
+import functools
+import http.server
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from bibletools._async_utils import (
+    download_file_async,
+    iter_file_chunks_async,
+    read_file_as_string_async,
+    read_files_as_strings_async,
+)
+
+XML = '<?xml version="1.0"?><bible><b n="Jude">Beloved,</b></bible>'
+
+
+class SlowRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Request handler that delays responses to paths starting with /slow."""
+
+    def do_GET(self):
+        """Respond to a GET request, after a delay for slow paths."""
+        if self.path.startswith("/slow"):
+            time.sleep(1)
+        super().do_GET()
+
+    def log_message(self, format, *args):  # pylint: disable=W0622
+        """Do not log requests."""
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url(tmp_path):
+    """Serve files in a temporary directory over HTTP and return its URL."""
+    (tmp_path / "bible.xml").write_text(XML, encoding="utf-8")
+    (tmp_path / "large.txt").write_bytes(b"x" * 200_000)
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        functools.partial(SlowRequestHandler, directory=str(tmp_path)),
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_read_file_as_string_async(server_url, tmp_path):
+    """Test that URLs, file paths and package resources are read."""
+    assert asyncio.run(read_file_as_string_async(f"{server_url}/bible.xml"))
+    assert (
+        asyncio.run(read_file_as_string_async(str(tmp_path / "bible.xml")))
+        == XML
+    )
+    text = asyncio.run(
+        read_file_as_string_async("verse-counts-by-author-and-id.json")
+    )
+    assert text.startswith("{")
+
+    with pytest.raises(FileNotFoundError, match="Unable to read file:"):
+        asyncio.run(read_file_as_string_async("non_existent_file.xml"))
+
+
+def test_read_files_as_strings_async_concurrently(server_url):
+    """Test that files are read concurrently, in the given order."""
+    file_locations = [f"{server_url}/slow/../bible.xml"] * 4 + [
+        f"{server_url}/large.txt"
+    ]
+    start_time = time.perf_counter()
+    texts = asyncio.run(read_files_as_strings_async(file_locations))
+    assert time.perf_counter() - start_time < 3
+    assert texts == [XML] * 4 + ["x" * 200_000]
+
+
+def test_error_if_read_file_as_string_async_times_out(server_url):
+    """Test that a TimeoutError is raised for a slow response."""
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            read_file_as_string_async(
+                f"{server_url}/slow/../bible.xml", timeout=0.1
+            )
+        )
+
+
+def test_iter_file_chunks_async_closes_file_opened_after_timeout(
+    monkeypatch, tmp_path
+):
+    """Test that a file opened by a worker thread after a timeout is
+    closed."""
+    file_path = tmp_path / "bible.xml"
+    file_path.write_text(XML, encoding="utf-8")
+    opened_files = []
+
+    def open_slowly(file_location, _timeout=None):
+        time.sleep(0.3)
+        # pylint: disable-next=consider-using-with
+        f = open(file_location, "rb")
+        opened_files.append(f)
+        return f
+
+    monkeypatch.setattr(
+        "bibletools._async_utils.open_file_as_binary", open_slowly
+    )
+
+    async def read_until_timeout():
+        with pytest.raises(TimeoutError):
+            async for _ in iter_file_chunks_async(str(file_path), timeout=0.1):
+                pass
+        await asyncio.sleep(0.5)  # Wait for the worker thread to open it
+
+    asyncio.run(read_until_timeout())
+    assert len(opened_files) == 1
+    assert opened_files[0].closed
+
+
+def test_iter_file_chunks_async_to_parser(server_url):
+    """Test that chunks of a file can be fed to a parser incrementally."""
+
+    async def parse():
+        parser = ET.XMLPullParser()
+        async for chunk in iter_file_chunks_async(
+            f"{server_url}/bible.xml", chunk_size=8
+        ):
+            assert len(chunk) <= 8
+            parser.feed(chunk)
+        parser.close()
+        return [element.text for _, element in parser.read_events()]
+
+    assert asyncio.run(parse()) == ["Beloved,", None]
+
+
+def test_download_file_async(server_url, tmp_path):
+    """Test that a file is streamed to disk."""
+    file_path = tmp_path / "downloads" / "large.txt"
+    file_path.parent.mkdir()
+    assert (
+        asyncio.run(download_file_async(f"{server_url}/large.txt", file_path))
+        == file_path
+    )
+    assert file_path.read_bytes() == b"x" * 200_000
+    assert list(file_path.parent.iterdir()) == [file_path]
+
+
+def test_download_file_async_concurrently(server_url, tmp_path):
+    """Test that concurrent downloads to the same path do not corrupt it."""
+    file_path = tmp_path / "downloads" / "large.txt"
+    file_path.parent.mkdir()
+
+    async def download():
+        return await asyncio.gather(
+            *(
+                download_file_async(f"{server_url}/large.txt", file_path)
+                for _ in range(4)
+            )
+        )
+
+    assert asyncio.run(download()) == [file_path] * 4
+    assert file_path.read_bytes() == b"x" * 200_000
+    assert list(file_path.parent.iterdir()) == [file_path]
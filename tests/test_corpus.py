@@ -0,0 +1,62 @@
+"""Test corpus module."""
+
+import pytest
+
+from bibletools._corpus import iter_parse_references
+from bibletools._parse_references import parse_references
+
+DOCUMENTS = [
+    "note on 1 John 3:20",
+    "Job 1:6 , 12 , 21-22 ; 2:6-7",
+    "no references here",
+    "Romans 16:20 1 Corinthians 1:3",
+    "Phil 4:11-13",
+]
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+@pytest.mark.parametrize("chunksize", [1, 2, 16])
+def test_iter_parse_references(n_workers, chunksize):
+    """Test that iter_parse_references yields the references of each
+    document in order, identified by position."""
+    results = list(
+        iter_parse_references(
+            iter(DOCUMENTS), n_workers=n_workers, chunksize=chunksize
+        )
+    )
+    assert results == [
+        (i, parse_references(text)) for i, text in enumerate(DOCUMENTS)
+    ]
+
+
+def test_iter_parse_references_unordered_with_files(tmp_path):
+    """Test that iter_parse_references reads file paths and keeps given
+    document IDs when results are yielded as they complete."""
+    paths = []
+    for i, text in enumerate(DOCUMENTS):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    documents = [*paths, ("extra", "Jude 3-4")]
+
+    results = dict(
+        iter_parse_references(
+            documents, n_workers=2, chunksize=2, ordered=False
+        )
+    )
+    assert results == {
+        **{
+            path: parse_references(text)
+            for path, text in zip(paths, DOCUMENTS, strict=True)
+        },
+        "extra": parse_references("Jude 3-4"),
+    }
+
+
+def test_error_if_iter_parse_references_with_invalid_arguments():
+    """Test that iter_parse_references raises a ValueError for invalid
+    numbers of workers and chunk sizes."""
+    with pytest.raises(ValueError, match="workers"):
+        next(iter_parse_references(DOCUMENTS, n_workers=0))
+    with pytest.raises(ValueError, match="Chunk size"):
+        next(iter_parse_references(DOCUMENTS, chunksize=0))
@@ -1,17 +1,27 @@
 """Test the get_verses module."""
 
+import random
 import re
 
 import numpy as np
 import pytest
+from pythonbible import (
+    Book,
+    NormalizedReference,
+    convert_references_to_verse_ids,
+)
 
 from bibletools._get_verses import (
     get_all_verse_ids,
     get_highest_weighted_verse,
+    get_highest_weighted_verses,
     get_random_verse_id,
     get_random_verse_ids,
+    get_top_verses,
     load_verse_counts,
 )
+from bibletools._parse_references import parse_references
+from bibletools._verse_weights import VerseWeights
 
 
 @pytest.fixture(scope="module", name="total_verse_counts")
@@ -144,6 +154,13 @@ def test_get_default_highest_weighted_verse():
     assert get_highest_weighted_verse() == 45008028
 
 
+def test_error_if_get_highest_weighted_verse_without_verse_ids():
+    """Test that get_highest_weighted_verse() raises a ValueError when there
+    are no verse IDs to choose from."""
+    with pytest.raises(ValueError, match="No verse IDs"):
+        get_highest_weighted_verse(verse_ids=[])
+
+
 def test_error_if_get_highest_weighted_verse_with_invalid_verse_id():
     """Test that get_highest_weighted_verse() raises a ValueError when an
     invalid verse ID is given."""
@@ -155,3 +172,228 @@ def test_error_if_get_highest_weighted_verse_with_invalid_verse_id():
         get_highest_weighted_verse(
             verse_ids=verse_ids, verse_weights=verse_weights
         )
+
+
+@pytest.mark.parametrize("pad_weight", [0, 10])
+def test_get_random_verse_ids_with_verse_weights(pad_weight):
+    """Test that get_random_verse_ids() accepts VerseWeights and returns the
+    same expected proportion as with a mapping of weights."""
+    verse_ids = [20016033, 19119071]
+    verse_weights = VerseWeights.from_mapping({"20016033": 7})
+    random_verse_ids = get_random_verse_ids(
+        n_verses=10000,
+        verse_ids=verse_ids,
+        verse_weights=verse_weights,
+        pad_weight=pad_weight,
+    )
+    expected_proportion = (7 + pad_weight) / (7 + pad_weight * len(verse_ids))
+    actual_proportion = np.mean(np.array(random_verse_ids) == 20016033)
+    assert np.isclose(actual_proportion, expected_proportion, atol=0.015)
+
+
+def test_get_random_verse_ids_from_all_verses_with_verse_weights():
+    """Test that get_random_verse_ids() only returns verses with positive
+    VerseWeights when there is no pad weight."""
+    verse_weights = VerseWeights.from_mapping({"43003016": 1, "45008028": 1})
+    random_verse_ids = get_random_verse_ids(
+        n_verses=100, verse_weights=verse_weights, pad_weight=0
+    )
+    assert set(random_verse_ids) <= {43003016, 45008028}
+
+
+@pytest.mark.parametrize(
+    "verse_weights",
+    [
+        None,
+        {"45008028": 100},
+        VerseWeights.from_mapping({"45008028": 100}),
+    ],
+)
+def test_get_random_verse_ids_from_references(verse_weights):
+    """Test that get_random_verse_ids() only returns verses in references
+    with weights or without."""
+    references = parse_references("Romans 8 and Psalms 1-50")
+    random_verse_ids = get_random_verse_ids(
+        n_verses=1000, verse_weights=verse_weights, references=references
+    )
+    assert all(
+        45008001 <= vid <= 45008039 or 19001001 <= vid <= 19050023
+        for vid in random_verse_ids
+    )
+    assert (
+        get_random_verse_id(
+            verse_weights=verse_weights,
+            pad_weight=0 if verse_weights else 1,
+            references=parse_references("Romans 8:28"),
+        )
+        == 45008028
+    )
+
+
+@pytest.mark.parametrize(
+    "verse_weights",
+    [
+        None,
+        {"45008028": 1e9, "43003016": 1e9},
+        VerseWeights.from_mapping({"45008028": 1e9, "43003016": 1e9}),
+    ],
+)
+def test_get_random_verse_ids_without_replacement(verse_weights):
+    """Test that get_random_verse_ids() returns distinct verse IDs without
+    replacement, with the heaviest verses drawn first."""
+    random_verse_ids = get_random_verse_ids(
+        n_verses=1000, verse_weights=verse_weights, replace=False
+    )
+    assert len(set(random_verse_ids)) == 1000
+    if verse_weights is not None:
+        assert set(random_verse_ids[:2]) == {45008028, 43003016}
+
+
+def test_get_random_verse_ids_without_replacement_from_verse_ids():
+    """Test that get_random_verse_ids() adds the weights of duplicate verse
+    IDs without replacement."""
+    verse_ids = [20016033, 19119071, 20016033]
+    first_verse_ids = []
+    for _ in range(3000):
+        random_verse_ids = get_random_verse_ids(
+            n_verses=2, verse_ids=verse_ids, replace=False
+        )
+        assert sorted(random_verse_ids) == [19119071, 20016033]
+        first_verse_ids.append(random_verse_ids[0])
+    actual_proportion = np.mean(np.array(first_verse_ids) == 20016033)
+    assert np.isclose(actual_proportion, 2 / 3, atol=0.03)
+
+
+def test_get_random_verse_ids_without_replacement_is_seeded():
+    """Test that get_random_verse_ids() without replacement draws from the
+    state of the random module."""
+    draws = []
+    for _ in range(2):
+        random.seed(7)
+        draws.append(get_random_verse_ids(n_verses=50, replace=False))
+    assert draws[0] == draws[1]
+
+
+def test_error_if_get_random_verse_ids_without_replacement_too_many():
+    """Test that get_random_verse_ids() raises a ValueError when there are
+    not enough verse IDs with positive weights to draw without
+    replacement."""
+    with pytest.raises(ValueError, match="Cannot draw 2 distinct verse IDs"):
+        get_random_verse_ids(
+            n_verses=2,
+            verse_ids=[20016033, 19119071],
+            verse_weights={"19119071": 1},
+            pad_weight=0,
+            replace=False,
+        )
+
+
+def test_error_if_get_random_verse_ids_with_verse_ids_and_references():
+    """Test that get_random_verse_ids() raises a ValueError when both verse
+    IDs and references are given."""
+    with pytest.raises(ValueError, match="Only one of"):
+        get_random_verse_ids(
+            verse_ids=[45008028], references=parse_references("Romans 8")
+        )
+
+
+def test_get_highest_weighted_verse_with_verse_weights():
+    """Test that get_highest_weighted_verse() accepts VerseWeights."""
+    assert (
+        get_highest_weighted_verse(
+            verse_weights=VerseWeights.from_verse_counts()
+        )
+        == 45008028
+    )
+    verse_weights = VerseWeights.from_mapping({"20016033": 5, "19119071": 10})
+    assert (
+        get_highest_weighted_verse(
+            verse_ids=[20016033, 19119071, 2023013],
+            verse_weights=verse_weights,
+        )
+        == 19119071
+    )
+
+
+def test_get_top_verses(total_verse_counts):
+    """Test that get_top_verses() returns the most cited verses with their
+    counts in ranked order."""
+    top_verses = get_top_verses(n_verses=5)
+    assert len(top_verses) == 5
+    assert top_verses[0] == (45008028, 725)
+    for verse_id, count in top_verses:
+        assert total_verse_counts[str(verse_id)] == count
+    assert [count for _, count in top_verses] == sorted(
+        (count for vid, count in total_verse_counts.items() if vid != "total"),
+        reverse=True,
+    )[:5]
+
+
+def test_get_top_verses_for_author_and_references():
+    """Test that get_top_verses() restricts verses to an author and to
+    references such as books or verse ranges."""
+    verse_counts = load_verse_counts("R.C. Sproul")
+    top_verses = get_top_verses(n_verses=1000, author="R.C. Sproul")
+    assert sum(count for _, count in top_verses) == verse_counts["total"]
+
+    top_verses = get_top_verses(
+        n_verses=3, references=[NormalizedReference(book=Book.ROMANS)]
+    )
+    assert top_verses[0] == (45008028, 725)
+    assert all(vid // 1_000_000 == 45 for vid, _ in top_verses)
+
+    top_verses = get_top_verses(
+        n_verses=1000, references=parse_references("Psalm 23; John 3:16-17")
+    )
+    assert {vid for vid, _ in top_verses} <= set(range(19023001, 19023007)) | {
+        43003016,
+        43003017,
+    }
+    assert (43003016, 468) in top_verses
+
+
+@pytest.mark.parametrize(
+    "text", ["Romans 8; Romans 8:28-39; Psalm 23", "Genesis 1:1", ""]
+)
+def test_get_top_verses_for_references_matches_ranking(text):
+    """Test that get_top_verses() with references, including overlapping
+    ones, returns the head of the ranking restricted to the references."""
+    references = parse_references(text)
+    verse_ids = set(convert_references_to_verse_ids(references))
+    expected = [
+        (vid, count)
+        for vid, count in get_top_verses(n_verses=50_000)
+        if vid in verse_ids
+    ]
+    for n_verses in (1, 5, 50_000):
+        assert (
+            get_top_verses(n_verses=n_verses, references=references)
+            == expected[:n_verses]
+        )
+
+
+def test_get_highest_weighted_verses():
+    """Test that get_highest_weighted_verses() returns verse IDs ranked by
+    weight, with ties in the order of the given verse IDs."""
+    verse_ids = [20016033, 19119071, 2023013, 7011019]
+    verse_weights = {"20016033": 5, "19119071": 10, "2023013": 5}
+    assert get_highest_weighted_verses(
+        n_verses=3, verse_ids=verse_ids, verse_weights=verse_weights
+    ) == [19119071, 20016033, 2023013]
+    assert get_highest_weighted_verses(
+        n_verses=10,
+        verse_ids=verse_ids,
+        verse_weights=VerseWeights.from_mapping(verse_weights),
+    ) == [19119071, 20016033, 2023013, 7011019]
+    assert not get_highest_weighted_verses(n_verses=0, verse_ids=verse_ids)
+
+
+def test_get_default_highest_weighted_verses():
+    """Test that get_highest_weighted_verses() by default matches the ranking
+    of total verse counts."""
+    assert get_highest_weighted_verses(n_verses=5) == [
+        vid for vid, _ in get_top_verses(n_verses=5)
+    ]
+    assert get_highest_weighted_verses(
+        n_verses=5, verse_weights=load_verse_counts()
+    ) == [vid for vid, _ in get_top_verses(n_verses=5)]
@@ -0,0 +1,56 @@
+"""Test package module."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import bibletools
+
+# Maximum cumulative import time of the package in microseconds, well above
+# its time when dependencies are imported lazily
+MAX_IMPORT_TIME_US = 100_000
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    """Return the cumulative import time of each module imported by code."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, module = line.split("|")
+            import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_public_names_are_resolved_lazily():
+    """Test that all public names resolve to the objects of submodules."""
+    for name in bibletools.__all__:
+        value = getattr(bibletools, name)
+        module = importlib.import_module(value.__module__)
+        assert module.__name__.startswith("bibletools._")
+        assert getattr(module, name) is value
+        assert name in dir(bibletools)
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = bibletools.no_such_name
+
+
+def test_import_does_not_import_dependencies():
+    """Test that importing the package does not import its dependencies,
+    and that parse_references does not import unrelated ones."""
+    import_times = get_import_times("import bibletools")
+    assert import_times["bibletools"] < MAX_IMPORT_TIME_US
+    for module in ["numpy", "pythonbible", "urllib.request", "xml.etree"]:
+        assert module not in import_times
+
+    import_times = get_import_times("from bibletools import parse_references")
+    assert "pythonbible" in import_times
+    for module in ["numpy", "urllib.request", "xml.etree"]:
+        assert module not in import_times
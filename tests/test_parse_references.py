@@ -3,7 +3,12 @@
 import pytest
 import pythonbible as pb
 
-from bibletools._parse_references import parse_references
+from bibletools._parse_references import (
+    _DASH_VARIANTS,
+    CachedReferenceParser,
+    _normalize_reference_text,
+    parse_references,
+)
 
 TEXT_EXPECTED_CASES = [
     (
@@ -86,6 +91,11 @@ TEXT_EXPECTED_CASES = [
         "John 1:2–3, 5–6; 7:8–9",  # noqa: RUF001
         "John 1:2-3,5-6,7:8-9",
     ),
+    (
+        # Contains no-break space and fullwidth colon and semicolon
+        "John\u00a03\uff1a16\uff1b 4\uff1a1\u20132",
+        "John 3:16,4:1-2",
+    ),
 ]
 
 
@@ -147,3 +157,43 @@ def test_parse_references_failures(text, expected):
     parsed = parse_references(text)
     formatted = pb.format_scripture_references(parsed)
     assert formatted == expected
+
+
+def test_normalize_reference_text():
+    """Test that the normalizer replaces dash variants, non-contiguous
+    verse separators, no-break spaces and fullwidth punctuation."""
+    text = "Job 1:6 ; 2:6" + "".join(
+        f" Romans 1:{i}{dash}{i + 1};" for i, dash in enumerate(_DASH_VARIANTS)
+    )
+    assert _normalize_reference_text(text) == "Job 1:6 , 2:6" + "".join(
+        f" Romans 1:{i}-{i + 1};" for i in range(len(_DASH_VARIANTS))
+    )
+    assert _normalize_reference_text("John 3:16; 4:1") == "John 3:16, 4:1"
+    assert _normalize_reference_text("John 3:16") == "John 3:16"
+    assert (
+        _normalize_reference_text("Ps\u00a023\uff1a1\uff0c 3") == "Ps 23:1, 3"
+    )
+
+
+def test_cached_reference_parser():
+    """Test that CachedReferenceParser returns the same references as
+    parse_references, and counts hits and misses of the cache."""
+    parser = CachedReferenceParser(maxsize=2)
+    for text in ["John 3:16", "Rom 8:28", "John 3:16", "Jude 3-4"]:
+        assert parser(text) == tuple(parse_references(text))
+
+    cache_info = parser.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 3)
+    assert (cache_info.maxsize, cache_info.currsize) == (2, 2)
+
+    parser.cache_clear()
+    assert parser.cache_info().currsize == 0
+
+
+def test_cached_reference_parser_returns_copies():
+    """Test that modifying returned references does not affect the cache."""
+    parser = CachedReferenceParser()
+    references = parser("John 3:16")
+    references[0].start_verse = 1
+    assert parser("John 3:16") == tuple(parse_references("John 3:16"))
+    assert parser("John 3:16")[0] is not parser("John 3:16")[0]
@@ -0,0 +1,75 @@
+"""Test translation corpus module."""
+
+import numpy as np
+import pytest
+from pythonbible import get_references
+
+from bibletools._translation_corpus import TranslationCorpus
+from bibletools._verse_text_map import (
+    convert_reference_to_verse_text,
+    parse_xml_to_verse_text_map,
+)
+from tests.conftest import TESTAMENT_SPECS, TESTAMENT_XML, XML
+
+
+@pytest.fixture(name="file_locations")
+def fixture_file_locations(tmp_path):
+    """Write translation XML files in two formats and return their paths."""
+    (tmp_path / "a.xml").write_text(XML, encoding="utf-8")
+    (tmp_path / "b.xml").write_text(TESTAMENT_XML, encoding="utf-8")
+    return {"A": str(tmp_path / "a.xml"), "B": str(tmp_path / "b.xml")}
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_translation_corpus_from_files(file_locations, n_workers):
+    """Test that translations are loaded into aligned columns."""
+    corpus = TranslationCorpus.from_files(
+        file_locations, xml_specs={"B": TESTAMENT_SPECS}, n_workers=n_workers
+    )
+    assert corpus.translations == ("A", "B")
+    assert len(corpus) == 2
+    assert corpus.texts.shape == (31102, 2)
+    assert not corpus.texts.flags.writeable
+
+    assert corpus.get_verse_texts(1001001) == {
+        "A": "In the beginning God created the heaven and the earth.",
+        "B": "In the beginning God created the heaven.",
+    }
+    assert corpus.get_verse_texts(1001002) == {
+        "A": "And the earth was without form, and void;",
+        "B": None,
+    }
+    assert corpus.get_reference_texts(
+        get_references("Genesis 1:1-2")[0], verse_separator="\n"
+    ) == {
+        "A": (
+            "In the beginning God created the heaven and the earth.\n"
+            "And the earth was without form, and void;"
+        ),
+        "B": "In the beginning God created the heaven.",
+    }
+
+
+def test_translation_corpus_views():
+    """Test that the view of a translation is a verse text map."""
+    verse_text_map = parse_xml_to_verse_text_map(XML)
+    corpus = TranslationCorpus.from_verse_text_maps({"A": verse_text_map})
+    view = corpus["A"]
+    assert corpus["A"] is view
+    assert dict(view) == verse_text_map
+    assert len(view) == len(verse_text_map)
+    assert 1001003 not in view
+    reference = get_references("Jude 3-4")[0]
+    assert convert_reference_to_verse_text(
+        reference, view
+    ) == convert_reference_to_verse_text(reference, verse_text_map)
+
+
+def test_error_if_translation_corpus_is_invalid():
+    """Test that texts of the wrong shape or duplicate names are rejected."""
+    with pytest.raises(ValueError, match="Expected texts of shape"):
+        TranslationCorpus(np.empty((3, 1), dtype=object), ["A"])
+    with pytest.raises(ValueError, match="must be unique"):
+        TranslationCorpus(np.empty((31102, 2), dtype=object), ["A", "A"])
+    with pytest.raises(KeyError):
+        TranslationCorpus.from_verse_text_maps({}).get_verse_texts(1)
@@ -1,10 +1,17 @@
 """Test utilities module."""
 
+import re
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from bibletools._utils import read_file_as_string
+from bibletools._utils import (
+    check_valid_verse_ids,
+    find_invalid_verse_ids,
+    open_file_as_binary,
+    read_file_as_string,
+)
 from tests.conftest import VERSE_TEXTS
 
 KJV_XML_URL = (
@@ -49,3 +56,50 @@ def test_error_if_file_not_found():
     if the specified file location does not exist."""
     with pytest.raises(FileNotFoundError, match="Unable to read file:"):
         read_file_as_string(file_location="non_existent_file.xml")
+
+
+def test_open_file_as_binary(tmp_path):
+    """Test that the open_file_as_binary function opens a file path or
+    package resource as a binary stream."""
+    file_path = tmp_path / "bible.xml"
+    file_path.write_bytes(b"<?xml")
+    with open_file_as_binary(str(file_path)) as f:
+        assert f.read() == b"<?xml"
+
+    with open_file_as_binary("verse-counts-by-author-and-id.bin") as f:
+        assert f.read(4) == b"BTVC"
+
+    with pytest.raises(FileNotFoundError, match="Unable to read file:"):
+        open_file_as_binary("non_existent_file.xml")
+
+
+@pytest.mark.parametrize(
+    "verse_ids",
+    [
+        [1001001, 99999999, 66022021, 0, 67001001],
+        np.array([1001001, 99999999, 66022021, 0, 67001001]),
+        np.array([1001001, 99999999, 66022021, 0, 67001001], dtype=np.uint32),
+    ],
+)
+def test_find_invalid_verse_ids(verse_ids):
+    """Test that find_invalid_verse_ids returns the positions of invalid verse
+    IDs in lists and arrays."""
+    assert find_invalid_verse_ids(verse_ids).tolist() == [1, 3]
+
+
+def test_find_invalid_verse_ids_without_integers():
+    """Test that find_invalid_verse_ids handles empty and non-integer
+    inputs."""
+    assert find_invalid_verse_ids([]).tolist() == []
+    assert find_invalid_verse_ids(["1001001", 1001001]).tolist() == [0]
+
+
+def test_check_valid_verse_ids_with_array():
+    """Test that check_valid_verse_ids returns valid arrays unchanged and
+    raises a ValueError listing the invalid verse IDs."""
+    verse_ids = np.array([1001001, 66022021])
+    assert check_valid_verse_ids(verse_ids) is verse_ids
+
+    msg = re.escape("Invalid verse ID(s): 99999999, 0.")
+    with pytest.raises(ValueError, match=msg):
+        check_valid_verse_ids(np.array([1001001, 99999999, 0]))
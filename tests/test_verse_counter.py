@@ -0,0 +1,99 @@
+"""Test verse counter module."""
+
+import pytest
+
+from bibletools._parse_references import parse_references
+from bibletools._verse_counter import VerseCounter, count_verses
+from bibletools._verse_counts import VerseCountStore
+
+RECORDS = [
+    ("John Piper", "note on John 3:16-17 and Romans 8:28"),
+    ("John MacArthur", "John 3:16"),
+    ("John Piper", "see Romans 8:28 ; 30"),
+    ("Jon Bloom", "no references here"),
+    ("John MacArthur", "Jude 3-4 and John 3:16"),
+]
+
+EXPECTED = {
+    "total": {
+        "total": 9,
+        "43003016": 3,
+        "45008028": 2,
+        "43003017": 1,
+        "45008030": 1,
+        "65001003": 1,
+        "65001004": 1,
+    },
+    "John Piper": {
+        "total": 5,
+        "45008028": 2,
+        "43003016": 1,
+        "43003017": 1,
+        "45008030": 1,
+    },
+    "John MacArthur": {
+        "total": 4,
+        "43003016": 2,
+        "65001003": 1,
+        "65001004": 1,
+    },
+    "Jon Bloom": {"total": 0},
+}
+
+
+def test_verse_counter(monkeypatch):
+    """Test that VerseCounter counts each verse of references by author,
+    including across compactions of buffered references."""
+    monkeypatch.setattr(
+        "bibletools._verse_counter._MAX_BUFFERED_REFERENCES", 2
+    )
+    counter = VerseCounter()
+    for author, text in RECORDS:
+        counter.add_references(author, parse_references(text))
+
+    assert counter.authors == ["John Piper", "John MacArthur", "Jon Bloom"]
+    verse_ids, counts = counter.get_counts("John Piper")
+    assert verse_ids.tolist() == [43003016, 43003017, 45008028, 45008030]
+    assert counts.tolist() == [1, 1, 2, 1]
+
+    verse_counts_by_author = counter.to_dict()
+    assert verse_counts_by_author == EXPECTED
+    assert list(verse_counts_by_author) == list(EXPECTED)
+    for author, counts in verse_counts_by_author.items():
+        assert list(counts) == list(EXPECTED[author])
+
+
+@pytest.mark.parametrize("file_name", ["counts.json", "counts.bin"])
+def test_verse_counter_write(tmp_path, file_name):
+    """Test that written verse counts can be read by VerseCountStore."""
+    counter = VerseCounter()
+    for author, text in RECORDS:
+        counter.add_references(author, parse_references(text))
+    counter.write(tmp_path / file_name)
+
+    store = VerseCountStore(tmp_path / file_name)
+    assert {author: dict(store[author]) for author in store} == EXPECTED
+
+
+def test_count_verses_resumes_from_checkpoint(tmp_path):
+    """Test that count_verses saves checkpoints and resumes from them
+    without counting records twice."""
+    checkpoint_path = tmp_path / "checkpoint.npz"
+    counter = count_verses(
+        RECORDS[:3], checkpoint_path=checkpoint_path, checkpoint_every=2
+    )
+    assert counter.n_records == 3
+    assert VerseCounter.load_checkpoint(checkpoint_path).to_dict() == (
+        counter.to_dict()
+    )
+
+    counter = count_verses(RECORDS, checkpoint_path=checkpoint_path)
+    assert counter.n_records == len(RECORDS)
+    assert counter.to_dict() == EXPECTED
+    assert count_verses(iter(RECORDS), n_workers=2).to_dict() == EXPECTED
+
+
+def test_error_if_verse_counter_author_is_total():
+    """Test that the reserved author name "total" is rejected."""
+    with pytest.raises(ValueError, match="reserved"):
+        VerseCounter().add_references("total", parse_references("John 3:16"))
@@ -0,0 +1,278 @@
+"""Test the verse counts module."""
+
+import importlib.resources
+import pathlib
+import stat
+import threading
+
+import pytest
+
+from bibletools._verse_counts import (
+    VerseCountStore,
+    get_verse_count_store,
+    write_verse_counts_binary,
+)
+
+
+def test_verse_count_store_is_loaded_once():
+    """Test that the verse count store returns the same per-author views
+    across calls without reloading."""
+    store = get_verse_count_store()
+    assert store is get_verse_count_store()
+    assert store["total"] is store["total"]
+    assert store.loaded
+
+
+def test_verse_count_store_views_are_read_only():
+    """Test that per-author verse counts cannot be modified."""
+    verse_counts = get_verse_count_store()["R.C. Sproul"]
+    with pytest.raises(TypeError):
+        verse_counts["23006003"] = 0  # type: ignore[index]
+
+
+def test_verse_count_store_invalidate_and_reload():
+    """Test that invalidating the store reloads the verse counts lazily and
+    that reloading replaces them immediately."""
+    store = VerseCountStore()
+    assert not store.loaded
+
+    verse_counts = store["R.C. Sproul"]
+    assert verse_counts["total"] == 114
+    assert "R.C. Sproul" in store
+    assert len(store) == len(list(store))
+
+    store.invalidate()
+    assert not store.loaded
+    assert store["R.C. Sproul"] is not verse_counts
+    assert store["R.C. Sproul"] == verse_counts
+
+    verse_counts = store["R.C. Sproul"]
+    store.reload()
+    assert store.loaded
+    assert store["R.C. Sproul"] is not verse_counts
+
+
+def test_binary_verse_counts_match_json():
+    """Test that the binary verse counts shipped with the package contain
+    the same counts as the JSON verse counts."""
+    binary_store = VerseCountStore("verse-counts-by-author-and-id.bin")
+    json_store = VerseCountStore("verse-counts-by-author-and-id.json")
+    assert list(binary_store) == list(json_store)
+    for author in ["total", "R.C. Sproul", "John Piper"]:
+        assert binary_store[author] == json_store[author]
+        assert [vid for vid in binary_store[author] if vid != "total"] == [
+            vid for vid in json_store[author] if vid != "total"
+        ]
+
+
+def test_write_verse_counts_binary(tmp_path):
+    """Test that verse counts written in the binary format are read back
+    unchanged from a file path."""
+    verse_counts_by_author = {
+        "total": {"total": 6, "43003016": 4, "1001001": 2},
+        "Author": {"43003016": 4, "total": 4},
+        "Autor Ñ": {"total": 2, "1001001": 2},
+    }
+    file_path = tmp_path / "verse-counts.bin"
+    write_verse_counts_binary(verse_counts_by_author, file_path)
+
+    store = VerseCountStore(file_path)
+    assert list(store) == list(verse_counts_by_author)
+    for author, counts in verse_counts_by_author.items():
+        assert store[author] == counts
+
+
+def test_error_if_binary_verse_counts_file_is_invalid(tmp_path):
+    """Test that a ValueError is raised for a file that is not in the binary
+    verse counts format."""
+    file_path = tmp_path / "verse-counts.bin"
+    file_path.write_bytes(bytes(32))
+    with pytest.raises(ValueError, match="Invalid binary verse counts file"):
+        VerseCountStore(file_path).reload()
+
+
+@pytest.mark.parametrize(
+    "file_location",
+    [
+        "verse-counts-by-author-and-id.bin",
+        "verse-counts-by-author-and-id.json",
+    ],
+)
+def test_verse_count_store_ranked_verses(file_location):
+    """Test that ranked verses are sorted by count and then verse ID, and are
+    cached until the store is reloaded."""
+    store = VerseCountStore(file_location)
+    ranked = store.ranked_verses("R.C. Sproul")
+    assert store.ranked_verses("R.C. Sproul") is ranked
+    assert ranked[:, 1].sum() == store["R.C. Sproul"]["total"]
+    assert sorted(ranked.tolist(), key=lambda row: (-row[1], row[0])) == (
+        ranked.tolist()
+    )
+
+    store.reload()
+    assert store.ranked_verses("R.C. Sproul") is not ranked
+
+
+@pytest.fixture(name="copy_data_file")
+def fixture_copy_data_file(tmp_path):
+    """Return a function that copies a data file to a temporary directory."""
+
+    def copy_data_file(file_name):
+        data = (
+            importlib.resources.files("bibletools.data")
+            .joinpath(file_name)
+            .read_bytes()
+        )
+        (tmp_path / file_name).write_bytes(data)
+        return tmp_path / file_name
+
+    return copy_data_file
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "verse-counts-by-author-and-id.bin",
+        "verse-counts-by-author-and-id.json",
+    ],
+)
+def test_verse_count_store_update(copy_data_file, file_name):
+    """Test that updating verse counts recomputes the totals and order of
+    changed authors and "total", and persists the update."""
+    file_path = copy_data_file(file_name)
+    file_path.chmod(0o644)
+    store = VerseCountStore(file_path)
+    sproul = dict(store["R.C. Sproul"])
+    total = dict(store["total"])
+    piper = store["John Piper"]
+
+    store.update(
+        {
+            "R.C. Sproul": {"23006003": 1000, 19023001: 2},
+            "New Author": {"43003016": 3},
+        }
+    )
+    assert store["John Piper"] is piper
+    assert store["R.C. Sproul"]["total"] == sproul["total"] + 1002
+    assert store["R.C. Sproul"]["23006003"] == sproul.get("23006003", 0) + 1000
+    assert list(store["R.C. Sproul"])[:2] == ["total", "23006003"]
+    assert store["New Author"] == {"total": 3, "43003016": 3}
+    assert store["total"]["total"] == total["total"] + 1005
+    assert store["total"]["43003016"] == total["43003016"] + 3
+    assert store.ranked_verses("R.C. Sproul")[0].tolist() == [
+        23006003,
+        1000 + sproul.get("23006003", 0),
+    ]
+
+    # Negative changes remove verses whose counts are no longer positive
+    store.update({"New Author": {"43003016": -5}})
+    assert store["New Author"] == {"total": 0}
+    assert store["total"]["43003016"] == total["43003016"]
+
+    # Authors are ordered by total count descending
+    totals = [store[author]["total"] for author in store]
+    assert totals == sorted(totals, reverse=True)
+
+    reloaded = VerseCountStore(file_path)
+    assert {author: dict(reloaded[author]) for author in reloaded} == {
+        author: dict(store[author]) for author in store
+    }
+    assert list(reloaded) == list(store)
+    assert stat.S_IMODE(file_path.stat().st_mode) == 0o644
+
+
+def test_verse_count_store_compact(copy_data_file):
+    """Test that compacting a binary data file applies and removes the log
+    of updates."""
+    file_path = copy_data_file("verse-counts-by-author-and-id.bin")
+    file_path.chmod(0o644)
+    store = VerseCountStore(file_path)
+    store.update({"R.C. Sproul": {"23006003": 1000}})
+    log_path = file_path.with_name(file_path.name + ".log")
+    assert log_path.is_file()
+
+    expected = {author: dict(store[author]) for author in store}
+    store.compact()
+    assert not log_path.is_file()
+    assert {author: dict(store[author]) for author in store} == expected
+    reloaded = VerseCountStore(file_path)
+    assert {author: dict(reloaded[author]) for author in reloaded} == expected
+    assert stat.S_IMODE(file_path.stat().st_mode) == 0o644
+
+
+def test_verse_count_store_compact_is_interrupted(copy_data_file, monkeypatch):
+    """Test that updates are not applied again if compacting fails after
+    the binary file is replaced but before the log is removed."""
+    file_path = copy_data_file("verse-counts-by-author-and-id.bin")
+    store = VerseCountStore(file_path)
+    store.update({"R.C. Sproul": {"23006003": 1000}})
+    log_path = file_path.with_name(file_path.name + ".log")
+    expected = {author: dict(store[author]) for author in store}
+
+    def fail_to_unlink(self, missing_ok=False):
+        raise OSError(f"Cannot remove {self}.")
+
+    with monkeypatch.context() as m:
+        m.setattr(pathlib.Path, "unlink", fail_to_unlink)
+        with pytest.raises(OSError, match="Cannot remove"):
+            store.compact()
+    assert log_path.is_file()
+    reloaded = VerseCountStore(file_path)
+    assert {author: dict(reloaded[author]) for author in reloaded} == expected
+
+    count = expected["R.C. Sproul"]["23006003"]
+    reloaded.update({"R.C. Sproul": {"23006003": 1}})
+    expected = {author: dict(reloaded[author]) for author in reloaded}
+    assert expected["R.C. Sproul"]["23006003"] == count + 1
+    reloaded.compact()
+    assert not log_path.is_file()
+    reloaded = VerseCountStore(file_path)
+    assert {author: dict(reloaded[author]) for author in reloaded} == expected
+
+
+def test_verse_count_store_updates_are_not_lost(copy_data_file):
+    """Test that updates of a binary file by separate stores are not lost
+    while another store compacts it."""
+    file_path = copy_data_file("verse-counts-by-author-and-id.bin")
+    count = VerseCountStore(file_path)["R.C. Sproul"].get("23006003", 0)
+
+    def update():
+        store = VerseCountStore(file_path)
+        for _ in range(20):
+            store.update({"R.C. Sproul": {"23006003": 1}})
+
+    def compact():
+        store = VerseCountStore(file_path)
+        for _ in range(5):
+            store.compact()
+
+    threads = [threading.Thread(target=target) for target in (update, compact)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    reloaded = VerseCountStore(file_path)
+    assert reloaded["R.C. Sproul"]["23006003"] == count + 20
+
+
+def test_error_if_verse_count_store_update_is_invalid(copy_data_file):
+    """Test that invalid updates are rejected without changing the data."""
+    store = VerseCountStore(
+        copy_data_file("verse-counts-by-author-and-id.bin")
+    )
+    with pytest.raises(ValueError, match="Total counts"):
+        store.update({"total": {"23006003": 1}})
+    with pytest.raises(ValueError, match="Invalid verse ID"):
+        store.update({"R.C. Sproul": {"99001001": 1}})
+    assert store["R.C. Sproul"]["total"] == 114
+
+
+def test_verse_count_store_rank_index():
+    """Test that the rank index maps verse IDs in ascending order to their
+    positions in the ranking."""
+    store = get_verse_count_store()
+    ranked = store.ranked_verses("R.C. Sproul")
+    verse_ids, ranks = store.rank_index("R.C. Sproul")
+    assert verse_ids.tolist() == sorted(ranked[:, 0].tolist())
+    assert ranked[ranks, 0].tolist() == verse_ids.tolist()
+    assert store.rank_index("R.C. Sproul")[0] is verse_ids
@@ -0,0 +1,119 @@
+"""Test the verse index module."""
+
+import pytest
+from pythonbible import (
+    Book,
+    NormalizedReference,
+    convert_reference_to_verse_ids,
+    get_references,
+)
+
+from bibletools._get_verses import get_all_verse_ids
+from bibletools._verse_index import (
+    get_book_offsets,
+    get_canonical_verse_ids,
+    get_chapter_offsets,
+    get_reference_ordinals,
+    get_verse_id_array,
+    get_verse_ordinals,
+)
+
+
+def test_canonical_verse_ids_are_cached_and_immutable():
+    """Test that the canonical verse IDs are computed once and cannot be
+    modified."""
+    verse_ids = get_canonical_verse_ids()
+    assert verse_ids is get_canonical_verse_ids()
+    assert isinstance(verse_ids, tuple)
+    assert len(verse_ids) == 31102
+    assert list(verse_ids) == get_all_verse_ids()
+    assert get_verse_id_array().tolist() == list(verse_ids)
+
+    with pytest.raises(ValueError):
+        get_verse_id_array()[0] = 0
+
+
+def test_get_verse_ordinals():
+    """Test that verse ordinals are the positions of verse IDs in the
+    canonical order."""
+    verse_ids = get_canonical_verse_ids()
+    ordinals = get_verse_ordinals()
+    assert len(ordinals) == len(verse_ids)
+    assert ordinals[1001001] == 0
+    assert ordinals[66022021] == len(verse_ids) - 1
+    assert verse_ids[ordinals[43003016]] == 43003016
+
+
+@pytest.mark.parametrize(
+    "book, chapter, reference",
+    [
+        (Book.GENESIS, 1, "Genesis 1"),
+        (Book.PSALMS, 119, "Psalm 119"),
+        (Book.JUDE, 1, "Jude"),
+        (Book.REVELATION, 22, "Revelation 22"),
+    ],
+)
+def test_get_chapter_offsets(book, chapter, reference):
+    """Test that chapter offsets slice the verse IDs of a chapter."""
+    start, stop = get_chapter_offsets()[(book, chapter)]
+    assert get_canonical_verse_ids()[start:stop] == tuple(
+        convert_reference_to_verse_ids(get_references(reference)[0])
+    )
+
+
+def test_get_book_offsets():
+    """Test that book offsets slice the verse IDs of a book."""
+    book_offsets = get_book_offsets()
+    assert len(book_offsets) == 66
+    start, stop = book_offsets[Book.ROMANS]
+    assert get_canonical_verse_ids()[start:stop] == tuple(
+        convert_reference_to_verse_ids(get_references("Romans")[0])
+    )
+    assert book_offsets[Book.GENESIS][0] == 0
+    assert book_offsets[Book.REVELATION][1] == 31102
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Jude 3-4",
+        "Psalm 23",
+        "Romans",
+        "Genesis 1-11",
+        "Genesis 17:26-18:2",
+        "Job 1:6, 12, 21-22; 2:6-7",
+    ],
+)
+def test_get_reference_ordinals(text):
+    """Test that reference ordinals slice the verse IDs of a reference."""
+    for reference in get_references(text):
+        start, stop = get_reference_ordinals(reference)
+        assert get_canonical_verse_ids()[start:stop] == tuple(
+            convert_reference_to_verse_ids(reference)
+        )
+
+
+def test_get_reference_ordinals_across_books():
+    """Test that reference ordinals span references across books."""
+    start, stop = get_reference_ordinals(
+        NormalizedReference(
+            book=Book.MALACHI,
+            start_chapter=4,
+            start_verse=6,
+            end_chapter=1,
+            end_verse=1,
+            end_book=Book.MATTHEW,
+        )
+    )
+    assert get_canonical_verse_ids()[start:stop] == (39004006, 40001001)
+
+
+def test_error_if_get_reference_ordinals_with_invalid_reference():
+    """Test that a ValueError is raised for a reference to verses that do
+    not exist."""
+    with pytest.raises(ValueError, match="Invalid reference"):
+        get_reference_ordinals(
+            NormalizedReference(
+                book=Book.GENESIS, start_chapter=1, start_verse=99
+            )
+        )
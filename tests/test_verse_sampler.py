@@ -0,0 +1,256 @@
+"""Test the verse sampler module."""
+
+import re
+
+import numpy as np
+import pytest
+from pythonbible import get_references
+
+from bibletools._get_verses import get_random_verse_ids
+from bibletools._verse_sampler import (
+    RandomVerseGenerator,
+    VerseSampler,
+    _get_cached_sampler,
+)
+from bibletools._verse_weights import VerseWeights
+
+
+@pytest.mark.parametrize(
+    "verse_weights",
+    [{"20016033": 7}, VerseWeights.from_mapping({"20016033": 7})],
+)
+def test_verse_sampler_sample(verse_weights):
+    """Test that VerseSampler.sample() returns the expected proportion for a
+    verse ID with mapping or array weights."""
+    verse_ids = [20016033, 19119071]
+    sampler = VerseSampler(
+        verse_ids=verse_ids, verse_weights=verse_weights, pad_weight=1
+    )
+    assert len(sampler) == 2
+    assert sampler.total_weight == 9
+
+    random_verse_ids = sampler.sample(10000)
+    actual_proportion = np.mean(np.array(random_verse_ids) == 20016033)
+    assert np.isclose(actual_proportion, 8 / 9, atol=0.015)
+    assert sampler.sample_one() in verse_ids
+
+
+def test_verse_sampler_from_all_verses():
+    """Test that VerseSampler draws from all verse IDs by default and only
+    draws verses with positive weights."""
+    sampler = VerseSampler(
+        verse_weights={"total": 3, "43003016": 1, "45008028": 2},
+        pad_weight=0,
+    )
+    assert len(sampler) == 31102
+    assert set(sampler.sample(100)) <= {43003016, 45008028}
+
+
+def test_error_if_verse_sampler_with_invalid_verse_id_or_weights():
+    """Test that VerseSampler raises a ValueError for invalid verse IDs or a
+    non-positive total weight."""
+    with pytest.raises(ValueError, match=re.escape("Invalid verse ID(s):")):
+        VerseSampler(verse_ids=[20016033, 99999999])
+
+    with pytest.raises(ValueError, match="Total of weights"):
+        VerseSampler(verse_ids=[20016033], pad_weight=0)
+
+
+def test_get_random_verse_ids_reuses_sampler():
+    """Test that get_random_verse_ids() reuses a cached sampler for the same
+    VerseWeights when choosing from all verse IDs."""
+    verse_weights = VerseWeights.from_mapping({"43003016": 1})
+    _get_cached_sampler.cache_clear()
+
+    for _ in range(3):
+        random_verse_ids = get_random_verse_ids(
+            n_verses=5, verse_weights=verse_weights, pad_weight=0
+        )
+        assert random_verse_ids == [43003016] * 5
+
+    # pylint: disable-next=no-value-for-parameter
+    cache_info = _get_cached_sampler.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1)
+
+
+def test_verse_sampler_sample_references():
+    """Test that VerseSampler.sample() only draws verses in references in
+    proportion to their weights."""
+    sampler = VerseSampler(
+        verse_weights={"45001001": 2, "45001002": 1, "46001001": 1},
+        pad_weight=0,
+    )
+    references = get_references("Romans 1; 1 Corinthians 1:1-3; Romans 1:1")
+    random_verse_ids = sampler.sample(10000, references=references)
+    assert set(random_verse_ids) == {45001001, 45001002, 46001001}
+    actual_proportion = np.mean(np.array(random_verse_ids) == 45001001)
+    assert np.isclose(actual_proportion, 2 / 4, atol=0.015)
+    assert (
+        sampler.sample_one(references=get_references("1 Corinthians 1"))
+        == 46001001
+    )
+
+
+def test_verse_sampler_sample_references_with_pad_weight():
+    """Test that VerseSampler.sample() draws all verses of references with a
+    pad weight."""
+    sampler = VerseSampler(pad_weight=1)
+    references = get_references("Psalms 1-50")
+    random_verse_ids = sampler.sample(5000, references=references)
+    assert min(random_verse_ids) >= 19001001
+    assert max(random_verse_ids) <= 19050023
+    assert len(set(random_verse_ids)) > 700  # Of 752 verses
+
+
+def test_error_if_verse_sampler_sample_invalid_references():
+    """Test that VerseSampler.sample() raises a ValueError for references
+    without weights or a sampler of other verse IDs."""
+    sampler = VerseSampler(verse_weights={"45001001": 1}, pad_weight=0)
+    with pytest.raises(ValueError, match="Total of weights"):
+        sampler.sample(references=get_references("Genesis 1"))
+
+    with pytest.raises(ValueError, match="Total of weights"):
+        sampler.sample(references=[])
+
+    sampler = VerseSampler(verse_ids=[45001001, 45001002])
+    with pytest.raises(ValueError, match="References can only restrict"):
+        sampler.sample(references=get_references("Romans 1"))
+
+
+@pytest.mark.parametrize(
+    "verse_weights",
+    [{"20016033": 7}, VerseWeights.from_mapping({"20016033": 7})],
+)
+def test_random_verse_generator_sample(verse_weights):
+    """Test that RandomVerseGenerator.sample() returns the expected
+    proportion for a verse ID with mapping or array weights."""
+    verse_ids = [20016033, 19119071]
+    generator = RandomVerseGenerator(
+        verse_ids=verse_ids, verse_weights=verse_weights, seed=0
+    )
+    assert len(generator) == 2
+    assert generator.total_weight == 9
+
+    random_verse_ids = generator.sample(10000)
+    assert random_verse_ids.shape == (10000,)
+    actual_proportion = np.mean(random_verse_ids == 20016033)
+    assert np.isclose(actual_proportion, 8 / 9, atol=0.015)
+    assert generator.sample_one() in verse_ids
+
+
+def test_random_verse_generator_is_reproducible():
+    """Test that generators with the same seed draw the same verse IDs, and
+    that spawned generators draw independent verse IDs."""
+    draws = [
+        RandomVerseGenerator(seed=42).sample(100, replace=replace)
+        for replace in (True, False, True, False)
+    ]
+    np.testing.assert_array_equal(draws[0], draws[2])
+    np.testing.assert_array_equal(draws[1], draws[3])
+
+    generator = RandomVerseGenerator(seed=42)
+    spawned = generator.spawn(2)
+    spawned_draws = [child.sample(100) for child in spawned]
+    assert not np.array_equal(spawned_draws[0], spawned_draws[1])
+    assert not np.array_equal(spawned_draws[0], draws[0])
+    np.testing.assert_array_equal(
+        RandomVerseGenerator(seed=42).spawn(2)[1].sample(100),
+        spawned_draws[1],
+    )
+
+
+def test_random_verse_generator_sample_without_replacement():
+    """Test that RandomVerseGenerator.sample() draws distinct verse IDs with
+    positive weights in proportion to their weights."""
+    generator = RandomVerseGenerator(
+        verse_weights={"43003016": 1000, "45008028": 1, "19023001": 1},
+        pad_weight=0,
+        seed=0,
+    )
+    first_verse_ids = [
+        generator.sample(3, replace=False).tolist() for _ in range(1000)
+    ]
+    assert all(
+        sorted(verse_ids) == [19023001, 43003016, 45008028]
+        for verse_ids in first_verse_ids
+    )
+    actual_proportion = np.mean(
+        [verse_ids[0] == 43003016 for verse_ids in first_verse_ids]
+    )
+    assert actual_proportion > 0.99
+
+    generator = RandomVerseGenerator(seed=0)
+    random_verse_ids = generator.sample(5000, replace=False)
+    assert len(np.unique(random_verse_ids)) == 5000
+    assert not generator.sample(0, replace=False).size
+
+
+def test_random_verse_generator_sample_duplicates_without_replacement():
+    """Test that RandomVerseGenerator.sample() adds the weights of duplicate
+    verse IDs and draws them only once without replacement."""
+    generator = RandomVerseGenerator(
+        verse_ids=[1001001, 1001001, 1001002], seed=0
+    )
+    first_verse_ids = []
+    for _ in range(3000):
+        random_verse_ids = generator.sample(2, replace=False).tolist()
+        assert sorted(random_verse_ids) == [1001001, 1001002]
+        first_verse_ids.append(random_verse_ids[0])
+    actual_proportion = np.mean(np.array(first_verse_ids) == 1001001)
+    assert np.isclose(actual_proportion, 2 / 3, atol=0.03)
+
+    with pytest.raises(ValueError, match="Cannot draw 3 distinct verse IDs"):
+        generator.sample(3, replace=False)
+
+
+def test_random_verse_generator_sample_references():
+    """Test that RandomVerseGenerator.sample() only draws verses in
+    references, with or without replacement."""
+    generator = RandomVerseGenerator(
+        verse_weights={"45001001": 2, "45001002": 1, "46001001": 1},
+        pad_weight=0,
+        seed=0,
+    )
+    references = get_references("Romans 1; 1 Corinthians 1:1-3")
+    random_verse_ids = generator.sample(10000, references=references)
+    actual_proportion = np.mean(random_verse_ids == 45001001)
+    assert np.isclose(actual_proportion, 2 / 4, atol=0.015)
+    assert sorted(
+        generator.sample(3, replace=False, references=references)
+    ) == [45001001, 45001002, 46001001]
+    assert (
+        generator.sample_one(references=get_references("1 Corinthians 1"))
+        == 46001001
+    )
+
+
+def test_error_if_random_verse_generator_sample_invalid():
+    """Test that RandomVerseGenerator.sample() raises a ValueError for too
+    many distinct verse IDs or references of other verse IDs."""
+    generator = RandomVerseGenerator(
+        verse_weights={"45001001": 1, "45001002": 1}, pad_weight=0
+    )
+    with pytest.raises(ValueError, match="Cannot draw 3 distinct verse IDs"):
+        generator.sample(3, replace=False)
+
+    with pytest.raises(ValueError, match="Total of weights"):
+        generator.sample(references=get_references("Genesis 1"))
+
+    generator = RandomVerseGenerator(verse_ids=[45001001, 45001002])
+    with pytest.raises(ValueError, match="References can only restrict"):
+        generator.sample(references=get_references("Romans 1"))
+
+
+def test_verse_sampler_sample_without_replacement():
+    """Test that VerseSampler.sample() draws distinct verse IDs from all
+    verses or from references without replacement."""
+    sampler = VerseSampler(verse_weights={"45008028": 1000}, pad_weight=1)
+    random_verse_ids = sampler.sample(5000, replace=False)
+    assert len(set(random_verse_ids)) == 5000
+
+    references = get_references("Romans 8")
+    random_verse_ids = sampler.sample(39, references=references, replace=False)
+    assert sorted(random_verse_ids) == list(range(45008001, 45008040))
+
+    with pytest.raises(ValueError, match="Cannot draw 40 distinct verse IDs"):
+        sampler.sample(40, references=references, replace=False)
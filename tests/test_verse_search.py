@@ -0,0 +1,186 @@
+"""Test verse search module."""
+
+import numpy as np
+import pytest
+
+from bibletools import _verse_search
+from bibletools._verse_index import get_canonical_verse_ids
+from bibletools._verse_search import VerseSearchIndex, tokenize
+
+VERSE_TEXTS = {
+    1001001: "In the beginning God created the heaven and the earth.",
+    1001002: "And the earth was without form, and void;",
+    1001003: "And God said, Let there be light: and there was light.",
+    43001001: "In the beginning was the Word, and the Word was with God.",
+    43003016: "For God so loved the world, that he gave his only Son.",
+    45001001: "Paul, a servant of Jesus Christ, called to be an apostle.",
+}
+
+
+@pytest.fixture(scope="module", name="index")
+def fixture_index():
+    """Return an index of a few verse texts."""
+    return VerseSearchIndex.from_verse_text_map(VERSE_TEXTS)
+
+
+def test_tokenize():
+    """Test that texts are split into lowercase words."""
+    assert tokenize("Let there be LIGHT: and there was light.") == [
+        "let",
+        "there",
+        "be",
+        "light",
+        "and",
+        "there",
+        "was",
+        "light",
+    ]
+    assert tokenize("the LORD\u2019s house, isn't it") == [
+        "the",
+        "lord\u2019s",
+        "house",
+        "isn't",
+        "it",
+    ]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("light", [1001003]),
+        ("LIGHT", [1001003]),
+        ("god", [1001001, 1001003, 43001001, 43003016]),
+        ("god beginning", [1001001, 43001001]),
+        ("god missing", []),
+        ('"the beginning"', [1001001, 43001001]),
+        ('"the earth"', [1001001, 1001002]),
+        ('"beginning god"', [1001001]),
+        ('"god the"', []),
+        ('"the beginning" heaven', [1001001]),
+        ("wor*", [43001001, 43003016]),
+        ("zzz*", []),
+        ("god zzz*", []),
+        ("", []),
+        ("...", []),
+    ],
+)
+def test_search(index, query, expected):
+    """Test that verses matching all words and phrases are ranked."""
+    assert index.search(query) == expected
+
+
+def test_search_phrases_stay_in_verses(index):
+    """Test that phrases do not match across consecutive verses."""
+    assert not index.search('"earth and"')
+    assert index.search('"earth was"') == [1001002]
+
+
+def test_search_prefix_last(index):
+    """Test that the last word can be matched as a prefix."""
+    assert not index.search("god lov")
+    assert index.search("god lov", prefix_last=True) == [43003016]
+    assert index.search("lov god", prefix_last=True) == []
+    assert index.search("the zz", prefix_last=True) == []
+    assert index.search('"so loved"', prefix_last=True) == [43003016]
+
+
+def test_search_max_expansions(index):
+    """Test that prefixes only match the words in the most verses."""
+    assert index.search("th*", limit=None) == [
+        1001003,
+        43003016,
+        1001001,
+        43001001,
+        1001002,
+    ]
+    # "the" is in more verses than "there" and "that"
+    assert index.search("th*", limit=None, max_expansions=1) == index.search(
+        "the", limit=None
+    )
+
+
+def test_search_precomputed_prefixes(index, monkeypatch, tmp_path):
+    """Test that precomputed matches of prefixes give the same results and
+    are saved with the index."""
+    monkeypatch.setattr(_verse_search, "_MIN_PRECOMPUTED_OCCURRENCES", 1)
+    precomputed = VerseSearchIndex.from_verse_text_map(VERSE_TEXTS)
+    file_path = tmp_path / "index.npz"
+    precomputed.save(file_path)
+    with np.load(file_path) as data:
+        assert {"t", "th", "the"} <= set(data["prefixes"])
+
+    loaded = VerseSearchIndex.load(file_path)
+    for query in ("t", "th", "god th", "th god", "wor", "zz"):
+        expected = index.search(query, limit=None, prefix_last=True)
+        assert precomputed.search(query, limit=None, prefix_last=True) == (
+            expected
+        )
+        assert loaded.search(query, limit=None, prefix_last=True) == expected
+    assert precomputed.search(
+        "th*", limit=None, max_expansions=1
+    ) == index.search("the", limit=None)
+
+
+def test_search_many_matches():
+    """Test that clauses matching many verses are intersected."""
+    verse_ids = list(get_canonical_verse_ids())
+    index = VerseSearchIndex.from_verse_text_map(
+        {vid: f"word{i % 3} and" for i, vid in enumerate(verse_ids)}
+    )
+    assert index.search("and word1", limit=None) == verse_ids[1::3]
+    assert index.search("word2 an", limit=5, prefix_last=True) == (
+        verse_ids[2::3][:5]
+    )
+
+
+def test_search_limit(index):
+    """Test that ties in the top verses are broken in canonical order."""
+    verse_ids = index.search("the", limit=None)
+    assert verse_ids == [1001001, 43001001, 1001002, 43003016]
+    for limit in range(5):
+        assert index.search("the", limit=limit) == verse_ids[:limit]
+
+
+def test_search_all_verses(verse_text_map):
+    """Test searching the verse texts of a whole Bible."""
+    index = VerseSearchIndex.from_verse_text_map(verse_text_map)
+    verse_ids = index.search('"only begotten son"', limit=None)
+    assert 43003016 in verse_ids
+    assert all(
+        "only begotten son" in " ".join(tokenize(verse_text_map[vid]))
+        for vid in verse_ids
+    )
+    assert 43011035 in index.search("jesus wept", limit=None)
+
+
+@pytest.mark.parametrize(
+    "verse_text_map", [{}, {99999999: "Unknown verse"}, {1001001: "..."}]
+)
+def test_search_empty_index(verse_text_map, tmp_path):
+    """Test that an index without words can be searched and saved."""
+    index = VerseSearchIndex.from_verse_text_map(verse_text_map)
+    assert len(index) == 0
+    for query in ("god", "god*", '"the beginning"'):
+        assert index.search(query) == []
+
+    file_path = tmp_path / "index.npz"
+    index.save(file_path)
+    assert VerseSearchIndex.load(file_path).search("god*") == []
+
+
+def test_save_and_load(index, tmp_path):
+    """Test that a saved index gives the same results."""
+    file_path = tmp_path / "index.npz"
+    index.save(file_path)
+    loaded = VerseSearchIndex.load(file_path)
+    assert len(loaded) == len(index)
+    for query in ("god", '"the beginning"', "wor*"):
+        assert loaded.search(query) == index.search(query)
+
+
+def test_load_invalid(tmp_path):
+    """Test that loading a file that is not an index fails."""
+    file_path = tmp_path / "index.npz"
+    np.savez(file_path, version=0)
+    with pytest.raises(ValueError, match="Invalid verse search index"):
+        VerseSearchIndex.load(file_path)
@@ -1,13 +1,26 @@
 """Test load Bible module."""
 
+import io
+
 import pytest
 from pythonbible import Book, convert_references_to_verse_ids, get_references
 
 from bibletools._verse_text_map import (
     _get_book_from_text,
+    _resolve_book,
     convert_reference_to_verse_text,
+    convert_references_to_verse_texts,
+    iter_references_verse_texts,
+    iter_xml_verse_texts,
+    parse_xml_to_verse_text_map,
+)
+from bibletools._verse_text_store import VerseTextStore
+from tests.conftest import (
+    TESTAMENT_SPECS,
+    TESTAMENT_XML,
+    VERSE_TEXTS,
+    XML,
 )
-from tests.conftest import VERSE_TEXTS
 
 
 def test_get_book_from_text():
@@ -37,6 +50,20 @@ def test_get_book_from_text():
         _get_book_from_text("Unknown book")
 
 
+def test_get_book_from_text_is_memoized():
+    """Test that _get_book_from_text() resolves each distinct book name once
+    and reuses the result, including for regex matches and unknown books."""
+    _resolve_book.cache_clear()
+    for _ in range(3):
+        assert _get_book_from_text(" Genesis ") == Book.GENESIS
+        assert _get_book_from_text("the book of Leviticus") == Book.LEVITICUS
+        with pytest.raises(ValueError, match="Unknown Bible book:"):
+            _get_book_from_text("Unknown book")
+
+    cache_info = _resolve_book.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (6, 3)
+
+
 def test_verse_text_map_has_all_verses(verse_text_map):
     """Test that the parse_xml_to_verse_text_map function correctly
     converts a Bible XML string to a dictionary with all verses."""
@@ -87,3 +114,104 @@ def test_convert_reference_to_verse_text_with_multiple_verses(verse_text_map):
         "Surely goodness and mercy shall follow me all the days of my life: "
         "and I will dwell in the house of the LORD for ever."
     )
+
+
+def test_iter_xml_verse_texts_from_file(tmp_path):
+    """Test that iter_xml_verse_texts streams the same verse texts from a file
+    path as parse_xml_to_verse_text_map parses from a string."""
+    file_path = tmp_path / "bible.xml"
+    file_path.write_text(XML, encoding="utf-8")
+
+    verse_texts = list(iter_xml_verse_texts(str(file_path)))
+    assert verse_texts == list(parse_xml_to_verse_text_map(xml=XML).items())
+    assert verse_texts[1] == (
+        1001002,
+        "And the earth was without form, and void;",
+    )
+    assert verse_texts[-1] == (65001004, "")
+
+
+def test_iter_xml_verse_texts_from_stream_with_testaments():
+    """Test that iter_xml_verse_texts streams verse texts from a binary
+    stream with testament elements and custom specs."""
+    verse_texts = dict(
+        iter_xml_verse_texts(
+            io.BytesIO(TESTAMENT_XML.encode("utf-8")), **TESTAMENT_SPECS
+        )
+    )
+    assert verse_texts == parse_xml_to_verse_text_map(
+        xml=TESTAMENT_XML, **TESTAMENT_SPECS
+    )
+    assert verse_texts == {
+        1001001: "In the beginning God created the heaven.",
+        65001003: "Beloved,",
+    }
+
+
+def test_error_if_iter_xml_verse_texts_with_unsupported_path():
+    """Test that iter_xml_verse_texts raises a ValueError for paths that
+    cannot be matched while streaming."""
+    with pytest.raises(ValueError, match="Unsupported path"):
+        list(
+            iter_xml_verse_texts(
+                io.BytesIO(XML.encode("utf-8")), book_spec=(".//b", "n")
+            )
+        )
+
+
+BATCH_REFERENCES = [
+    "Psalm 23",
+    "Psalm 23:1-3",
+    "Genesis 1-2",
+    "Psalm 23",
+    "Genesis 2:1-3:4",
+    "Jude",
+]
+
+
+@pytest.mark.parametrize("use_store", [False, True])
+@pytest.mark.parametrize("verse_separator", [" ", "\n"])
+def test_convert_references_to_verse_texts(
+    placeholder_verse_text_map, use_store, verse_separator
+):
+    """Test that convert_references_to_verse_texts has the same result as
+    converting each reference, including overlapping and repeated ones."""
+    references = [get_references(text)[0] for text in BATCH_REFERENCES]
+    verse_text_map = (
+        VerseTextStore.from_mapping(placeholder_verse_text_map)
+        if use_store
+        else placeholder_verse_text_map
+    )
+    expected = [
+        convert_reference_to_verse_text(
+            reference, placeholder_verse_text_map, verse_separator
+        )
+        for reference in references
+    ]
+    assert (
+        convert_references_to_verse_texts(
+            references, verse_text_map, verse_separator
+        )
+        == expected
+    )
+    assert (
+        list(
+            iter_references_verse_texts(
+                iter(references), verse_text_map, verse_separator
+            )
+        )
+        == expected
+    )
+
+
+def test_convert_references_to_verse_texts_with_missing_verse(
+    placeholder_verse_text_map,
+):
+    """Test that a missing verse raises a KeyError as for one reference."""
+    verse_text_map = dict(placeholder_verse_text_map)
+    del verse_text_map[19023003]
+    references = get_references("Psalm 23")
+    with pytest.raises(KeyError, match="19023003"):
+        convert_references_to_verse_texts(references, verse_text_map)
+    with pytest.raises(KeyError, match="19023003"):
+        list(iter_references_verse_texts(references, verse_text_map))
@@ -0,0 +1,129 @@
+"""Test the verse text store module."""
+
+import pytest
+from pythonbible import convert_reference_to_verse_ids, get_references
+
+from bibletools._verse_text_map import convert_reference_to_verse_text
+from bibletools._verse_text_store import (
+    VerseTextStore,
+    load_verse_text_store,
+    write_verse_text_store,
+)
+
+VERSE_TEXT_MAP = {
+    19023002: (
+        "He maketh me to lie down in green pastures: "
+        "he leadeth me beside the still waters."
+    ),
+    19023001: "The LORD is my shepherd; I shall not want.",
+    43011035: "Jesus wept.",
+    43011036: "",
+    1001001: "Au commencement, Dieu créa les cieux et la terre.",
+}
+
+
+def test_write_and_load_verse_text_store(tmp_path):
+    """Test that verse texts written to a file are loaded back as a mapping
+    with verse IDs in canonical order."""
+    file_path = tmp_path / "KJV.bin"
+    write_verse_text_store(VERSE_TEXT_MAP, file_path)
+    verse_text_store = load_verse_text_store(str(file_path))
+
+    assert len(verse_text_store) == len(VERSE_TEXT_MAP)
+    assert list(verse_text_store) == sorted(VERSE_TEXT_MAP)
+    assert dict(verse_text_store) == VERSE_TEXT_MAP
+    assert verse_text_store.verse_ids.tolist() == sorted(VERSE_TEXT_MAP)
+
+
+def test_verse_text_store_lookups():
+    """Test lookups of present and missing verse IDs in a store created in
+    memory from pairs of verse IDs and texts."""
+    verse_text_store = VerseTextStore.from_mapping(VERSE_TEXT_MAP.items())
+    assert verse_text_store[43011035] == "Jesus wept."
+    assert verse_text_store[43011036] == ""
+    assert 43011035 in verse_text_store
+    assert 43011037 not in verse_text_store
+    assert "43011035" not in verse_text_store
+    assert verse_text_store.get(66022021) is None
+    with pytest.raises(KeyError):
+        verse_text_store[99999999]  # pylint: disable=pointless-statement
+
+
+def test_verse_text_store_locate_and_join():
+    """Test that ranges of verse IDs are located as positions and joined
+    with the default or a custom separator."""
+    verse_text_store = VerseTextStore.from_mapping(VERSE_TEXT_MAP)
+    assert verse_text_store.locate(19023001, 19023002) == (1, 3)
+    assert verse_text_store.locate(-1, 2**40) == (0, 5)
+    assert verse_text_store.join(1, 3) == (
+        f"{VERSE_TEXT_MAP[19023001]} {VERSE_TEXT_MAP[19023002]}"
+    )
+    assert verse_text_store.join(3, 5, verse_separator="|") == "Jesus wept.|"
+    assert not verse_text_store.join(3, 3)
+
+
+def test_convert_reference_to_verse_text_with_verse_text_store():
+    """Test that convert_reference_to_verse_text accepts a store in place of
+    a verse text map."""
+    verse_text_store = VerseTextStore.from_mapping(VERSE_TEXT_MAP)
+    assert convert_reference_to_verse_text(
+        get_references("Psalm 23:1-2")[0], verse_text_store
+    ) == convert_reference_to_verse_text(
+        get_references("Psalm 23:1-2")[0], VERSE_TEXT_MAP
+    )
+
+
+def test_error_if_verse_text_store_is_invalid():
+    """Test that a ValueError is raised for invalid or duplicate input."""
+    with pytest.raises(ValueError, match="Invalid binary verse text file"):
+        VerseTextStore(bytes(24))
+
+    with pytest.raises(ValueError, match="Verse IDs must be unique"):
+        VerseTextStore.from_mapping([(1001001, "a"), (1001001, "b")])
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Psalm 119",
+        "Genesis 1-11",
+        "Malachi 4:5-6",
+        "Jude 3-4",
+        "Revelation 22:21",
+        "Romans",
+    ],
+)
+@pytest.mark.parametrize("verse_separator", [" ", "\n"])
+def test_convert_reference_to_verse_text_with_range_slicing(
+    placeholder_verse_text_map, text, verse_separator
+):
+    """Test that convert_reference_to_verse_text reads contiguous references
+    from a store in one slice with the same result as from a dict."""
+    verse_text_map = placeholder_verse_text_map
+    verse_text_store = VerseTextStore.from_mapping(verse_text_map)
+    reference = get_references(text)[0]
+    verse_text = convert_reference_to_verse_text(
+        reference, verse_text_store, verse_separator=verse_separator
+    )
+    assert verse_text == convert_reference_to_verse_text(
+        reference, verse_text_map, verse_separator=verse_separator
+    )
+    assert verse_text.count(verse_separator) == (
+        len(convert_reference_to_verse_ids(reference)) - 1
+    )
+
+
+def test_error_if_convert_reference_to_verse_text_with_missing_verse(
+    placeholder_verse_text_map,
+):
+    """Test that convert_reference_to_verse_text raises a KeyError for a
+    store that is missing a verse of the reference, like a dict does."""
+    verse_text_store = VerseTextStore.from_mapping(
+        (vid, text)
+        for vid, text in placeholder_verse_text_map.items()
+        if vid != 19023003
+    )
+    with pytest.raises(KeyError, match="19023003"):
+        convert_reference_to_verse_text(
+            get_references("Psalm 23")[0], verse_text_store
+        )
@@ -0,0 +1,50 @@
+"""Test the verse weights module."""
+
+import numpy as np
+import pytest
+
+from bibletools._get_verses import get_all_verse_ids, load_verse_counts
+from bibletools._verse_weights import VerseWeights
+
+
+def test_verse_weights_from_mapping():
+    """Test that VerseWeights.from_mapping() aligns string-keyed weights to
+    the canonical verse ID order and ignores non-verse keys."""
+    verse_weights = VerseWeights.from_mapping(
+        {"total": 12, "1001001": 5, "66022021": 7, "99999999": 3}
+    )
+    assert len(verse_weights) == 31102
+    assert verse_weights.array[0] == 5
+    assert verse_weights.array[-1] == 7
+    assert verse_weights.array.sum() == 12
+    assert verse_weights.get(66022021) == 7
+    assert verse_weights.get(99999999) == 0
+    assert verse_weights.take([1001001, 99999999, 66022021]).tolist() == [
+        5,
+        0,
+        7,
+    ]
+    np.testing.assert_array_equal(verse_weights.verse_ids, get_all_verse_ids())
+
+
+def test_verse_weights_from_verse_counts():
+    """Test that VerseWeights.from_verse_counts() matches the verse counts of
+    an author."""
+    verse_counts = load_verse_counts("R.C. Sproul")
+    verse_weights = VerseWeights.from_verse_counts("R.C. Sproul")
+    assert verse_weights.array.sum() == verse_counts["total"]
+    assert verse_weights.get(23006003) == verse_counts["23006003"]
+
+
+def test_verse_weights_are_read_only():
+    """Test that the weights array cannot be modified."""
+    verse_weights = VerseWeights(np.ones(31102))
+    with pytest.raises(ValueError):
+        verse_weights.array[0] = 0
+
+
+def test_error_if_verse_weights_have_wrong_length():
+    """Test that a ValueError is raised if the number of weights does not
+    match the number of verses."""
+    with pytest.raises(ValueError, match="Expected 31102 weights"):
+        VerseWeights([1, 2, 3])